@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+from tixcraft_payload_archive import PayloadArchive
+
+
+DEFAULT_SOURCE = Path("tixcraft_activities.json")
+DEFAULT_CORPUS = Path("benchmarks/corpus.jsonl")
+SYNTHETIC_LINE_COUNTS = (200, 1000, 3000)
+LABEL_STYLES = (
+    {"event_time": "演出時間：", "venue": "演出地點：", "address": "演出地址：", "sale": "售票時間：", "price": "票價："},
+    {"event_time": "■ 活動日期｜", "venue": "■ 活動地點｜", "address": "■ 地址｜", "sale": "■ 售票資訊", "price": "■ 票價"},
+    {"event_time": "Date: ", "venue": "Venue: ", "address": "Address: ", "sale": "Ticket Sales Schedule", "price": "Ticket Price: "},
+)
+NOTICE_LINES = (
+    "＊以上票價需另加系統服務費",
+    "購票前請詳讀注意事項，主辦保留活動異動之權利。",
+    "更多資訊請至官方網站 https://tixcraft.com/",
+)
+
+
+def _split_values(value: str | None) -> list[str]:
+    return [part.strip() for part in (value or "").split(" / ") if part.strip()]
+
+
+def build_intro(record: dict[str, Any], style: dict[str, str]) -> str:
+    lines: list[str] = ["【活動資訊】"]
+    if record.get("artist_name"):
+        lines.append(f"藝人：{record['artist_name']}")
+    event_times = _split_values(record.get("event_time"))
+    if event_times:
+        lines.append(f"{style['event_time']}{event_times[0]}")
+        lines.extend(event_times[1:])
+    if record.get("venue_name"):
+        lines.append(f"{style['venue']}{record['venue_name']}")
+    if record.get("address"):
+        lines.append(f"{style['address']}{record['address']}")
+
+    sale_times = _split_values(record.get("sale_time"))
+    if sale_times:
+        lines.append(style["sale"])
+        lines.extend(sale_times)
+
+    prices = _split_values(record.get("ticket_price"))
+    types = _split_values(record.get("ticket_types"))
+    if prices:
+        lines.append(style["price"])
+        for index, price in enumerate(prices):
+            ticket_type = types[index] if index < len(types) else ""
+            lines.append(f"{ticket_type} {price}".strip())
+    lines.extend(NOTICE_LINES)
+    return "\n".join(lines)
+
+
+def build_payload(url: str, title: str, intro: str, artist_name: str | None = None) -> dict[str, Any]:
+    data_layer: dict[str, Any] = {"event": "EnterActivityDetail"}
+    if artist_name:
+        data_layer["artistName"] = artist_name
+    return {
+        "title": title,
+        "intro": intro,
+        "pageTitle": f"{title} | tixcraft 拓元售票系統",
+        "currentUrl": url,
+        "dataLayer": data_layer,
+    }
+
+
+def build_synthetic_intro(line_count: int) -> str:
+    lines: list[str] = []
+    index = 0
+    while len(lines) < line_count:
+        lines.extend(
+            (
+                f"第{index + 1}場 活動時間：2026/{index % 12 + 1:02d}/{index % 28 + 1:02d} 19:{index % 6}0",
+                "演出地點：臺北小巨蛋（台北市松山區南京東路四段2號）",
+                f"會員預購 2026/{index % 12 + 1:02d}/01 12:00 ~ 23:59",
+                f"VIP NT${1000 + index * 10:,} / GA NT${800 + index:,}",
+                f"注意事項：請詳閱購票流程第{index + 1}條",
+            )
+        )
+        index += 1
+    return "\n".join(lines[:line_count])
+
+
+def archived_entries(archive_dir: Path, run_id: str | None = None) -> list[dict[str, Any]]:
+    return [
+        {"url": url, "kind": "recorded", "payload": payload}
+        for url, payload in PayloadArchive(archive_dir).iter_run(run_id)
+    ]
+
+
+def reconstructed_entries(source: Path) -> list[dict[str, Any]]:
+    records = json.loads(source.read_text(encoding="utf-8"))["events"]
+    corpus: list[dict[str, Any]] = []
+    for index, record in enumerate(records):
+        url = record["event_link"]
+        intro = build_intro(record, LABEL_STYLES[index % len(LABEL_STYLES)])
+        corpus.append(
+            {
+                "url": url,
+                "kind": "reconstructed",
+                "payload": build_payload(url, record["event_name"], intro, record.get("artist_name")),
+            }
+        )
+    return corpus
+
+
+def build_corpus(source: Path, archive_dir: Path | None = None, run_id: str | None = None) -> list[dict[str, Any]]:
+    corpus = archived_entries(archive_dir, run_id) if archive_dir else reconstructed_entries(source)
+    for line_count in SYNTHETIC_LINE_COUNTS:
+        url = f"https://tixcraft.com/activity/detail/synthetic_{line_count}"
+        title = f"SYNTHETIC {line_count} LINES 2026 WORLD TOUR IN TAIPEI"
+        corpus.append(
+            {
+                "url": url,
+                "kind": "synthetic",
+                "payload": build_payload(url, title, build_synthetic_intro(line_count), "SYNTHETIC"),
+            }
+        )
+    return corpus
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the parser benchmark corpus.")
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE, help="Scraper output to derive pages from.")
+    parser.add_argument("--archive", type=Path, help="Payload archive to take recorded pages from instead.")
+    parser.add_argument("--run", help="Archived run id to use with --archive (default: latest).")
+    parser.add_argument("--output", type=Path, default=DEFAULT_CORPUS, help="Corpus JSONL file to write.")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.source, args.archive, args.run)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("w", encoding="utf-8") as handle:
+        for entry in corpus:
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    print(json.dumps({"output": str(args.output), "pages": len(corpus)}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import tixcraft_parser
+import tixcraft_text
+from tixcraft_parser import TixcraftEventParser
+
+
+DEFAULT_CORPUS = Path("benchmarks/corpus.jsonl")
+STAGES = (
+    "_extract_sections",
+    "_extract_ticket_data",
+    "_format_event_time",
+    "_format_sale_time",
+    "_extract_location",
+    "_extract_artist_name",
+)
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+def load_corpus(path: Path) -> list[tuple[str, str, dict[str, Any]]]:
+    corpus: list[tuple[str, str, dict[str, Any]]] = []
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                entry = json.loads(line)
+                corpus.append((entry["url"], entry.get("kind", "recorded"), entry["payload"]))
+    return corpus
+
+
+def clear_caches(parser: TixcraftEventParser) -> None:
+    for function in (
+        tixcraft_text.clean_text,
+        tixcraft_text.lower_text,
+        tixcraft_text.compact_text,
+        tixcraft_text.compact_lower,
+        tixcraft_parser.KEYWORD_INDEX.categories,
+        parser._line_features,
+    ):
+        function.cache_clear()
+
+
+def _timed(samples: list[float], function: Callable[..., Any], *args: Any) -> Any:
+    started = time.perf_counter()
+    result = function(*args)
+    samples.append(time.perf_counter() - started)
+    return result
+
+
+def measure_stages(
+    parser: TixcraftEventParser,
+    corpus: list[tuple[str, str, dict[str, Any]]],
+    samples: dict[str, list[float]],
+) -> None:
+    for _, _, payload in corpus:
+        intro_lines = parser._split_intro_lines(payload.get("intro", ""))
+        event_name = parser._extract_event_name(payload)
+        sections = _timed(samples["_extract_sections"], parser._extract_sections, intro_lines)
+        _timed(samples["_extract_ticket_data"], parser._extract_ticket_data, sections, intro_lines)
+        _timed(samples["_format_event_time"], parser._format_event_time, sections["event_time"])
+        _timed(samples["_format_sale_time"], parser._format_sale_time, sections["sale_time"])
+        _timed(samples["_extract_location"], parser._extract_location, sections, intro_lines)
+        _timed(samples["_extract_artist_name"], parser._extract_artist_name, payload, event_name, intro_lines)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    return {
+        "mean_ms": round(statistics.fmean(values) * 1000, 4),
+        "p50_ms": round(_percentile(values, 0.5) * 1000, 4),
+        "p95_ms": round(_percentile(values, 0.95) * 1000, 4),
+        "max_ms": round(max(values) * 1000, 4),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_benchmark(corpus_path: Path, passes: int, warm: bool) -> dict[str, Any]:
+    corpus = load_corpus(corpus_path)
+    parser = TixcraftEventParser()
+
+    page_samples: dict[str, list[float]] = {}
+    pass_seconds: list[float] = []
+    for _ in range(passes):
+        if not warm:
+            clear_caches(parser)
+        started = time.perf_counter()
+        for url, kind, payload in corpus:
+            _timed(page_samples.setdefault(kind, []), parser._build_event_record, url, payload)
+        pass_seconds.append(time.perf_counter() - started)
+
+    stage_samples: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    for _ in range(passes):
+        if not warm:
+            clear_caches(parser)
+        measure_stages(parser, corpus, stage_samples)
+
+    best_pass = min(pass_seconds)
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "corpus": str(corpus_path),
+        "pages": len(corpus),
+        "passes": passes,
+        "warm_caches": warm,
+        "throughput_pages_per_s": round(len(corpus) / best_pass, 2) if best_pass else None,
+        "pass_ms": summarize(pass_seconds),
+        "pages_by_kind": {kind: summarize(values) for kind, values in page_samples.items() if values},
+        "stages": {stage: summarize(values) for stage, values in stage_samples.items()},
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    regressions: list[str] = []
+    rows: list[tuple[str, float | None, float | None]] = [
+        ("throughput_pages_per_s", baseline.get("throughput_pages_per_s"), current.get("throughput_pages_per_s"))
+    ]
+    for stage in STAGES:
+        rows.append(
+            (
+                f"{stage}.p50_ms",
+                baseline.get("stages", {}).get(stage, {}).get("p50_ms"),
+                current.get("stages", {}).get(stage, {}).get("p50_ms"),
+            )
+        )
+
+    for name, before, after in rows:
+        if not before or after is None:
+            print(f"{name:40} {before!s:>12} -> {after!s:>12}")
+            continue
+        change = (after - before) / before
+        worse = change < -threshold if name.startswith("throughput") else change > threshold
+        print(f"{name:40} {before:>12} -> {after:>12} ({change:+.1%}){'  REGRESSION' if worse else ''}")
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Tixcraft field parser over a payload corpus.")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="Corpus JSONL file.")
+    parser.add_argument("--passes", type=int, default=5, help="Number of passes over the corpus.")
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="Keep the normalization caches between passes instead of measuring a cold parser each pass.",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON result to this file.")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline result JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Relative slowdown that counts as a regression in --compare mode.",
+    )
+    args = parser.parse_args()
+
+    result = run_benchmark(args.corpus, max(1, args.passes), args.warm)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(result, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
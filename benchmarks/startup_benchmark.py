@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.parser_benchmark import git_revision, summarize
+
+
+TARGETS = {
+    "python": "pass",
+    "run_scraper": "import run_scraper",
+    "replay": "import run_scraper, tixcraft_replay",
+    "query": "import run_scraper, tixcraft_event_store",
+    "scrape": "import run_scraper, tixcraft_precision_field_scraper",
+    "selenium": "import selenium.webdriver",
+}
+PROBE = """
+{statement}
+import json, sys
+print(json.dumps(sorted(name for name in ("selenium", "webdriver_manager") if name in sys.modules)))
+"""
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_REGRESSION_THRESHOLD = 0.20
+
+
+def measure_target(statement: str, runs: int) -> dict[str, Any] | None:
+    command = [sys.executable, "-c", PROBE.format(statement=statement)]
+    samples: list[float] = []
+    loaded: list[str] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run(command, capture_output=True, text=True, cwd=REPO_ROOT)
+        samples.append(time.perf_counter() - started)
+        if completed.returncode != 0:
+            return None
+        loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {**summarize(samples), "min_ms": round(min(samples) * 1000, 4), "browser_modules": loaded}
+
+
+def run_benchmark(runs: int, targets: list[str]) -> dict[str, Any]:
+    results = {target: measure_target(TARGETS[target], runs) for target in targets}
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "runs": runs,
+        "targets": {target: result for target, result in results.items() if result is not None},
+        "unavailable": [target for target, result in results.items() if result is None],
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    regressions: list[str] = []
+    for target, result in current["targets"].items():
+        before = baseline.get("targets", {}).get(target, {}).get("min_ms")
+        after = result["min_ms"]
+        if not before:
+            print(f"{target:20} {before!s:>12} -> {after:>12}")
+            continue
+        change = (after - before) / before
+        worse = change > threshold
+        print(f"{target:20} {before:>12} -> {after:>12} ({change:+.1%}){'  REGRESSION' if worse else ''}")
+        if worse:
+            regressions.append(target)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure interpreter start plus import time for each scraper command.")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters started per target.")
+    parser.add_argument(
+        "--target",
+        action="append",
+        choices=TARGETS,
+        default=None,
+        help="Only measure this target (repeatable). Defaults to all targets.",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON result to this file.")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline result JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Relative slowdown of min_ms that counts as a regression in --compare mode.",
+    )
+    args = parser.parse_args()
+
+    result = run_benchmark(max(1, args.runs), args.target or list(TARGETS))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(result, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
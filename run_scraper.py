@@ -3,38 +3,699 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
 
-from tixcraft_precision_field_scraper import main as run_precision_scraper
+from tixcraft_http_fetcher import FETCHERS
+from tixcraft_scheduler import DEFAULT_LISTING_INTERVAL_SECONDS, DEFAULT_REQUESTS_PER_HOUR
+from tixcraft_throttle import DEFAULT_LATENCY_TARGET_SECONDS
+from tixcraft_work_queue import DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Run the Tixcraft activity scraper.")
+COMMANDS = ("scrape", "replay", "parse", "merge", "query", "schedule", "enqueue", "worker", "collect")
+
+
+def parse_shard_argument(value: str) -> tuple[int, int]:
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected i/n such as 0/4, got {value!r}") from exc
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"shard index must be between 0 and n - 1, got {value!r}")
+    return index, count
+
+
+def add_fetch_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--visible",
+        action="store_true",
+        help="Run Chrome with a visible window instead of headless mode.",
+    )
+    parser.add_argument(
+        "--fetcher",
+        choices=FETCHERS,
+        default="selenium",
+        help="How to fetch pages: a Chrome session, or plain HTTP with Selenium as the per-page fallback.",
+    )
+    parser.add_argument(
+        "--archive",
+        default=None,
+        help="Directory of the raw payload archive. Every fetched payload is stored there for replay.",
+    )
+    parser.add_argument(
+        "--block-resources",
+        action="store_true",
+        help="Block images, fonts, media and third-party trackers in Chrome via CDP.",
+    )
+    parser.add_argument(
+        "--allow-url",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Drop --block-resources patterns overlapping this glob, e.g. '*.woff2' (repeatable, no per-host rules).",
+    )
+    parser.add_argument(
+        "--chromedriver",
+        default=None,
+        help="Explicit chromedriver path. Skips the cached lookup and webdriver-manager entirely.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never download chromedriver; use the cached path or the one on PATH.",
+    )
+    parser.add_argument(
+        "--metrics",
+        default=None,
+        help="Append per-stage timings, page bytes and Chrome RSS to this JSON lines file.",
+    )
+    parser.add_argument(
+        "--prometheus-textfile",
+        default=None,
+        help="Write a Prometheus textfile-collector .prom file with the run summary.",
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=0.0,
+        help="Token-bucket limit on detail page loads per second across all workers (0 = unlimited).",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="Extra attempts per page after a timeout, block or crashed Chrome before it is recorded as failed.",
+    )
+    parser.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=2.0,
+        help="Seconds before the first retry; doubles on every further attempt.",
+    )
+    parser.add_argument(
+        "--recycle-after-pages",
+        type=int,
+        default=200,
+        help="Restart a Chrome session after it has loaded this many pages (0 = never).",
+    )
+    parser.add_argument(
+        "--recycle-rss-mb",
+        type=float,
+        default=1536.0,
+        help="Restart a Chrome session once its process tree RSS passes this many MiB (0 = never).",
+    )
+
+
+def add_session_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--limit", type=int, default=None, help="Only scrape the first N activity pages.")
     parser.add_argument(
         "--output",
         default="tixcraft_activities.json",
         help="Path to the output JSON file.",
     )
+    add_fetch_arguments(parser)
     parser.add_argument(
-        "--visible",
+        "--state",
+        default=None,
+        help="Sidecar state file with per-link fetch times. Defaults to <output stem>.state.json.",
+    )
+    parser.add_argument(
+        "--sqlite",
+        default=None,
+        help="Also upsert every record into this SQLite event store (see the query command).",
+    )
+    parser.add_argument(
+        "--changes",
+        default=None,
+        help="Append added / changed / removed records versus the previous output to this JSON lines feed.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard_argument,
+        default=(0, 1),
+        metavar="I/N",
+        help="Only scrape links whose event_link hash falls in shard I of N (0-based); combine outputs with merge.",
+    )
+
+
+def add_scrape_arguments(parser: argparse.ArgumentParser) -> None:
+    add_session_arguments(parser)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel Chrome sessions used to fetch activity pages.",
+    )
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        default=1,
+        help="Number of tabs each Chrome session keeps loading in parallel (pipelined navigation).",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help="Parser processes that turn fetched pages into records (0 = one per CPU core).",
+    )
+    parser.add_argument(
+        "--adaptive-concurrency",
         action="store_true",
-        help="Run Chrome with a visible window instead of headless mode.",
+        help="Grow in-flight page loads (up to workers x tabs) while latency is healthy; halve them on timeouts or blocks.",
+    )
+    parser.add_argument(
+        "--min-concurrency",
+        type=int,
+        default=1,
+        help="Lower bound for --adaptive-concurrency.",
+    )
+    parser.add_argument(
+        "--latency-target",
+        type=float,
+        default=DEFAULT_LATENCY_TARGET_SECONDS,
+        help="Page loads slower than this many seconds count as congestion for --adaptive-concurrency.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch new links and links older than --refresh-ttl-hours; reuse the previous output for the rest.",
+    )
+    parser.add_argument(
+        "--refresh-ttl-hours",
+        type=float,
+        default=24.0,
+        help="In incremental mode, re-fetch records whose last fetch is older than this many hours.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run: skip links already written to the checkpoint file.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Streaming JSONL checkpoint file. Defaults to <output stem>.checkpoint.jsonl.",
+    )
+    parser.add_argument(
+        "--fsync-every",
+        type=int,
+        default=10,
+        help="fsync the checkpoint file after this many records.",
     )
-    return parser
 
 
-def main() -> int:
-    parser = build_parser()
-    args = parser.parse_args()
+def add_schedule_arguments(parser: argparse.ArgumentParser) -> None:
+    add_session_arguments(parser)
+    parser.add_argument(
+        "--requests-per-hour",
+        type=int,
+        default=DEFAULT_REQUESTS_PER_HOUR,
+        help="Global page-load budget (listing and detail pages) over any rolling hour.",
+    )
+    parser.add_argument(
+        "--listing-interval-minutes",
+        type=float,
+        default=DEFAULT_LISTING_INTERVAL_SECONDS / 60,
+        help="How often to re-read the listing page for new and removed events.",
+    )
+    parser.add_argument(
+        "--max-fetches",
+        type=int,
+        default=None,
+        help="Exit after this many detail page fetches instead of running forever.",
+    )
+
+
+def add_enqueue_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--queue", required=True, help="SQLite work queue file shared by the worker processes.")
+    parser.add_argument("--limit", type=int, default=None, help="Only enqueue the first N activity pages.")
+    parser.add_argument(
+        "--shard",
+        type=parse_shard_argument,
+        default=(0, 1),
+        metavar="I/N",
+        help="Only enqueue links whose event_link hash falls in shard I of N (0-based).",
+    )
+    add_fetch_arguments(parser)
+
+
+def add_worker_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--queue", required=True, help="SQLite work queue file written by enqueue.")
+    parser.add_argument(
+        "--worker-id",
+        default=None,
+        help="Name recorded on leased jobs. Defaults to <hostname>:<pid>.",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        help="How long a claimed job stays reserved before another worker may take it over.",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=DEFAULT_MAX_ATTEMPTS,
+        help="Claims per job before an expired lease marks it as failed.",
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=int,
+        default=None,
+        help="Exit after this many jobs (default: once the queue is drained).",
+    )
+    add_fetch_arguments(parser)
+
+
+def add_collect_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--queue", required=True, help="SQLite work queue file written by enqueue.")
+    parser.add_argument(
+        "--output",
+        default="tixcraft_activities.json",
+        help="Path to the output JSON file.",
+    )
+    parser.add_argument("--sqlite", default=None, help="Also upsert the collected records into this SQLite store.")
+    parser.add_argument(
+        "--changes",
+        default=None,
+        help="Append added / changed / removed records versus the previous output to this JSON lines feed.",
+    )
+
+
+def add_replay_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--archive", required=True, help="Directory of the raw payload archive.")
+    parser.add_argument(
+        "--output",
+        default="tixcraft_activities.json",
+        help="Path to the output JSON file.",
+    )
+    parser.add_argument("--run", default=None, help="Archived run id to replay. Defaults to the latest run.")
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help="Parser processes used to rebuild the records (0 = one per CPU core).",
+    )
+    parser.add_argument("--sqlite", default=None, help="Also upsert the replayed records into this SQLite event store.")
+    parser.add_argument(
+        "--changes",
+        default=None,
+        help="Append added / changed / removed records versus the previous output to this JSON lines feed.",
+    )
+
+
+def add_parse_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--input",
+        default="-",
+        help='JSON lines of {"url": ..., "payload": ...} to parse. "-" reads stdin.',
+    )
+    parser.add_argument("--output", default="-", help='JSON lines file for the parsed records. "-" writes stdout.')
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help="Parser processes (0 = one per CPU core). Only a few batches per process are kept in memory.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=200,
+        help="Payloads sent to a parser process at a time.",
+    )
+
+
+def add_merge_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("shards", nargs="+", help="Output JSON files written with --shard.")
+    parser.add_argument(
+        "--output",
+        default="tixcraft_activities.json",
+        help="Path to the merged output JSON file.",
+    )
+    parser.add_argument("--sqlite", default=None, help="Also upsert the merged records into this SQLite event store.")
+    parser.add_argument(
+        "--changes",
+        default=None,
+        help="Append added / changed / removed records versus the previous output to this JSON lines feed.",
+    )
+    parser.add_argument(
+        "--allow-partial",
+        action="store_true",
+        help="Merge even when some shards of the N are missing.",
+    )
+
+
+def parse_datetime_argument(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected an ISO date or datetime, got {value!r}") from exc
+
+
+def add_query_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--db", required=True, help="SQLite event store written by --sqlite.")
+    parser.add_argument("--venue", default=None, help="Exact venue name (case-insensitive).")
+    parser.add_argument("--artist", default=None, help="Exact artist name (case-insensitive).")
+    parser.add_argument("--keyword", default=None, help="Substring of the event, venue or artist name.")
+    parser.add_argument(
+        "--selling-within-hours",
+        type=float,
+        default=None,
+        help="Only events with a sale stage starting between now and now + N hours.",
+    )
+    parser.add_argument("--event-from", type=parse_datetime_argument, default=None, help="Earliest event start (ISO).")
+    parser.add_argument("--event-to", type=parse_datetime_argument, default=None, help="Latest event start (ISO).")
+    parser.add_argument("--min-price", type=int, default=None, help="Events with a ticket at or above this price.")
+    parser.add_argument("--max-price", type=int, default=None, help="Events with a ticket at or below this price.")
+    parser.add_argument(
+        "--now",
+        type=parse_datetime_argument,
+        default=None,
+        help="Reference time for --selling-within-hours (ISO). Defaults to the current time.",
+    )
+    parser.add_argument(
+        "--include-removed",
+        action="store_true",
+        help="Include events that are no longer on the listing page.",
+    )
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of events to return.")
+
+
+def normalize_argv(argv: list[str]) -> list[str]:
+    if argv and (argv[0] in COMMANDS or argv[0] in {"-h", "--help"}):
+        return argv
+    return ["scrape", *argv]
+
+
+def run_scrape(args: argparse.Namespace) -> int:
+    from tixcraft_precision_field_scraper import main as run_precision_scraper
 
     result = run_precision_scraper(
         limit=args.limit,
         output_path=args.output,
         headless=not args.visible,
+        workers=args.workers,
+        tabs=args.tabs,
+        parse_workers=args.parse_workers,
+        fetcher=args.fetcher,
+        archive_dir=args.archive,
+        incremental=args.incremental,
+        refresh_ttl_hours=args.refresh_ttl_hours,
+        state_path=args.state,
+        resume=args.resume,
+        checkpoint_path=args.checkpoint,
+        checkpoint_fsync_every=args.fsync_every,
+        block_resources=args.block_resources,
+        allowed_url_patterns=args.allow_url,
+        chromedriver_path=args.chromedriver,
+        offline=args.offline,
+        metrics_path=args.metrics,
+        prometheus_path=args.prometheus_textfile,
+        sqlite_path=args.sqlite,
+        changes_path=args.changes,
+        adaptive_concurrency=args.adaptive_concurrency,
+        min_concurrency=args.min_concurrency,
+        max_requests_per_second=args.max_rate,
+        latency_target_seconds=args.latency_target,
+        fetch_retries=args.retries,
+        retry_backoff_seconds=args.retry_backoff,
+        recycle_after_pages=args.recycle_after_pages,
+        recycle_rss_mb=args.recycle_rss_mb,
+        shard_index=args.shard[0],
+        shard_count=args.shard[1],
+    )
+    print(
+        json.dumps(
+            {"output": args.output, "total_events": result["total_events"], **result["summary"]},
+            ensure_ascii=False,
+        )
+    )
+    return 0
+
+
+def run_schedule(args: argparse.Namespace) -> int:
+    from tixcraft_precision_field_scraper import schedule as run_scheduler
+
+    result = run_scheduler(
+        output_path=args.output,
+        headless=not args.visible,
+        fetcher=args.fetcher,
+        archive_dir=args.archive,
+        state_path=args.state,
+        block_resources=args.block_resources,
+        allowed_url_patterns=args.allow_url,
+        chromedriver_path=args.chromedriver,
+        offline=args.offline,
+        metrics_path=args.metrics,
+        prometheus_path=args.prometheus_textfile,
+        sqlite_path=args.sqlite,
+        changes_path=args.changes,
+        limit=args.limit,
+        requests_per_hour=args.requests_per_hour,
+        listing_interval_seconds=args.listing_interval_minutes * 60,
+        max_fetches=args.max_fetches,
+        max_requests_per_second=args.max_rate,
+        fetch_retries=args.retries,
+        retry_backoff_seconds=args.retry_backoff,
+        recycle_after_pages=args.recycle_after_pages,
+        recycle_rss_mb=args.recycle_rss_mb,
+        shard_index=args.shard[0],
+        shard_count=args.shard[1],
+    )
+    print(json.dumps({"output": args.output, **result}, ensure_ascii=False))
+    return 0
+
+
+def run_enqueue(args: argparse.Namespace) -> int:
+    from tixcraft_precision_field_scraper import enqueue
+
+    result = enqueue(
+        args.queue,
+        headless=not args.visible,
+        fetcher=args.fetcher,
+        block_resources=args.block_resources,
+        allowed_url_patterns=args.allow_url,
+        chromedriver_path=args.chromedriver,
+        offline=args.offline,
+        metrics_path=args.metrics,
+        prometheus_path=args.prometheus_textfile,
+        limit=args.limit,
+        shard_index=args.shard[0],
+        shard_count=args.shard[1],
+    )
+    print(json.dumps({"queue": args.queue, **result}, ensure_ascii=False))
+    return 0
+
+
+def run_worker(args: argparse.Namespace) -> int:
+    from tixcraft_precision_field_scraper import work
+
+    result = work(
+        args.queue,
+        worker_id=args.worker_id,
+        lease_seconds=args.lease_seconds,
+        max_attempts=args.max_attempts,
+        max_jobs=args.max_jobs,
+        headless=not args.visible,
+        fetcher=args.fetcher,
+        archive_dir=args.archive,
+        block_resources=args.block_resources,
+        allowed_url_patterns=args.allow_url,
+        chromedriver_path=args.chromedriver,
+        offline=args.offline,
+        metrics_path=args.metrics,
+        prometheus_path=args.prometheus_textfile,
+        max_requests_per_second=args.max_rate,
+        fetch_retries=args.retries,
+        retry_backoff_seconds=args.retry_backoff,
+        recycle_after_pages=args.recycle_after_pages,
+        recycle_rss_mb=args.recycle_rss_mb,
+    )
+    print(json.dumps({"queue": args.queue, **result}, ensure_ascii=False))
+    return 0
+
+
+def run_collect(args: argparse.Namespace) -> int:
+    from tixcraft_output import build_logger
+    from tixcraft_work_queue import collect
+
+    result = collect(
+        Path(args.queue),
+        Path(args.output),
+        sqlite_path=Path(args.sqlite) if args.sqlite else None,
+        changes_path=Path(args.changes) if args.changes else None,
+        logger=build_logger(),
+    )
+    print(
+        json.dumps(
+            {
+                "output": args.output,
+                "total_events": result["total_events"],
+                "failed": len(result["failures"]),
+                "jobs": result["jobs"],
+            },
+            ensure_ascii=False,
+        )
+    )
+    return 0
+
+
+def run_replay(args: argparse.Namespace) -> int:
+    from tixcraft_replay import replay as replay_archive
+
+    result = replay_archive(
+        args.archive,
+        output_path=args.output,
+        run_id=args.run,
+        parse_workers=args.parse_workers,
+        sqlite_path=args.sqlite,
+        changes_path=args.changes,
     )
     print(json.dumps({"output": args.output, "total_events": result["total_events"]}, ensure_ascii=False))
     return 0
 
 
+def run_parse(args: argparse.Namespace) -> int:
+    from tixcraft_replay import parse_stream
+
+    result = parse_stream(
+        input_path=args.input,
+        output_path=args.output,
+        parse_workers=args.parse_workers,
+        batch_size=args.batch_size,
+    )
+    print(
+        json.dumps({"output": args.output, **result}, ensure_ascii=False),
+        file=sys.stderr if args.output == "-" else sys.stdout,
+    )
+    return 0
+
+
+def run_merge(args: argparse.Namespace) -> int:
+    from tixcraft_output import build_logger
+    from tixcraft_shard import merge_shards
+
+    try:
+        result = merge_shards(
+            [Path(path) for path in args.shards],
+            Path(args.output),
+            sqlite_path=Path(args.sqlite) if args.sqlite else None,
+            changes_path=Path(args.changes) if args.changes else None,
+            allow_partial=args.allow_partial,
+            logger=build_logger(),
+        )
+    except (OSError, ValueError) as exc:
+        print(f"merge failed: {exc}", file=sys.stderr)
+        return 1
+    print(
+        json.dumps(
+            {
+                "output": args.output,
+                "total_events": result["total_events"],
+                "failed": len(result["failures"]),
+                "shards": result["shards"],
+                "missing_shards": result["missing_shards"],
+            },
+            ensure_ascii=False,
+        )
+    )
+    return 0
+
+
+def run_query(args: argparse.Namespace) -> int:
+    from tixcraft_event_store import EventStore
+
+    started = time.perf_counter()
+    sale_from = sale_to = None
+    if args.selling_within_hours is not None:
+        sale_from = args.now or datetime.now()
+        sale_to = sale_from + timedelta(hours=args.selling_within_hours)
+
+    store = EventStore(args.db)
+    try:
+        events = store.query(
+            venue=args.venue,
+            artist=args.artist,
+            keyword=args.keyword,
+            event_from=args.event_from,
+            event_to=args.event_to,
+            sale_from=sale_from,
+            sale_to=sale_to,
+            min_price=args.min_price,
+            max_price=args.max_price,
+            include_inactive=args.include_removed,
+            limit=args.limit,
+        )
+    finally:
+        store.close()
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+    print(json.dumps({"count": len(events), "elapsed_ms": elapsed_ms, "events": events}, ensure_ascii=False, indent=2))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run the Tixcraft activity scraper.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    scrape_parser = subparsers.add_parser("scrape", help="Scrape the live site (default command).")
+    add_scrape_arguments(scrape_parser)
+    scrape_parser.set_defaults(handler=run_scrape)
+
+    replay_parser = subparsers.add_parser(
+        "replay",
+        help="Rebuild the output JSON from archived payloads without a browser.",
+    )
+    add_replay_arguments(replay_parser)
+    replay_parser.set_defaults(handler=run_replay)
+
+    parse_parser = subparsers.add_parser(
+        "parse",
+        help="Stream a JSON lines payload dump through the field parser into JSON lines records.",
+    )
+    add_parse_arguments(parse_parser)
+    parse_parser.set_defaults(handler=run_parse)
+
+    merge_parser = subparsers.add_parser("merge", help="Combine --shard outputs into one output in listing order.")
+    add_merge_arguments(merge_parser)
+    merge_parser.set_defaults(handler=run_merge)
+
+    schedule_parser = subparsers.add_parser(
+        "schedule",
+        help="Keep re-fetching events, most often around their on-sale time, within a request budget.",
+    )
+    add_schedule_arguments(schedule_parser)
+    schedule_parser.set_defaults(handler=run_schedule)
+
+    enqueue_parser = subparsers.add_parser(
+        "enqueue",
+        help="Load the listing page and (re)fill a SQLite work queue with its detail links.",
+    )
+    add_enqueue_arguments(enqueue_parser)
+    enqueue_parser.set_defaults(handler=run_enqueue)
+
+    worker_parser = subparsers.add_parser(
+        "worker",
+        help="Claim jobs from the work queue, fetch and parse them until the queue drains.",
+    )
+    add_worker_arguments(worker_parser)
+    worker_parser.set_defaults(handler=run_worker)
+
+    collect_parser = subparsers.add_parser("collect", help="Write the work queue results in listing order.")
+    add_collect_arguments(collect_parser)
+    collect_parser.set_defaults(handler=run_collect)
+
+    query_parser = subparsers.add_parser("query", help="Query the SQLite event store without re-reading the JSON output.")
+    add_query_arguments(query_parser)
+    query_parser.set_defaults(handler=run_query)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(normalize_argv(sys.argv[1:] if argv is None else argv))
+    return args.handler(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import tixcraft_output  # noqa: E402
+from tixcraft_http_fetcher import HttpFetchError  # noqa: E402
+from tixcraft_precision_field_scraper import ScraperConfig, TixcraftPrecisionFieldScraper  # noqa: E402
+
+CORPUS_PATH = ROOT / "benchmarks" / "corpus.jsonl"
+GOLDEN_RECORDS_PATH = Path(__file__).with_name("data") / "corpus_records.jsonl"
+
+
+def load_jsonl(path: Path) -> list[dict[str, Any]]:
+    with path.open(encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def load_corpus() -> list[dict[str, Any]]:
+    return load_jsonl(CORPUS_PATH)
+
+
+class FakeHttpFetcher:
+    def __init__(
+        self,
+        payloads: dict[str, dict[str, Any]],
+        errors: dict[str, BaseException] | None = None,
+        listing_errors: list[BaseException] | None = None,
+    ):
+        self.payloads = payloads
+        self.errors = errors or {}
+        self.listing_errors = listing_errors or []
+        self.fetched: list[str] = []
+
+    def fetch_listing(self, url: str) -> list[dict[str, str]]:
+        if self.listing_errors:
+            raise self.listing_errors.pop(0)
+        return [{"href": link, "text": payload["title"], "image": ""} for link, payload in self.payloads.items()]
+
+    def fetch(self, url: str) -> dict[str, Any]:
+        self.fetched.append(url)
+        if url in self.errors:
+            raise self.errors[url]
+        if url not in self.payloads:
+            raise HttpFetchError(f"HTTP 404 for {url}", status=404)
+        return self.payloads[url]
+
+    def last_response_bytes(self) -> int | None:
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def isolated_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tixcraft_output, "LOG_PATH", tmp_path / "scraper.log")
+
+
+@pytest.fixture
+def corpus() -> list[dict[str, Any]]:
+    return [entry for entry in load_corpus() if entry["kind"] != "synthetic"]
+
+
+@pytest.fixture
+def make_scraper(tmp_path: Path):
+    def make(fetcher: FakeHttpFetcher, **config: Any) -> TixcraftPrecisionFieldScraper:
+        options = {
+            "output_path": tmp_path / "tixcraft_activities.json",
+            "fetcher": "http",
+            "fetch_retries": 0,
+            "retry_backoff_seconds": 0,
+            **config,
+        }
+        scraper = TixcraftPrecisionFieldScraper(ScraperConfig(**options))
+        scraper.http_fetcher = fetcher
+        return scraper
+
+    return make
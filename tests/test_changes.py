@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import tixcraft_output
+from tixcraft_changes import append_change_feed, iter_changes, record_hash
+from tixcraft_output import write_output
+
+
+def read_feed(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_record_hash_ignores_key_order():
+    assert record_hash({"a": 1, "b": "票"}) == record_hash({"b": "票", "a": 1})
+    assert record_hash({"a": 1}) != record_hash({"a": 2})
+
+
+def test_iter_changes_reports_added_changed_and_removed():
+    previous = {
+        "same": {"event_link": "same", "price": "800"},
+        "moved": {"event_link": "moved", "price": "800", "venue": "Arena"},
+        "gone": {"event_link": "gone"},
+        "failed": {"event_link": "failed"},
+    }
+    records = [
+        {"event_link": "same", "price": "800"},
+        {"event_link": "moved", "price": "1200"},
+        {"event_link": "new"},
+    ]
+
+    changes = list(iter_changes(previous, records, retained_links=["failed"]))
+
+    assert [(change["type"], change["event_link"]) for change in changes] == [
+        ("changed", "moved"),
+        ("added", "new"),
+        ("removed", "gone"),
+    ]
+    assert changes[0]["changes"] == {"price": ["800", "1200"], "venue": ["Arena", None]}
+    assert changes[0]["previous_hash"] == record_hash(previous["moved"])
+    assert changes[1]["record"] == {"event_link": "new"}
+
+
+def test_append_change_feed_counts_and_appends(tmp_path):
+    path = tmp_path / "feed" / "changes.jsonl"
+
+    first = append_change_feed(path, [{"type": "added", "event_link": "a"}], "2026-10-17 12:00:00")
+    second = append_change_feed(path, [], "2026-10-17 13:00:00")
+
+    assert first == {"added": 1, "changed": 0, "removed": 0}
+    assert second == {"added": 0, "changed": 0, "removed": 0}
+    assert read_feed(path) == [{"scrape_time": "2026-10-17 12:00:00", "type": "added", "event_link": "a"}]
+
+
+def test_write_output_feeds_only_differences_between_runs(tmp_path):
+    output_path = tmp_path / "out.json"
+    changes_path = tmp_path / "changes.jsonl"
+    records = [{"event_link": "a", "price": "800"}, {"event_link": "b", "price": "900"}]
+
+    first = write_output(output_path, records, changes_path=changes_path)
+    second = write_output(output_path, records, changes_path=changes_path)
+    third = write_output(
+        output_path,
+        [{"event_link": "a", "price": "1000"}],
+        [{"event_link": "b", "error": "timeout"}],
+        changes_path=changes_path,
+    )
+
+    assert first["changes"] == {"added": 2, "changed": 0, "removed": 0}
+    assert second["changes"] == {"added": 0, "changed": 0, "removed": 0}
+    assert third["changes"] == {"added": 0, "changed": 1, "removed": 0}
+    assert [change["type"] for change in read_feed(changes_path)] == ["added", "added", "changed"]
+
+
+def test_feed_is_appended_after_the_output_is_written(tmp_path, monkeypatch):
+    output_path = tmp_path / "out.json"
+    changes_path = tmp_path / "changes.jsonl"
+    write_output(output_path, [{"event_link": "a", "price": "800"}], changes_path=changes_path)
+
+    def crash(path, changes, scrape_time):
+        assert json.loads(output_path.read_text(encoding="utf-8"))["events"][0]["price"] == "900"
+        raise OSError("disk full")
+
+    monkeypatch.setattr(tixcraft_output, "append_change_feed", crash)
+    with pytest.raises(OSError):
+        write_output(output_path, [{"event_link": "a", "price": "900"}], changes_path=changes_path)
+    monkeypatch.undo()
+
+    retry = write_output(output_path, [{"event_link": "a", "price": "900"}], changes_path=changes_path)
+
+    assert retry["changes"] == {"added": 0, "changed": 0, "removed": 0}
+    assert [change["type"] for change in read_feed(changes_path)] == ["added"]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+from conftest import FakeHttpFetcher
+from tixcraft_checkpoint import CheckpointWriter, atomic_write_text, load_checkpoint
+
+
+def test_atomic_write_replaces_file_without_leftovers(tmp_path):
+    path = tmp_path / "nested" / "output.json"
+
+    atomic_write_text(path, "first")
+    atomic_write_text(path, "second")
+
+    assert path.read_text(encoding="utf-8") == "second"
+    assert [child.name for child in path.parent.iterdir()] == ["output.json"]
+
+
+def test_checkpoint_round_trip_skips_torn_lines(tmp_path):
+    path = tmp_path / "run.checkpoint.jsonl"
+    writer = CheckpointWriter(path, fsync_every=2)
+    writer.write("a", {"event_link": "a"}, fetched_at=1.0)
+    writer.write("b", {"event_link": "b"}, fetched_at=2.0)
+    writer.close()
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"event_link": "c", "record": {"event_li')
+
+    assert list(load_checkpoint(path)) == ["a", "b"]
+    assert load_checkpoint(path)["b"] == {"event_link": "b", "fetched_at": 2.0, "record": {"event_link": "b"}}
+
+
+def test_checkpoint_writer_truncates_unless_resuming(tmp_path):
+    path = tmp_path / "run.checkpoint.jsonl"
+    first = CheckpointWriter(path)
+    first.write("a", {"event_link": "a"})
+    first.close()
+
+    resumed = CheckpointWriter(path, resume=True)
+    resumed.write("b", {"event_link": "b"})
+    resumed.close()
+    assert list(load_checkpoint(path)) == ["a", "b"]
+
+    fresh = CheckpointWriter(path)
+    fresh.close()
+    assert load_checkpoint(path) == {}
+
+
+def test_resume_skips_checkpointed_links(tmp_path, corpus, make_scraper):
+    payloads = {entry["url"]: entry["payload"] for entry in corpus[:5]}
+    links = list(payloads)
+    checkpoint_path = tmp_path / "tixcraft_activities.checkpoint.jsonl"
+    reference = make_scraper(FakeHttpFetcher(payloads), output_path=tmp_path / "reference.json").scrape_all_events()
+    writer = CheckpointWriter(checkpoint_path)
+    for record in reference["events"][:2]:
+        writer.write(record["event_link"], record)
+    writer.close()
+
+    fetcher = FakeHttpFetcher(payloads)
+    result = make_scraper(fetcher, resume=True).scrape_all_events()
+
+    assert fetcher.fetched == links[2:]
+    assert result["summary"]["resumed"] == 2
+    assert result["events"] == reference["events"]
+    assert not checkpoint_path.exists()
+    output = json.loads((tmp_path / "tixcraft_activities.json").read_text(encoding="utf-8"))
+    assert [record["event_link"] for record in output["events"]] == links
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+import tixcraft_driver_cache
+from tixcraft_driver_cache import ChromedriverResolver, ChromedriverUnavailableError, major_version
+
+
+@pytest.fixture
+def cached_driver(tmp_path):
+    driver = tmp_path / "chromedriver"
+    driver.write_text("", encoding="utf-8")
+    cache_path = tmp_path / "chromedriver.json"
+    cache_path.write_text(
+        json.dumps({"path": str(driver), "resolved_at": time.time(), "chrome_version": "136.0.7103.92"}),
+        encoding="utf-8",
+    )
+    return driver, cache_path
+
+
+def test_major_version():
+    assert major_version("Google Chrome 137.0.7151.55 ") == "137"
+    assert major_version("136.0.7103.92") == "136"
+    assert major_version(None) is None
+
+
+def test_cache_is_reused_while_chrome_keeps_its_major_version(cached_driver, monkeypatch):
+    driver, cache_path = cached_driver
+    monkeypatch.setattr(tixcraft_driver_cache, "installed_browser_version", lambda: "136.0.7103.113")
+
+    resolver = ChromedriverResolver(cache_path=cache_path, offline=True)
+
+    assert resolver.resolve() == str(driver)
+    assert resolver.source == "cache"
+
+
+def test_cache_is_skipped_after_a_chrome_upgrade(cached_driver, monkeypatch):
+    _, cache_path = cached_driver
+    monkeypatch.setattr(tixcraft_driver_cache, "installed_browser_version", lambda: "137.0.7151.55")
+    monkeypatch.setattr(tixcraft_driver_cache.shutil, "which", lambda name: None)
+
+    with pytest.raises(ChromedriverUnavailableError):
+        ChromedriverResolver(cache_path=cache_path, offline=True).resolve()
+
+
+def test_unknown_installed_version_keeps_the_cache(cached_driver, monkeypatch):
+    driver, cache_path = cached_driver
+    monkeypatch.setattr(tixcraft_driver_cache, "installed_browser_version", lambda: None)
+
+    assert ChromedriverResolver(cache_path=cache_path, offline=True).resolve() == str(driver)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from tixcraft_event_store import EventStore, parse_datetimes, price_range, sale_datetimes
+from tixcraft_parser import parse_payload
+
+
+def test_parse_datetimes_resolves_years_and_clock_markers():
+    reference = datetime(2026, 3, 1)
+
+    assert parse_datetimes("2026/07/25（六）下午 6:30", reference) == [datetime(2026, 7, 25, 18, 30)]
+    assert parse_datetimes("12/30 19:00 / 01/02 12:00 PM", datetime(2026, 12, 1)) == [
+        datetime(2026, 12, 30, 19, 0),
+        datetime(2027, 1, 2, 12, 0),
+    ]
+    assert parse_datetimes("02/30 19:00", reference) == []
+
+
+def test_sale_year_never_lands_after_the_event():
+    record = {"event_time": "2026/03/10 19:00", "sale_time": "會員預購 01/15 12:00 / 全面開賣 01/20 12:00"}
+
+    assert sale_datetimes(record, datetime(2026, 12, 1)) == [datetime(2026, 1, 15, 12), datetime(2026, 1, 20, 12)]
+
+
+def test_price_range():
+    assert price_range("VIP NT$1,600 / GA NT$800") == (800, 1600)
+    assert price_range("免費入場") == (None, None)
+
+
+def test_selling_within_matches_later_sale_stages(tmp_path):
+    store = EventStore(tmp_path / "events.sqlite")
+    try:
+        store.sync(
+            [
+                {
+                    "event_link": "staged",
+                    "event_name": "Staged",
+                    "event_time": "2026/12/24 19:00",
+                    "sale_time": "第一階段 2026/10/01 12:00 / 第二階段 2026/10/18 12:00",
+                },
+                {
+                    "event_link": "past",
+                    "event_name": "Past",
+                    "event_time": "2026/12/01",
+                    "sale_time": "2026/09/01 12:00",
+                },
+            ],
+            scraped_at=datetime(2026, 10, 17),
+        )
+
+        events = store.query(sale_from=datetime(2026, 10, 17, 10), sale_to=datetime(2026, 10, 19))
+        everything = store.query()
+    finally:
+        store.close()
+
+    assert [(event["event_link"], event["sale_start"]) for event in events] == [("staged", "2026-10-18T12:00")]
+    assert events[0]["sale_stages"] == ["2026-10-01T12:00", "2026-10-18T12:00"]
+    assert [(event["event_link"], event["sale_start"]) for event in everything] == [
+        ("past", "2026-09-01T12:00"),
+        ("staged", "2026-10-01T12:00"),
+    ]
+
+
+def test_sync_deactivates_missing_but_keeps_retained_links(tmp_path):
+    store = EventStore(tmp_path / "events.sqlite")
+    records = [{"event_link": link, "event_name": link} for link in ("a", "b", "c")]
+    try:
+        store.sync(records, scraped_at=datetime(2026, 1, 1))
+        store.sync(records[:1], scraped_at=datetime(2026, 1, 2), retained_links=["b"])
+        active = [event["event_link"] for event in store.query()]
+        removed = [event["event_link"] for event in store.query(include_inactive=True)]
+    finally:
+        store.close()
+
+    assert active == ["a", "b"]
+    assert removed == ["a", "b", "c"]
+
+
+def test_existing_store_is_backfilled_with_sale_stages(tmp_path):
+    path = tmp_path / "events.sqlite"
+    store = EventStore(path)
+    record = {"event_link": "a", "event_name": "A", "sale_time": "2026/05/01 12:00"}
+    store.sync([record], scraped_at=datetime(2026, 4, 1))
+    store.connection.execute("DROP TABLE sale_stages")
+    store.connection.commit()
+    store.close()
+
+    store = EventStore(path)
+    try:
+        events = store.query(sale_from=datetime(2026, 4, 30), sale_to=datetime(2026, 5, 2))
+    finally:
+        store.close()
+
+    assert [event["event_link"] for event in events] == ["a"]
+
+
+def test_sale_times_accept_spaced_clocks_and_skip_range_ends():
+    reference = datetime(2026, 3, 1)
+
+    assert parse_datetimes("2026/03/18(三) 11 00 ~ 23:59", reference) == [datetime(2026, 3, 18, 11)]
+    assert parse_datetimes("2026/01/12（一）10 00-22:00", reference) == [datetime(2026, 1, 12, 10)]
+    assert parse_datetimes("2026/01/19 (一) 11 00 AM", reference) == [datetime(2026, 1, 19, 11)]
+    assert sale_datetimes(
+        {"sale_time": "2026/01/19 (一) 11:00 ~ 2026/01/20 (二) 11:00 / 正式開賣 2026/01/22 (四) 11:00"},
+        reference,
+    ) == [datetime(2026, 1, 19, 11), datetime(2026, 1, 22, 11)]
+
+
+def test_store_reads_sale_stages_from_parser_output(tmp_path, corpus):
+    records = {
+        record["event_link"].rsplit("/", 1)[1]: record
+        for record in (parse_payload(entry["url"], entry["payload"]) for entry in corpus)
+    }
+    store = EventStore(tmp_path / "events.sqlite")
+    try:
+        store.sync(records.values(), scraped_at=datetime(2026, 1, 1))
+        everything = {event["event_link"].rsplit("/", 1)[1]: event for event in store.query()}
+        selling = store.query(sale_from=datetime(2026, 3, 18, 10, 30), sale_to=datetime(2026, 3, 18, 12))
+    finally:
+        store.close()
+
+    assert everything["26_bus"]["sale_stages"] == ["2026-03-18T11:00", "2026-03-19T11:00", "2026-03-20T11:00"]
+    assert everything["26_mltr"]["sale_start"] == "2026-01-12T10:00"
+    assert everything["26_laufey"]["sale_stages"] == [
+        "2026-03-09T10:00",
+        "2026-03-09T18:00",
+        "2026-03-10T12:00",
+        "2026-03-11T12:00",
+    ]
+    assert [(event["event_link"].rsplit("/", 1)[1], event["sale_start"]) for event in selling] == [
+        ("26_bus", "2026-03-18T11:00")
+    ]
+
+
+def test_reopening_an_older_store_rewrites_sale_stages(tmp_path):
+    path = tmp_path / "events.sqlite"
+    store = EventStore(path)
+    record = {"event_link": "a", "event_name": "A", "sale_time": "2026/03/18(三) 11 00 ~ 23:59"}
+    store.sync([record], scraped_at=datetime(2026, 3, 1))
+    with store.connection:
+        store.connection.execute("UPDATE sale_stages SET stage_start = '2026-03-18T23:59'")
+        store.connection.execute("UPDATE events SET sale_start = '2026-03-18T23:59'")
+    store.connection.execute("PRAGMA user_version = 1")
+    store.close()
+
+    store = EventStore(path)
+    try:
+        events = store.query()
+    finally:
+        store.close()
+
+    assert [(event["sale_start"], event["sale_stages"]) for event in events] == [
+        ("2026-03-18T11:00", ["2026-03-18T11:00"])
+    ]
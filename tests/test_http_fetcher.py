@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from tixcraft_http_fetcher import (
+    HttpFetchError,
+    HttpPayloadFetcher,
+    extract_data_layer_detail,
+    parse_detail_html,
+    parse_listing_html,
+)
+
+URL = "https://tixcraft.com/activity/detail/26_example"
+
+
+def test_detail_page_fields_and_data_layer():
+    html = """
+    <html><head><title> Example  Show | tixcraft </title>
+    <script>window.dataLayer = []; dataLayer.push({ event: 'EnterActivityDetail', artistName: 'Band', });</script>
+    </head><body>
+    <h2 id="synopsisEventTitle">Example Show</h2>
+    <div id="intro"><p>演出時間：2026/07/25 18:30</p><p>票價：NT$1,600<br>NT$800</p></div>
+    </body></html>
+    """
+
+    payload = parse_detail_html(html, URL)
+
+    assert payload["title"] == "Example Show"
+    assert payload["intro"] == "演出時間：2026/07/25 18:30\n票價：NT$1,600\nNT$800"
+    assert payload["pageTitle"] == "Example Show | tixcraft"
+    assert payload["dataLayer"] == {"event": "EnterActivityDetail", "artistName": "Band"}
+
+
+@pytest.mark.parametrize(
+    ("html", "intro"),
+    [
+        ("<div id=intro><p>a<p>b</div><div>footer</div>", "a\nb"),
+        ("<div id=intro><ul><li>a<li>b</ul></div><p>footer", "a\nb"),
+        ("<div id=intro><table><tr><td>a<td>b<tr><td>c</table></div>footer", "a\tb\nc"),
+        ("<div id=intro><dl><dt>a<dd>b</dl></div>footer", "a\nb"),
+        ("<div id=intro><b>a</div><div>footer</b></div>", "a"),
+        ("<div id=intro>a</span>b<img src=x.png>c</div>footer", "abc"),
+    ],
+)
+def test_optional_end_tags_do_not_leak_text(html, intro):
+    assert parse_detail_html(html, URL)["intro"] == intro
+
+
+def test_table_rows_match_chrome_inner_text():
+    html = """
+    <div id="intro">
+      <p>票價資訊</p>
+      <table>
+        <thead><tr><th> 區域 </th><th>票價</th><th>備註</th></tr></thead>
+        <tbody>
+          <tr><td>VIP</td><td>NT$3,800</td><td></td></tr>
+          <tr><td>一般區</td><td>NT$2,800</td><td>含 <b>手續費</b></td></tr>
+        </tbody>
+      </table>
+      <p>售票時間：2026/03/18 11:00</p>
+    </div>
+    """
+    chrome_inner_text = "票價資訊\n區域\t票價\t備註\nVIP\tNT$3,800\t\n一般區\tNT$2,800\t含 手續費\n售票時間：2026/03/18 11:00"
+
+    assert parse_detail_html(html, URL)["intro"] == chrome_inner_text
+
+
+def test_skipped_tags_are_not_text():
+    html = "<div id=intro>a<script>var x = '<p>';</script><style>p {}</style>b</div>"
+
+    assert parse_detail_html(html, URL)["intro"] == "ab"
+
+
+def test_listing_cards_split_per_link():
+    html = """
+    <div class="thumbnails">
+      <div><a href="/activity/detail/26_a"><img src="/a.jpg"></a><p>Show A</p></div>
+      <div><a href="/activity/detail/26_b">Show B</a></div>
+    </div>
+    """
+
+    cards = parse_listing_html(html, "https://tixcraft.com/activity")
+
+    assert cards == [
+        {"href": "https://tixcraft.com/activity/detail/26_a", "text": "Show A", "image": "https://tixcraft.com/a.jpg"},
+        {"href": "https://tixcraft.com/activity/detail/26_b", "text": "Show B", "image": ""},
+    ]
+
+
+def test_data_layer_requires_matching_event():
+    assert extract_data_layer_detail(["dataLayer.push({event: 'PageView'});"]) == {}
+
+
+def test_decode_body_falls_back_to_utf8_for_unknown_charset():
+    fetcher = HttpPayloadFetcher()
+    body = "票價".encode("utf-8")
+
+    assert fetcher._decode_body({"content-type": "text/html; charset=x-unknown"}, body) == "票價"
+    assert fetcher._decode_body({"content-encoding": "gzip"}, gzip.compress(body)) == "票價"
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+def test_decode_body_wraps_corrupt_compression(encoding):
+    with pytest.raises(HttpFetchError):
+        HttpPayloadFetcher()._decode_body({"content-encoding": encoding}, b"not compressed")
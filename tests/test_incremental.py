@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+
+from conftest import FakeHttpFetcher
+
+
+def run_incremental(make_scraper, payloads):
+    fetcher = FakeHttpFetcher(payloads)
+    result = make_scraper(fetcher, incremental=True).scrape_all_events()
+    return fetcher, result
+
+
+def test_incremental_run_reuses_fresh_records(corpus, make_scraper):
+    payloads = {entry["url"]: entry["payload"] for entry in corpus[:4]}
+    _, first = run_incremental(make_scraper, payloads)
+
+    fetcher, second = run_incremental(make_scraper, payloads)
+
+    assert fetcher.fetched == []
+    assert second["events"] == first["events"]
+
+
+def test_changed_listing_card_is_refetched(corpus, make_scraper):
+    payloads = {entry["url"]: entry["payload"] for entry in corpus[:4]}
+    run_incremental(make_scraper, payloads)
+    changed = list(payloads)[1]
+    payloads[changed] = {**payloads[changed], "title": payloads[changed]["title"] + "（加場）"}
+
+    fetcher, result = run_incremental(make_scraper, payloads)
+
+    assert fetcher.fetched == [changed]
+    assert [record["event_link"] for record in result["events"]] == list(payloads)
+
+
+def test_expired_ttl_is_refetched(tmp_path, corpus, make_scraper):
+    payloads = {entry["url"]: entry["payload"] for entry in corpus[:4]}
+    run_incremental(make_scraper, payloads)
+    state_path = tmp_path / "tixcraft_activities.state.json"
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    stale = list(payloads)[2]
+    state["links"][stale]["fetched_at"] -= 2 * 24 * 3600
+    state_path.write_text(json.dumps(state), encoding="utf-8")
+
+    fetcher, _ = run_incremental(make_scraper, payloads)
+
+    assert fetcher.fetched == [stale]
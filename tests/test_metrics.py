@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import tixcraft_metrics
+from tixcraft_metrics import MetricsRecorder
+
+
+def test_stage_history_is_bounded_but_totals_keep_counting(monkeypatch):
+    monkeypatch.setattr(tixcraft_metrics, "MAX_STAGE_SAMPLES", 4)
+    metrics = MetricsRecorder()
+
+    for seconds in (10.0, 1.0, 1.0, 1.0, 1.0, 1.0):
+        metrics.observe("parse", seconds)
+    metrics.record_page("a", 100, rss_bytes=300)
+    metrics.record_page("b", 50, rss_bytes=200)
+
+    summary = metrics.summary()
+    assert len(metrics.samples["parse"]) == 4
+    assert summary["stages"]["parse"]["count"] == 6
+    assert summary["stages"]["parse"]["total_seconds"] == 15.0
+    assert summary["stages"]["parse"]["max_seconds"] == 10.0
+    assert summary["stages"]["parse"]["p95_seconds"] == 1.0
+    assert (summary["pages"], summary["page_bytes_total"], summary["chrome_rss_bytes_max"]) == (2, 150, 300)
+
+
+def test_prometheus_sum_and_count_use_running_totals(monkeypatch):
+    monkeypatch.setattr(tixcraft_metrics, "MAX_STAGE_SAMPLES", 2)
+    metrics = MetricsRecorder()
+    for seconds in (1.0, 2.0, 3.0):
+        metrics.observe("listing", seconds)
+
+    text = metrics.render_prometheus()
+
+    assert 'tixcraft_scraper_stage_seconds_sum{stage="listing"} 6.000000' in text
+    assert 'tixcraft_scraper_stage_seconds_count{stage="listing"} 3' in text
+    assert 'tixcraft_scraper_stage_seconds{stage="listing",quantile="0.5"} 2.000000' in text
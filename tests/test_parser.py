@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from conftest import GOLDEN_RECORDS_PATH, load_corpus, load_jsonl
+from tixcraft_parser import TixcraftEventParser, parse_payload, parse_payload_batch
+
+
+@pytest.mark.parametrize(
+    ("entry", "expected"),
+    [
+        pytest.param(entry, expected, id=entry["url"].rsplit("/", 1)[-1])
+        for entry, expected in zip(load_corpus(), load_jsonl(GOLDEN_RECORDS_PATH))
+    ],
+)
+def test_corpus_matches_golden_records(entry, expected):
+    assert TixcraftEventParser()._build_event_record(entry["url"], entry["payload"]) == expected
+
+
+def test_cold_and_warm_parsers_agree(corpus):
+    warm = TixcraftEventParser()
+    for _ in range(2):
+        for entry in corpus:
+            expected = parse_payload(entry["url"], entry["payload"])
+            assert warm._build_event_record(entry["url"], entry["payload"]) == expected
+
+
+def test_parse_payload_batch_keeps_order(corpus):
+    items = [(entry["url"], entry["payload"]) for entry in corpus[:5]]
+
+    assert parse_payload_batch(items) == [parse_payload(url, payload) for url, payload in items]
+
+
+def test_record_omits_empty_fields():
+    record = TixcraftEventParser()._build_event_record(
+        "https://tixcraft.com/activity/detail/26_empty",
+        {"title": "Empty Show", "intro": "", "pageTitle": "", "dataLayer": {}},
+    )
+
+    assert record == {"event_name": "Empty Show", "event_link": "https://tixcraft.com/activity/detail/26_empty"}
+
+
+def test_line_helpers_run_once_per_distinct_line(corpus):
+    parser = TixcraftEventParser()
+    calls: Counter[tuple[str, str]] = Counter()
+    for name in ("_looks_like_price_line", "_split_datetime_location_pair", "_extract_inline_schedule_entry"):
+        original = getattr(parser, name)
+
+        def counted(line, name=name, original=original):
+            calls[name, line] += 1
+            return original(line)
+
+        setattr(parser, name, counted)
+
+    for _ in range(2):
+        for entry in corpus:
+            parser._build_event_record(entry["url"], entry["payload"])
+
+    assert calls
+    assert max(calls.values()) == 1
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+
+from conftest import FakeHttpFetcher
+from tixcraft_payload_archive import PayloadArchive
+from tixcraft_replay import replay
+from tixcraft_work_queue import WorkQueue
+
+
+def test_iter_run_defaults_to_latest_run(tmp_path):
+    archive = PayloadArchive(tmp_path)
+    archive.store("https://example.com/a", {"title": "old"}, run_id="run-1", position=0)
+    archive.store("https://example.com/b", {"title": "b"}, run_id="run-1", position=1)
+    archive.store("https://example.com/a", {"title": "new"}, run_id="run-2", position=0)
+
+    assert archive.run_ids() == ["run-1", "run-2"]
+    assert list(archive.iter_run()) == [("https://example.com/a", {"title": "new"})]
+    assert [url for url, _ in archive.iter_run("run-1")] == ["https://example.com/a", "https://example.com/b"]
+
+
+def test_reference_points_run_at_last_stored_payload(tmp_path):
+    archive = PayloadArchive(tmp_path)
+    archive.store("https://example.com/a", {"title": "first"}, run_id="run-1", position=0)
+    archive.store("https://example.com/a", {"title": "second"}, run_id="run-2", position=0)
+
+    referenced = archive.reference([("https://example.com/a", 1), ("https://example.com/missing", 0)], run_id="run-3")
+
+    assert referenced == 1
+    assert list(archive.iter_run("run-3")) == [("https://example.com/a", {"title": "second"})]
+
+
+def test_replay_after_incremental_run_rebuilds_full_output(tmp_path, corpus, make_scraper):
+    payloads = {entry["url"]: entry["payload"] for entry in corpus[:12]}
+    first = dict(list(payloads.items())[:10])
+    archive_dir = tmp_path / "archive"
+
+    full = make_scraper(FakeHttpFetcher(first), archive_dir=archive_dir)
+    full.metrics.run_id = "run-full"
+    full.scrape_all_events()
+
+    fetcher = FakeHttpFetcher(payloads)
+    incremental = make_scraper(fetcher, archive_dir=archive_dir, incremental=True)
+    incremental.metrics.run_id = "run-incremental"
+    result = incremental.scrape_all_events()
+
+    assert sorted(fetcher.fetched) == sorted(list(payloads)[10:])
+    assert result["summary"]["fetched"] == 2
+    assert result["summary"]["reused"] == 10
+
+    replayed = replay(str(archive_dir), str(tmp_path / "replayed.json"))
+
+    assert replayed["events"] == result["events"]
+    assert len(replayed["events"]) == 12
+    output = json.loads((tmp_path / "tixcraft_activities.json").read_text(encoding="utf-8"))
+    assert [record["event_link"] for record in replayed["events"]] == [
+        record["event_link"] for record in output["events"]
+    ]
+
+
+def test_worker_pages_are_archived_under_the_enqueue_run(tmp_path, corpus, make_scraper):
+    payloads = {entry["url"]: entry["payload"] for entry in corpus[:4]}
+    archive_dir = tmp_path / "archive"
+    jobs = WorkQueue(tmp_path / "queue.db")
+    try:
+        enqueuer = make_scraper(FakeHttpFetcher(payloads))
+        enqueuer.metrics.run_id = "run-enqueue"
+        enqueuer.enqueue_listing(jobs)
+        for run_id in ("worker-1", "worker-2"):
+            worker = make_scraper(FakeHttpFetcher(payloads), archive_dir=archive_dir)
+            worker.metrics.run_id = run_id
+            worker.run_worker(jobs, owner=run_id, max_jobs=2)
+    finally:
+        jobs.close()
+
+    archive = PayloadArchive(archive_dir)
+    assert archive.run_ids() == ["run-enqueue"]
+    assert [url for url, _ in archive.iter_run()] == list(payloads)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tixcraft_parser import parse_payload
+from tixcraft_replay import parse_stream
+
+
+@pytest.fixture
+def payload_lines(tmp_path, corpus):
+    path = tmp_path / "payloads.jsonl"
+    lines = [json.dumps({"url": entry["url"], "payload": entry["payload"]}, ensure_ascii=False) for entry in corpus]
+    lines[3:3] = ["not json", '{"url": "missing-payload"}', ""]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def read_records(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_parse_stream_skips_bad_lines(tmp_path, corpus, payload_lines):
+    output_path = tmp_path / "records.jsonl"
+
+    stats = parse_stream(str(payload_lines), str(output_path), batch_size=7)
+
+    assert stats["parsed"] == len(corpus)
+    assert stats["skipped"] == 2
+    assert stats["skipped_lines"] == [4, 5]
+    assert read_records(output_path) == [parse_payload(entry["url"], entry["payload"]) for entry in corpus]
+    assert [child.name for child in tmp_path.iterdir() if child.name.startswith(".")] == []
+
+
+def test_parse_stream_output_does_not_depend_on_workers(tmp_path, payload_lines):
+    serial = tmp_path / "serial.jsonl"
+    parallel = tmp_path / "parallel.jsonl"
+
+    parse_stream(str(payload_lines), str(serial), parse_workers=1, batch_size=5)
+    parse_stream(str(payload_lines), str(parallel), parse_workers=2, batch_size=5)
+
+    assert parallel.read_text(encoding="utf-8") == serial.read_text(encoding="utf-8")
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import tixcraft_scheduler
+from tixcraft_parser import parse_payload
+from tixcraft_scheduler import (
+    BUDGET_WINDOW_SECONDS,
+    IDLE_REFRESH_SECONDS,
+    RETRY_DELAY_SECONDS,
+    RescrapeScheduler,
+    event_is_over,
+    next_sale_start,
+    refresh_interval,
+)
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+def record_with_sale(sale: datetime, event: datetime | None = None) -> dict[str, str]:
+    event = event or sale + timedelta(days=30)
+    return {"sale_time": sale.strftime("%Y/%m/%d %H:%M"), "event_time": event.strftime("%Y/%m/%d %H:%M")}
+
+
+@pytest.mark.parametrize(
+    ("lead", "interval"),
+    [
+        pytest.param(timedelta(minutes=30), 120.0, id="within-hour"),
+        pytest.param(timedelta(hours=3), 600.0, id="within-six-hours"),
+        pytest.param(timedelta(days=1), 3600.0, id="within-two-days"),
+        pytest.param(timedelta(days=5), 6 * 3600.0, id="within-week"),
+        pytest.param(timedelta(days=20), IDLE_REFRESH_SECONDS, id="far-off"),
+        pytest.param(timedelta(minutes=-30), 120.0, id="grace-period"),
+        pytest.param(timedelta(hours=-2), IDLE_REFRESH_SECONDS, id="sale-passed"),
+    ],
+)
+def test_refresh_interval_tiers(lead, interval):
+    assert refresh_interval(record_with_sale(NOW + lead), NOW) == interval
+
+
+def test_refresh_interval_uses_the_start_of_a_parsed_sale_window(corpus):
+    entry = next(entry for entry in corpus if entry["url"].endswith("/26_bus"))
+    record = parse_payload(entry["url"], entry["payload"])
+    now = datetime(2026, 3, 18, 10, 30)
+
+    assert "2026/03/18(三) 11 00 ~ 23:59" in record["sale_time"]
+    assert next_sale_start(record, now) == datetime(2026, 3, 18, 11, 0)
+    assert refresh_interval(record, now) == 120.0
+    assert next_sale_start(record, datetime(2026, 3, 18, 12, 30)) == datetime(2026, 3, 19, 11, 0)
+
+
+def test_refresh_interval_without_sale_time():
+    assert refresh_interval({"event_time": "2026/12/24 19:00"}, NOW) == IDLE_REFRESH_SECONDS
+
+
+def test_event_is_over_after_retire_window():
+    assert event_is_over({"event_time": "2026/10/15 19:00"}, NOW)
+    assert not event_is_over({"event_time": "2026/10/17 10:00"}, NOW)
+    assert not event_is_over({}, NOW)
+
+
+def test_plan_schedules_by_the_sale_tier():
+    scheduler = RescrapeScheduler()
+    now = NOW.timestamp()
+
+    due = scheduler.plan("a", record_with_sale(NOW + timedelta(days=3)), fetched_at=now - 600, now=now)
+
+    assert scheduler.intervals["a"] == 6 * 3600.0
+    assert due == now - 600 + 6 * 3600.0
+
+
+def test_plan_fetches_unknown_links_now_and_retires_finished_events():
+    scheduler = RescrapeScheduler()
+    now = NOW.timestamp()
+
+    assert scheduler.plan("new", None, None, now) == now
+    assert scheduler.plan("over", {"event_time": "2026/10/01 19:00"}, now - 60, now) is None
+    assert len(scheduler) == 1
+    assert scheduler.pop_due(now) == "new"
+    assert scheduler.pop_due(now) is None
+
+
+def test_pop_due_prefers_shorter_intervals_and_skips_stale_entries():
+    scheduler = RescrapeScheduler()
+    now = NOW.timestamp()
+    scheduler.plan("idle", {"event_time": "2026/12/24 19:00"}, now - IDLE_REFRESH_SECONDS - 10, now)
+    scheduler.plan("hot", record_with_sale(NOW + timedelta(minutes=10)), now - 300, now)
+    scheduler.plan("moved", None, None, now)
+    scheduler.defer("moved", now)
+
+    assert scheduler.next_due_at() == now - 180
+    assert scheduler.pop_due(now) == "hot"
+    assert scheduler.pop_due(now) == "idle"
+    assert scheduler.pop_due(now) is None
+    assert scheduler.next_due_at() == now + RETRY_DELAY_SECONDS
+    assert scheduler.pop_due(now + RETRY_DELAY_SECONDS) == "moved"
+
+
+def test_sync_links_adds_new_and_retires_dropped_links():
+    scheduler = RescrapeScheduler()
+    now = NOW.timestamp()
+    scheduler.sync_links(["a", "b"], {}, {}, now)
+
+    added = scheduler.sync_links(["b", "c"], {}, {}, now)
+
+    assert added == ["c"]
+    assert len(scheduler) == 2
+    assert [scheduler.pop_due(now), scheduler.pop_due(now), scheduler.pop_due(now)] == ["b", "c", None]
+
+
+def test_budget_wait_enforces_requests_per_hour():
+    scheduler = RescrapeScheduler(requests_per_hour=2)
+
+    scheduler.spend(100.0)
+    assert scheduler.budget_wait(100.0) == 0.0
+    scheduler.spend(200.0)
+    assert scheduler.budget_wait(300.0) == 100.0 + BUDGET_WINDOW_SECONDS - 300.0
+    assert scheduler.budget_wait(100.0 + BUDGET_WINDOW_SECONDS) == 0.0
+
+
+def test_listing_retry_is_capped_by_the_listing_interval(monkeypatch):
+    scheduler = RescrapeScheduler(listing_interval_seconds=1800.0)
+    assert scheduler.listing_is_due(0.0)
+
+    scheduler.listing_fetched(0.0)
+    assert not scheduler.listing_is_due(1799.0)
+    assert scheduler.listing_failed(1800.0) == 1800.0 + RETRY_DELAY_SECONDS
+
+    monkeypatch.setattr(tixcraft_scheduler, "RETRY_DELAY_SECONDS", 3600.0)
+    assert scheduler.listing_failed(0.0) == 1800.0
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import queue
+
+import tixcraft_scheduler
+from conftest import FakeHttpFetcher
+from tixcraft_http_fetcher import HttpFetchError
+from tixcraft_scheduler import RescrapeScheduler
+
+
+def test_http_failure_without_selenium_is_recorded(corpus, make_scraper):
+    payloads = {entry["url"]: entry["payload"] for entry in corpus[:3]}
+    broken = list(payloads)[1]
+    fetcher = FakeHttpFetcher(payloads, errors={broken: HttpFetchError(f"HTTP 500 for {broken}", status=500)})
+    scraper = make_scraper(fetcher, fetch_retries=1)
+    scraper._selenium_available = False
+
+    result = scraper.scrape_all_events()
+
+    assert fetcher.fetched.count(broken) == 2
+    assert [record["event_link"] for record in result["events"]] == [list(payloads)[0], list(payloads)[2]]
+    assert result["failures"][0]["event_link"] == broken
+    assert result["failures"][0]["error_type"] == "HttpFetchError"
+    assert scraper.driver is None
+
+
+class FakeWebDriverError(Exception):
+    pass
+
+
+class FakeTimeout(FakeWebDriverError):
+    pass
+
+
+def browser_scraper(make_scraper, errors):
+    scraper = make_scraper(FakeHttpFetcher({}), fetch_retries=3)
+    scraper.retryable_errors = (*scraper.retryable_errors, FakeWebDriverError)
+    scraper.throttle.timeout_errors = (FakeTimeout, TimeoutError)
+    replaced = []
+
+    def fetch(url, driver=None):
+        if errors:
+            raise errors.pop(0)
+        return {"title": "ok", "driver": driver}
+
+    def replace(driver, reason):
+        replaced.append(reason)
+        return f"{driver}-new"
+
+    scraper._fetch_payload = fetch
+    scraper._replace_driver = replace
+    return scraper, replaced
+
+
+def test_timeouts_retry_on_the_same_driver(make_scraper):
+    errors = [FakeTimeout("timeout: Timed out receiving message from renderer"), FakeWebDriverError("stale element")]
+    scraper, replaced = browser_scraper(make_scraper, errors)
+
+    payload, driver = scraper._fetch_with_retries("https://example.com/a", "chrome-1")
+
+    assert replaced == []
+    assert driver == "chrome-1"
+    assert payload == {"title": "ok", "driver": "chrome-1"}
+
+
+def test_dead_sessions_replace_the_driver(make_scraper):
+    errors = [
+        FakeWebDriverError("invalid session id"),
+        FakeWebDriverError("unknown error: session deleted because of page crash"),
+    ]
+    scraper, replaced = browser_scraper(make_scraper, errors)
+
+    payload, driver = scraper._fetch_with_retries("https://example.com/a", "chrome-1")
+
+    assert len(replaced) == 2
+    assert driver == "chrome-1-new-new"
+    assert payload["driver"] == driver
+
+
+def test_schedule_survives_listing_refresh_errors(corpus, make_scraper, monkeypatch):
+    monkeypatch.setattr(tixcraft_scheduler, "RETRY_DELAY_SECONDS", 0.0)
+    payloads = {entry["url"]: entry["payload"] for entry in corpus[:2]}
+    errors = [FakeWebDriverError("chrome not reachable"), FakeTimeout("listing timed out")]
+    scraper = make_scraper(FakeHttpFetcher(payloads, listing_errors=errors), readiness_poll_seconds=0)
+    scraper.retryable_errors = (*scraper.retryable_errors, FakeWebDriverError)
+    scraper.throttle.timeout_errors = (FakeTimeout, TimeoutError)
+    replaced = []
+    scraper._replace_driver = lambda driver, reason: replaced.append(reason)
+
+    result = scraper.run_schedule(RescrapeScheduler(), max_fetches=2)
+
+    assert result["fetched"] == 2
+    assert replaced == ["FakeWebDriverError on listing refresh"]
+
+
+def test_schedule_charges_the_budget_for_every_attempt(corpus, make_scraper):
+    payloads = {entry["url"]: entry["payload"] for entry in corpus[:2]}
+    broken = list(payloads)[1]
+    fetcher = FakeHttpFetcher(payloads, errors={broken: HttpFetchError(f"HTTP 500 for {broken}", status=500)})
+    scraper = make_scraper(fetcher, fetch_retries=2, readiness_poll_seconds=0)
+    scraper._selenium_available = False
+    scheduler = RescrapeScheduler(requests_per_hour=100)
+
+    result = scraper.run_schedule(scheduler, max_fetches=2)
+
+    assert (result["fetched"], result["failed"]) == (1, 1)
+    assert fetcher.fetched.count(broken) == 3
+    assert len(scheduler._spent) == 1 + len(fetcher.fetched)
+    assert scraper.request_budget is None
+
+
+def test_tab_requeues_wait_for_the_backoff(make_scraper):
+    scraper = make_scraper(FakeHttpFetcher({}), fetch_retries=2, retry_backoff_seconds=60)
+    pending = queue.Queue()
+
+    scraper._requeue_or_fail("https://example.com/a", FakeTimeout("page load timed out"), pending)
+
+    assert pending.get_nowait() == "https://example.com/a"
+    assert not scraper._retry_due("https://example.com/a")
+    assert scraper._retry_due("https://example.com/b")
+    scraper._retry_at["https://example.com/a"] -= 60
+    assert scraper._retry_due("https://example.com/a")
+    assert scraper._retry_due("https://example.com/a")
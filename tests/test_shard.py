@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tixcraft_output import write_output
+from tixcraft_shard import merge_shards, select_shard, shard_metadata, shard_of
+
+LINKS = [f"https://tixcraft.com/activity/detail/26_event{number:02d}" for number in range(40)]
+
+
+def write_shards(tmp_path, count: int, indexes: list[int] | None = None) -> list:
+    paths = []
+    for index in range(count) if indexes is None else indexes:
+        path = tmp_path / f"shard-{index}.json"
+        selected = select_shard(LINKS, index, count)
+        records = [{"event_link": link, "event_name": link.rsplit("_", 1)[1]} for link in selected[1:]]
+        failures = [{"event_link": link, "error": "timeout"} for link in selected[:1]]
+        write_output(path, records, failures, shard=shard_metadata(index, count, LINKS))
+        paths.append(path)
+    return paths
+
+
+def test_shard_assignment_is_stable_and_partitions_links():
+    shards = [select_shard(LINKS, index, 4) for index in range(4)]
+
+    assert sorted(link for shard in shards for link in shard) == sorted(LINKS)
+    assert all(shards)
+    assert [shard_of(link, 4) for link in LINKS] == [shard_of(link, 4) for link in LINKS]
+    assert select_shard(LINKS, 0, 1) == LINKS
+
+
+def test_merge_restores_listing_order(tmp_path):
+    paths = write_shards(tmp_path, 3)
+    output_path = tmp_path / "merged.json"
+
+    result = merge_shards(list(reversed(paths)), output_path)
+
+    merged = json.loads(output_path.read_text(encoding="utf-8"))
+    merged_links = [record["event_link"] for record in merged["events"]]
+    failed_links = [failure["event_link"] for failure in merged["failures"]]
+    assert merged_links == [link for link in LINKS if link not in failed_links]
+    assert failed_links == [link for link in LINKS if link in failed_links]
+    assert len(failed_links) == 3
+    assert result["shards"] == [0, 1, 2]
+    assert result["missing_shards"] == []
+    assert "shard" not in merged
+
+
+def test_merge_rejects_missing_shards_unless_partial(tmp_path):
+    paths = write_shards(tmp_path, 3, [0, 2])
+
+    with pytest.raises(ValueError, match="1/3"):
+        merge_shards(paths, tmp_path / "merged.json")
+    result = merge_shards(paths, tmp_path / "merged.json", allow_partial=True)
+
+    assert result["missing_shards"] == [1]
+    assert {record["event_link"] for record in result["events"]} <= set(LINKS) - set(select_shard(LINKS, 1, 3))
+
+
+def test_merge_rejects_inconsistent_shards(tmp_path):
+    three = write_shards(tmp_path / "three", 3)
+    two = write_shards(tmp_path / "two", 2)
+
+    with pytest.raises(ValueError, match="Duplicate"):
+        merge_shards([three[0], three[0], three[1], three[2]], tmp_path / "merged.json")
+    with pytest.raises(ValueError, match="shard count"):
+        merge_shards([three[0], two[1]], tmp_path / "merged.json")
+
+    plain = tmp_path / "plain.json"
+    write_output(plain, [], [])
+    with pytest.raises(ValueError, match="no shard metadata"):
+        merge_shards([plain], tmp_path / "merged.json")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import random
+
+from tixcraft_parser import KEYWORD_INDEX
+from tixcraft_text import KeywordIndex, clean_text, compact_lower, compact_text, lower_text
+
+TABLES = {
+    "fruit": ("apple", "pineapple", "app"),
+    "sale": ("售票", "開賣時間", "pre-sale"),
+    "overlap": ("le", "ea", "pp"),
+}
+
+
+def naive_categories(tables: dict[str, tuple[str, ...]], text: str) -> frozenset[str]:
+    return frozenset(category for category, keywords in tables.items() if any(keyword in text for keyword in keywords))
+
+
+def test_clean_text_normalizes_widths_and_blank_lines():
+    assert clean_text("票價：　NT$800\r\n\n\n｜ VIP​") == "票價: NT$800\n: VIP"
+    assert clean_text(None) == ""
+    assert lower_text("Ticket  PRICE") == "ticket price"
+    assert compact_text(" A \n B ") == "AB"
+    assert compact_lower(" Pre Sale ") == "presale"
+
+
+def test_keyword_index_matches_naive_scan():
+    index = KeywordIndex(TABLES)
+    alphabet = list("aplein售票開賣時間-s ")
+    generator = random.Random(7)
+    samples = ["", "pineapple pre-sale", "開賣時間：03/04", "applepp", "售", "leap"]
+    samples.extend("".join(generator.choice(alphabet) for _ in range(generator.randint(0, 24))) for _ in range(500))
+
+    for text in samples:
+        assert index.categories(text) == naive_categories(TABLES, text), text
+
+
+def test_parser_keyword_index_matches_naive_scan_on_corpus(corpus):
+    import tixcraft_parser
+
+    tables = {
+        "generic_artist": tixcraft_parser.GENERIC_ARTIST_KEYWORDS,
+        "generic_artist_title": tixcraft_parser.GENERIC_ARTIST_TITLE_KEYWORDS,
+        "artist_event": tixcraft_parser.ARTIST_EVENT_KEYWORDS,
+        "brand": tixcraft_parser.TITLE_BRAND_MARKERS,
+        "sport": tixcraft_parser.SPORT_CATEGORY_KEYWORDS,
+        "venue": tixcraft_parser.VENUE_KEYWORDS,
+        "sale_heading": tixcraft_parser.SALE_HEADING_KEYWORDS,
+        "sale_heading_noise": tixcraft_parser.SALE_HEADING_NOISE_KEYWORDS,
+        "price_noise": tixcraft_parser.PRICE_NOISE_KEYWORDS,
+    }
+    lines = {line for entry in corpus for line in (entry["payload"]["title"], *entry["payload"]["intro"].splitlines())}
+
+    for line in lines:
+        for text in (lower_text(line), compact_lower(line)):
+            assert KEYWORD_INDEX.categories(text) == naive_categories(tables, text), text
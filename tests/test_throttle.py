@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pytest
+
+from tixcraft_http_fetcher import HttpFetchError
+from tixcraft_throttle import AdaptiveThrottle, PageBlockedError, TokenBucket, looks_blocked
+
+
+def test_token_bucket_spends_burst_then_refills():
+    bucket = TokenBucket(rate=2.0, burst=2.0)
+    bucket.updated = 100.0
+
+    assert bucket.try_take(100.0)
+    assert bucket.try_take(100.0)
+    assert not bucket.try_take(100.0)
+    assert bucket.try_take(100.5)
+    assert bucket.reserve(100.5) == pytest.approx(0.5)
+
+
+def test_token_bucket_pause_blocks_until_deadline():
+    bucket = TokenBucket(rate=0.0)
+    bucket.pause(50.0)
+    bucket.pause(40.0)
+
+    assert not bucket.try_take(49.0)
+    assert bucket.try_take(50.0)
+    assert bucket.reserve(45.0) == 5.0
+
+
+def test_adaptive_limit_grows_additively_and_halves_on_failure():
+    throttle = AdaptiveThrottle(max_concurrency=8, min_concurrency=2, adaptive=True)
+    assert throttle.limit == 4.0
+
+    for _ in range(4):
+        throttle.release(throttle.acquire("ok"), "ok")
+    assert throttle.limit == pytest.approx(5.0, abs=0.1)
+
+    throttle.release(throttle.acquire("error"), "error")
+    assert throttle.limit == pytest.approx(2.5, abs=0.1)
+
+    throttle.release(throttle.acquire("timeout"), "timeout")
+    assert throttle.limit == 2.0
+    assert throttle.state()["ok_total"] == 4
+    assert throttle.state()["in_flight"] == 0
+
+
+def test_slow_response_backs_off_gently_and_only_once_per_window():
+    throttle = AdaptiveThrottle(max_concurrency=10, adaptive=True, latency_target_seconds=0.0)
+    first = throttle.acquire("a")
+    second = throttle.acquire("b")
+
+    throttle.release(first, "ok")
+    throttle.release(second, "ok")
+
+    assert throttle.counts["slow"] == 2
+    assert throttle.limit == pytest.approx(4.0)
+
+
+def test_fixed_throttle_ignores_outcomes():
+    throttle = AdaptiveThrottle(max_concurrency=3)
+
+    throttle.release(throttle.acquire("a"), "error")
+
+    assert throttle.limit == 3.0
+
+
+def test_blocked_pauses_the_bucket_and_doubles_the_cooldown():
+    throttle = AdaptiveThrottle(max_concurrency=2, block_cooldown_seconds=30.0)
+
+    throttle.release(throttle.acquire("a"), "blocked")
+    first_pause = throttle.bucket.paused_until
+    throttle.bucket.paused_until = 0.0
+    assert throttle.try_acquire("b") is not None
+    throttle.bucket.paused_until = first_pause
+
+    assert throttle.try_acquire("c") is None
+    assert throttle._cooldown == 60.0
+    throttle.bucket.paused_until = 0.0
+    throttle.release(throttle.acquire("d"), "ok")
+    assert throttle._cooldown == 30.0
+
+
+def test_slot_classifies_exceptions():
+    throttle = AdaptiveThrottle(max_concurrency=1)
+
+    with pytest.raises(HttpFetchError):
+        with throttle.slot("b"):
+            raise HttpFetchError("timed out") from TimeoutError()
+    with pytest.raises(HttpFetchError):
+        with throttle.slot("a"):
+            raise HttpFetchError("HTTP 429", status=429)
+
+    assert throttle.classify(PageBlockedError("blocked")) == "blocked"
+    assert throttle.classify(ValueError("boom")) == "error"
+    assert throttle.counts["blocked"] == 1
+    assert throttle.counts["timeout"] == 1
+    assert throttle.in_flight == 0
+
+
+def test_looks_blocked_only_for_empty_pages():
+    assert looks_blocked({"pageTitle": "Just a moment...", "title": "", "intro": ""})
+    assert not looks_blocked({"pageTitle": "Just a moment...", "title": "Concert", "intro": ""})
+    assert not looks_blocked({"pageTitle": "Concert", "title": "", "intro": ""})
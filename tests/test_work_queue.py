@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from tixcraft_work_queue import WorkQueue, collect
+
+
+@pytest.fixture
+def jobs(tmp_path):
+    queue = WorkQueue(tmp_path / "jobs.sqlite", max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_claims_follow_listing_order(jobs):
+    jobs.enqueue(["b", "a", "c"], now=0.0, run_id="run-1")
+
+    claims = [jobs.claim("worker", now=1.0) for _ in range(4)]
+
+    assert [claim and claim["event_link"] for claim in claims] == ["b", "a", "c", None]
+    assert claims[0] == {"event_link": "b", "position": 0, "run_id": "run-1", "attempt": 1}
+    assert jobs.counts(now=1.0)["leased"] == 3
+
+
+def test_expired_lease_is_reclaimed_and_late_result_is_ignored(jobs):
+    jobs.enqueue(["a"], now=0.0)
+    first = jobs.claim("slow-worker", lease_seconds=10.0, now=0.0)
+
+    assert jobs.claim("other", lease_seconds=10.0, now=5.0) is None
+    assert jobs.counts(now=11.0)["expired"] == 1
+    second = jobs.claim("other", lease_seconds=10.0, now=11.0)
+
+    assert first["attempt"] == 1
+    assert second["event_link"] == "a"
+    assert second["attempt"] == 2
+    assert not jobs.complete("a", "slow-worker", {"event_link": "a", "by": "slow"})
+    assert jobs.complete("a", "other", {"event_link": "a", "by": "other"})
+    assert jobs.results() == ([{"event_link": "a", "by": "other"}], [])
+
+
+def test_lease_expiry_fails_the_job_after_max_attempts(jobs):
+    jobs.enqueue(["a", "b"], now=0.0)
+    jobs.claim("w1", lease_seconds=10.0, now=0.0)
+    jobs.claim("w2", lease_seconds=10.0, now=11.0)
+
+    claim = jobs.claim("w3", lease_seconds=10.0, now=30.0)
+
+    records, failures = jobs.results()
+    assert claim["event_link"] == "b"
+    assert records == []
+    assert [(failure["event_link"], failure["error_type"], failure["attempts"]) for failure in failures] == [
+        ("a", "LeaseExpired", 2)
+    ]
+    assert jobs.counts(now=30.0)["failed"] == 1
+
+
+def test_enqueue_resets_jobs_and_drops_delisted_links(jobs):
+    jobs.enqueue(["a", "b"], now=0.0)
+    jobs.claim("w", now=0.0)
+    jobs.fail("a", "w", {"event_link": "a", "error": "boom"})
+
+    counts = jobs.enqueue(["c", "a"], now=1.0, run_id="run-2")
+
+    assert counts == {"enqueued": 2, "added": 1, "removed": 1}
+    assert jobs.counts(now=1.0)["pending"] == 2
+    assert jobs.claim("w", now=1.0) == {"event_link": "c", "position": 0, "run_id": "run-2", "attempt": 1}
+    assert jobs.claim("w", now=1.0)["attempt"] == 1
+
+
+def test_collect_writes_records_and_failures_in_order(tmp_path, jobs):
+    jobs.enqueue(["a", "b", "c"], now=0.0)
+    for _ in range(3):
+        jobs.claim("w")
+    jobs.complete("c", "w", {"event_link": "c"})
+    jobs.fail("b", "w", {"event_link": "b", "error": "boom"})
+    jobs.complete("a", "w", {"event_link": "a"})
+
+    result = collect(jobs.path, tmp_path / "out.json")
+
+    output = json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))
+    assert [record["event_link"] for record in output["events"]] == ["a", "c"]
+    assert output["failures"] == [{"event_link": "b", "error": "boom"}]
+    assert result["jobs"]["done"] == 2
+    assert result["jobs"]["failed"] == 1
+
+
+def test_queue_created_before_run_ids_is_migrated(tmp_path):
+    path = tmp_path / "jobs.sqlite"
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        """
+        CREATE TABLE jobs (
+            event_link TEXT PRIMARY KEY,
+            position INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            lease_owner TEXT,
+            lease_expires REAL,
+            enqueued_at REAL NOT NULL,
+            finished_at REAL,
+            record TEXT,
+            failure TEXT
+        );
+        INSERT INTO jobs (event_link, position, enqueued_at) VALUES ('old', 0, 0);
+        """
+    )
+    connection.close()
+
+    queue = WorkQueue(path)
+    try:
+        leftover = queue.claim("w", now=1.0)
+        queue.enqueue(["new"], now=2.0, run_id="run-2")
+        claim = queue.claim("w", now=2.0)
+    finally:
+        queue.close()
+
+    assert leftover == {"event_link": "old", "position": 0, "run_id": None, "attempt": 1}
+    assert claim == {"event_link": "new", "position": 0, "run_id": "run-2", "attempt": 1}
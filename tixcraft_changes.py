@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+
+def record_hash(record: dict[str, Any]) -> str:
+    canonical = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def load_previous_records(output_path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        previous = json.loads(output_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {
+        record["event_link"]: record
+        for record in previous.get("events", [])
+        if isinstance(record, dict) and record.get("event_link")
+    }
+
+
+def field_changes(before: dict[str, Any], after: dict[str, Any]) -> dict[str, list[Any]]:
+    return {
+        field: [before.get(field), after.get(field)]
+        for field in dict.fromkeys([*before, *after])
+        if before.get(field) != after.get(field)
+    }
+
+
+def iter_changes(
+    previous: dict[str, dict[str, Any]],
+    records: list[dict[str, Any]],
+    retained_links: Iterable[str] = (),
+) -> Iterator[dict[str, Any]]:
+    current = {record["event_link"]: record for record in records}
+    for link, record in current.items():
+        before = previous.get(link)
+        digest = record_hash(record)
+        if before is None:
+            yield {"type": "added", "event_link": link, "hash": digest, "record": record}
+            continue
+        previous_digest = record_hash(before)
+        if digest != previous_digest:
+            yield {
+                "type": "changed",
+                "event_link": link,
+                "hash": digest,
+                "previous_hash": previous_digest,
+                "changes": field_changes(before, record),
+            }
+    retained = set(retained_links)
+    for link, before in previous.items():
+        if link not in current and link not in retained:
+            yield {"type": "removed", "event_link": link, "previous_hash": record_hash(before)}
+
+
+def append_change_feed(path: Path, changes: Iterable[dict[str, Any]], scrape_time: str) -> dict[str, int]:
+    counts = {"added": 0, "changed": 0, "removed": 0}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        for change in changes:
+            counts[change["type"]] += 1
+            handle.write(json.dumps({"scrape_time": scrape_time, **change}, ensure_ascii=False, separators=(",", ":")))
+            handle.write("\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+    return counts
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with temp_path.open("w", encoding=encoding) as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def iter_checkpoint(path: Path) -> Iterator[dict[str, Any]]:
+    if not path.exists():
+        return
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and entry.get("event_link") and isinstance(entry.get("record"), dict):
+                yield entry
+
+
+def load_checkpoint(path: Path) -> dict[str, dict[str, Any]]:
+    return {entry["event_link"]: entry for entry in iter_checkpoint(path)}
+
+
+class CheckpointWriter:
+    def __init__(self, path: Path, fsync_every: int = 10, resume: bool = False):
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("a" if resume else "w", encoding="utf-8")
+        self._pending = 0
+
+    def write(self, url: str, record: dict[str, Any], fetched_at: float | None = None) -> None:
+        entry = {
+            "event_link": url,
+            "fetched_at": round(fetched_at if fetched_at is not None else time.time(), 3),
+            "record": record,
+        }
+        self._handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._handle.flush()
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        if self._handle.closed:
+            return
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._pending = 0
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        self.sync()
+        self._handle.close()
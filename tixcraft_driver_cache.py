@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_DRIVER_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "tixcraft_scraper" / "chromedriver.json"
+)
+DEFAULT_DRIVER_CACHE_MAX_AGE_HOURS = 24.0 * 7
+CHROME_BINARIES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+)
+CHROME_VERSION_RE = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+
+class ChromedriverUnavailableError(RuntimeError):
+    pass
+
+
+def installed_browser_version() -> str | None:
+    for binary in CHROME_BINARIES:
+        executable = shutil.which(binary) or (binary if os.path.isfile(binary) else None)
+        if not executable:
+            continue
+        try:
+            completed = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        match = CHROME_VERSION_RE.search(completed.stdout)
+        if match:
+            return match.group(0)
+    return None
+
+
+def major_version(version: str | None) -> str | None:
+    match = CHROME_VERSION_RE.search(version or "")
+    return match.group(1) if match else None
+
+
+class ChromedriverResolver:
+    def __init__(
+        self,
+        cache_path: Path = DEFAULT_DRIVER_CACHE_PATH,
+        override_path: Path | None = None,
+        offline: bool = False,
+        max_age_hours: float = DEFAULT_DRIVER_CACHE_MAX_AGE_HOURS,
+    ):
+        self.cache_path = cache_path
+        self.override_path = override_path
+        self.offline = offline
+        self.max_age_hours = max_age_hours
+        self.source: str | None = None
+        self._resolved_path: str | None = None
+        self._lock = threading.Lock()
+
+    def _load_cache(self) -> dict[str, Any]:
+        try:
+            cached = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return cached if isinstance(cached, dict) else {}
+
+    def _write_cache(self, cached: dict[str, Any]) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_name = f".{self.cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            temp_path = self.cache_path.with_name(temp_name)
+            temp_path.write_text(json.dumps(cached, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _store_cache(self, **values: Any) -> None:
+        self._write_cache({**self._load_cache(), **values})
+
+    def _cached_path(self) -> str | None:
+        cached = self._load_cache()
+        path = cached.get("path")
+        if not path or not Path(path).is_file():
+            return None
+        age_hours = (time.time() - float(cached.get("resolved_at") or 0)) / 3600
+        if not self.offline and age_hours > self.max_age_hours:
+            return None
+        cached_major = major_version(cached.get("chrome_version"))
+        if cached_major:
+            installed_major = major_version(installed_browser_version())
+            if installed_major and installed_major != cached_major:
+                return None
+        return path
+
+    def resolve(self) -> str:
+        with self._lock:
+            if self._resolved_path:
+                return self._resolved_path
+
+            if self.override_path:
+                if not self.override_path.is_file():
+                    raise ChromedriverUnavailableError(f"--chromedriver path does not exist: {self.override_path}")
+                self._resolved_path, self.source = str(self.override_path), "override"
+                return self._resolved_path
+
+            cached_path = self._cached_path()
+            if cached_path:
+                self._resolved_path, self.source = cached_path, "cache"
+                return cached_path
+
+            if self.offline:
+                on_path = shutil.which("chromedriver")
+                if not on_path:
+                    raise ChromedriverUnavailableError(
+                        "Offline mode needs a cached chromedriver, one on PATH, or an explicit --chromedriver path"
+                    )
+                self._resolved_path, self.source = on_path, "path"
+                self._store_cache(path=on_path, resolved_at=time.time())
+                return on_path
+
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            installed = ChromeDriverManager().install()
+            self._resolved_path, self.source = installed, "webdriver-manager"
+            self._store_cache(path=installed, resolved_at=time.time())
+            return installed
+
+    def record_browser_version(self, browser_version: str | None) -> None:
+        if not browser_version or self.source == "override":
+            return
+        if self._load_cache().get("chrome_version") != browser_version:
+            self._store_cache(chrome_version=browser_version)
+
+    def invalidate(self) -> bool:
+        with self._lock:
+            if self.offline or self.source != "cache":
+                return False
+            self._resolved_path = None
+            self.source = None
+            cached = self._load_cache()
+            cached.pop("path", None)
+            cached.pop("resolved_at", None)
+            self._write_cache(cached)
+            return True
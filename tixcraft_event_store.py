@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+
+DATE_TOKEN_RE = re.compile(
+    r"(?:(?P<year>\d{4})\s*(?:[./-]|年)\s*)?"
+    r"(?<![\d:])(?P<month>1[0-2]|0?[1-9])\s*(?:[./-]|月)\s*(?P<day>3[01]|[12]\d|0?[1-9])(?!\d)"
+)
+TIME_TOKEN_RE = re.compile(
+    r"(?P<prefix>[AaPp][Mm]|上午|中午|下午|晚上)?\s*(?<![\d:])(?P<hour>[01]?\d|2[0-3])"
+    r"(?:(?::|\s+)(?P<minute>[0-5]\d)(?!\d)(?:\s*(?P<suffix>[AaPp][Mm]))?|\s*(?P<bare>[AaPp][Mm])\b)"
+)
+RANGE_SEPARATOR_RE = re.compile(r"(?:[~～\-–—]|至)\s*$")
+AFTERNOON_MARKERS = {"pm", "下午", "晚上"}
+PRICE_AMOUNT_RE = re.compile(r"\d[\d,]*")
+SALE_STAGES_VERSION = 2
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    event_link TEXT PRIMARY KEY,
+    event_name TEXT NOT NULL,
+    venue_name TEXT COLLATE NOCASE,
+    address TEXT,
+    artist_name TEXT COLLATE NOCASE,
+    ticket_price TEXT,
+    ticket_types TEXT,
+    event_time TEXT,
+    sale_time TEXT,
+    event_start TEXT,
+    sale_start TEXT,
+    min_price INTEGER,
+    max_price INTEGER,
+    record TEXT NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_venue ON events (venue_name);
+CREATE INDEX IF NOT EXISTS events_artist ON events (artist_name);
+CREATE INDEX IF NOT EXISTS events_event_start ON events (event_start);
+CREATE INDEX IF NOT EXISTS events_sale_start ON events (sale_start);
+CREATE INDEX IF NOT EXISTS events_min_price ON events (min_price);
+CREATE INDEX IF NOT EXISTS events_max_price ON events (max_price);
+CREATE TABLE IF NOT EXISTS sale_stages (
+    event_link TEXT NOT NULL,
+    stage_start TEXT NOT NULL,
+    PRIMARY KEY (event_link, stage_start)
+);
+CREATE INDEX IF NOT EXISTS sale_stages_start ON sale_stages (stage_start);
+"""
+UPSERT_SQL = """
+INSERT INTO events (
+    event_link, event_name, venue_name, address, artist_name, ticket_price, ticket_types,
+    event_time, sale_time, event_start, sale_start, min_price, max_price, record, active, first_seen, last_seen
+) VALUES (
+    :event_link, :event_name, :venue_name, :address, :artist_name, :ticket_price, :ticket_types,
+    :event_time, :sale_time, :event_start, :sale_start, :min_price, :max_price, :record, 1, :seen, :seen
+)
+ON CONFLICT (event_link) DO UPDATE SET
+    event_name = excluded.event_name,
+    venue_name = excluded.venue_name,
+    address = excluded.address,
+    artist_name = excluded.artist_name,
+    ticket_price = excluded.ticket_price,
+    ticket_types = excluded.ticket_types,
+    event_time = excluded.event_time,
+    sale_time = excluded.sale_time,
+    event_start = excluded.event_start,
+    sale_start = excluded.sale_start,
+    min_price = excluded.min_price,
+    max_price = excluded.max_price,
+    record = excluded.record,
+    active = 1,
+    last_seen = excluded.last_seen
+"""
+
+
+def _resolve_year(month: int, day: int, reference: datetime, not_after: datetime | None = None) -> int | None:
+    candidates: list[datetime] = []
+    for year in (reference.year - 1, reference.year, reference.year + 1):
+        try:
+            candidates.append(datetime(year, month, day))
+        except ValueError:
+            continue
+    if not_after is not None:
+        candidates = [candidate for candidate in candidates if candidate <= not_after] or candidates
+    if not candidates:
+        return None
+    return min(candidates, key=lambda candidate: abs(candidate - reference)).year
+
+
+def _parse_time(match: re.Match[str]) -> tuple[int, int]:
+    hour, minute = int(match.group("hour")), int(match.group("minute") or 0)
+    marker = (match.group("suffix") or match.group("bare") or match.group("prefix") or "").lower()
+    if marker in AFTERNOON_MARKERS and hour < 12:
+        hour += 12
+    elif marker == "am" and hour == 12:
+        hour = 0
+    return hour, minute
+
+
+def parse_datetimes(
+    text: str | None,
+    reference: datetime | None = None,
+    not_after: datetime | None = None,
+    skip_range_ends: bool = False,
+) -> list[datetime]:
+    if not text:
+        return []
+    reference = reference or datetime.now()
+    matches = list(DATE_TOKEN_RE.finditer(text))
+    parsed: list[datetime] = []
+    for index, match in enumerate(matches):
+        if skip_range_ends and index and RANGE_SEPARATOR_RE.search(text, matches[index - 1].end(), match.start()):
+            continue
+        month, day = int(match.group("month")), int(match.group("day"))
+        year = int(match.group("year")) if match.group("year") else _resolve_year(month, day, reference, not_after)
+        if year is None:
+            continue
+
+        hour = minute = 0
+        segment_end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        time_match = TIME_TOKEN_RE.search(text, match.end(), segment_end)
+        if time_match:
+            hour, minute = _parse_time(time_match)
+        try:
+            parsed.append(datetime(year, month, day, hour, minute))
+        except ValueError:
+            continue
+    return parsed
+
+
+def sale_datetimes(record: dict[str, Any], reference: datetime | None = None) -> list[datetime]:
+    event_moments = parse_datetimes(record.get("event_time"), reference)
+    not_after = max(event_moments) if event_moments else None
+    return sorted(parse_datetimes(record.get("sale_time"), reference, not_after, skip_range_ends=True))
+
+
+def earliest_datetime(text: str | None, reference: datetime | None = None) -> str | None:
+    parsed = parse_datetimes(text, reference)
+    return min(parsed).isoformat(timespec="minutes") if parsed else None
+
+
+def price_range(ticket_price: str | None) -> tuple[int | None, int | None]:
+    amounts = [int(token.replace(",", "")) for token in PRICE_AMOUNT_RE.findall(ticket_price or "")]
+    amounts = [amount for amount in amounts if amount > 0]
+    if not amounts:
+        return None, None
+    return min(amounts), max(amounts)
+
+
+class EventStore:
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        backfill = self._table_exists("events") and (
+            version < SALE_STAGES_VERSION or not self._table_exists("sale_stages")
+        )
+        self.connection.executescript(SCHEMA)
+        if backfill:
+            self._backfill_sale_stages()
+        self.connection.execute(f"PRAGMA user_version = {SALE_STAGES_VERSION}")
+
+    def _table_exists(self, name: str) -> bool:
+        row = self.connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,))
+        return row.fetchone() is not None
+
+    def _backfill_sale_stages(self) -> None:
+        rows = self.connection.execute("SELECT event_link, record, last_seen FROM events").fetchall()
+        with self.connection:
+            for row in rows:
+                stages = sale_datetimes(json.loads(row["record"]), datetime.fromisoformat(row["last_seen"]))
+                self._write_sale_stages(row["event_link"], stages)
+                self.connection.execute(
+                    "UPDATE events SET sale_start = ? WHERE event_link = ?",
+                    (stages[0].isoformat(timespec="minutes") if stages else None, row["event_link"]),
+                )
+
+    def _write_sale_stages(self, event_link: str, stages: list[datetime]) -> None:
+        self.connection.execute("DELETE FROM sale_stages WHERE event_link = ?", (event_link,))
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO sale_stages (event_link, stage_start) VALUES (?, ?)",
+            [(event_link, stage.isoformat(timespec="minutes")) for stage in stages],
+        )
+
+    def _row_values(
+        self,
+        record: dict[str, Any],
+        stages: list[datetime],
+        reference: datetime,
+        seen: str,
+    ) -> dict[str, Any]:
+        min_price, max_price = price_range(record.get("ticket_price"))
+        return {
+            "event_link": record["event_link"],
+            "event_name": record.get("event_name") or "",
+            "venue_name": record.get("venue_name"),
+            "address": record.get("address"),
+            "artist_name": record.get("artist_name"),
+            "ticket_price": record.get("ticket_price"),
+            "ticket_types": record.get("ticket_types"),
+            "event_time": record.get("event_time"),
+            "sale_time": record.get("sale_time"),
+            "event_start": earliest_datetime(record.get("event_time"), reference),
+            "sale_start": stages[0].isoformat(timespec="minutes") if stages else None,
+            "min_price": min_price,
+            "max_price": max_price,
+            "record": json.dumps(record, ensure_ascii=False),
+            "seen": seen,
+        }
+
+    def sync(
+        self,
+        records: Iterable[dict[str, Any]],
+        scraped_at: datetime | None = None,
+        retained_links: Iterable[str] = (),
+        deactivate_missing: bool = True,
+    ) -> int:
+        scraped_at = scraped_at or datetime.now()
+        seen = scraped_at.isoformat(timespec="seconds")
+        records = [record for record in records if record.get("event_link")]
+        stages = {record["event_link"]: sale_datetimes(record, scraped_at) for record in records}
+        rows = [self._row_values(record, stages[record["event_link"]], scraped_at, seen) for record in records]
+        with self.connection:
+            self.connection.executemany(UPSERT_SQL, rows)
+            for event_link, event_stages in stages.items():
+                self._write_sale_stages(event_link, event_stages)
+            self.connection.executemany(
+                "UPDATE events SET last_seen = ? WHERE event_link = ?",
+                [(seen, link) for link in retained_links],
+            )
+            if deactivate_missing:
+                self.connection.execute("UPDATE events SET active = 0 WHERE last_seen <> ?", (seen,))
+        return len(rows)
+
+    def query(
+        self,
+        venue: str | None = None,
+        artist: str | None = None,
+        keyword: str | None = None,
+        event_from: datetime | None = None,
+        event_to: datetime | None = None,
+        sale_from: datetime | None = None,
+        sale_to: datetime | None = None,
+        min_price: int | None = None,
+        max_price: int | None = None,
+        include_inactive: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if not include_inactive:
+            clauses.append("active = 1")
+        if venue:
+            clauses.append("venue_name = ?")
+            params.append(venue)
+        if artist:
+            clauses.append("artist_name = ?")
+            params.append(artist)
+        if keyword:
+            clauses.append("(event_name LIKE ? OR venue_name LIKE ? OR artist_name LIKE ?)")
+            params.extend([f"%{keyword}%"] * 3)
+        for operator, value in ((">=", event_from), ("<", event_to)):
+            if value is not None:
+                clauses.append(f"event_start {operator} ?")
+                params.append(value.isoformat(timespec="minutes"))
+        stage_clauses = ["stages.event_link = events.event_link"]
+        stage_params: list[Any] = []
+        for operator, value in ((">=", sale_from), ("<", sale_to)):
+            if value is not None:
+                stage_clauses.append(f"stages.stage_start {operator} ?")
+                stage_params.append(value.isoformat(timespec="minutes"))
+        if stage_params:
+            clauses.append(f"EXISTS (SELECT 1 FROM sale_stages AS stages WHERE {' AND '.join(stage_clauses)})")
+            params.extend(stage_params)
+        if min_price is not None:
+            clauses.append("max_price >= ?")
+            params.append(min_price)
+        if max_price is not None:
+            clauses.append("min_price <= ?")
+            params.append(max_price)
+
+        sale_column = "sale_start"
+        select_params: list[Any] = []
+        if sale_from is not None:
+            sale_column = (
+                "(SELECT MIN(stages.stage_start) FROM sale_stages AS stages "
+                "WHERE stages.event_link = events.event_link AND stages.stage_start >= ?)"
+            )
+            select_params.append(sale_from.isoformat(timespec="minutes"))
+        sql = (
+            f"SELECT record, event_start, {sale_column} AS next_sale_start, min_price, max_price, "
+            "(SELECT json_group_array(stage_start) FROM (SELECT stage_start FROM sale_stages AS stages "
+            "WHERE stages.event_link = events.event_link ORDER BY stage_start)) AS sale_stages FROM events"
+        )
+        params = [*select_params, *params]
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY COALESCE(next_sale_start, event_start, '9999'), event_link"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [
+            {
+                **json.loads(row["record"]),
+                "event_start": row["event_start"],
+                "sale_start": row["next_sale_start"],
+                "sale_stages": json.loads(row["sale_stages"]),
+                "min_price": row["min_price"],
+                "max_price": row["max_price"],
+            }
+            for row in self.connection.execute(sql, params)
+        ]
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+import codecs
+import gzip
+import json
+import re
+import threading
+import zlib
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin, urlsplit
+
+if TYPE_CHECKING:
+    import http.client
+
+
+FETCHERS = ("selenium", "http")
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36"
+)
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "zh-TW,zh;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+BLOCK_TAGS = {
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "br",
+    "dd",
+    "div",
+    "dl",
+    "dt",
+    "figcaption",
+    "footer",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "hr",
+    "li",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "td",
+    "th",
+    "tr",
+    "ul",
+}
+TABLE_CELL_TAGS = {"td", "th"}
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+SKIPPED_TAGS = {"script", "style", "noscript", "template"}
+P_CLOSING_TAGS = (BLOCK_TAGS - {"br", "dd", "dt", "li", "td", "th", "tr"}) | {
+    "details",
+    "fieldset",
+    "figure",
+    "form",
+    "main",
+    "menu",
+    "nav",
+}
+IMPLIED_END_TAGS = {
+    "li": (frozenset({"li"}), frozenset({"ol", "ul"})),
+    "dt": (frozenset({"dd", "dt"}), frozenset({"dl"})),
+    "dd": (frozenset({"dd", "dt"}), frozenset({"dl"})),
+    "tr": (frozenset({"td", "th", "tr"}), frozenset({"table", "tbody", "tfoot", "thead"})),
+    "td": (frozenset({"td", "th"}), frozenset({"table", "tr"})),
+    "th": (frozenset({"td", "th"}), frozenset({"table", "tr"})),
+    "thead": (frozenset({"tbody", "td", "tfoot", "th", "thead", "tr"}), frozenset({"table"})),
+    "tbody": (frozenset({"tbody", "td", "tfoot", "th", "thead", "tr"}), frozenset({"table"})),
+    "tfoot": (frozenset({"tbody", "td", "tfoot", "th", "thead", "tr"}), frozenset({"table"})),
+    "option": (frozenset({"option"}), frozenset({"datalist", "select"})),
+}
+SCOPE_BOUNDARY_TAGS = {"button", "caption", "html", "object", "table", "template"}
+TEXT_TARGET_IDS = ("synopsisEventTitle", "intro")
+DATA_LAYER_PUSH_RE = re.compile(r"dataLayer\s*\.\s*push\s*\(")
+JS_BARE_KEY_RE = re.compile(r"([{,]\s*)([A-Za-z_$][\w$]*)(\s*:)")
+JS_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+CELL_SEPARATOR_RE = re.compile(r" *\t *")
+JSON_STRING_ESCAPES = {'"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+MAX_REDIRECTS = 5
+
+
+class HttpFetchError(RuntimeError):
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+class DetailPageParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.texts: dict[str, list[str]] = {target: [] for target in TEXT_TARGET_IDS}
+        self.title_parts: list[str] = []
+        self.scripts: list[str] = []
+        self.listing_cards: list[dict[str, str]] = []
+        self._captures: list[tuple[str, int]] = []
+        self._stack: list[str] = []
+        self._row_cells: list[int] = []
+        self._skip_depth: int | None = None
+        self._in_title = False
+        self._script_parts: list[str] | None = None
+        self._thumbnail_depths: list[int] = []
+        self._card_regions: list[list[dict[str, list[str]]]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = {name: value or "" for name, value in attrs}
+        self._close_implied(tag)
+        if tag == "title":
+            self._in_title = True
+        if tag == "script":
+            self._script_parts = []
+        if self._card_regions:
+            card = self._card(fresh=len(self._stack) == self._thumbnail_depths[-1])
+            if tag == "a" and attributes.get("href") and attributes["href"] not in card["hrefs"]:
+                card["hrefs"].append(attributes["href"])
+            if tag == "img" and attributes.get("src"):
+                card["images"].append(attributes["src"])
+        if tag in TABLE_CELL_TAGS:
+            self._start_cell()
+        elif tag in BLOCK_TAGS:
+            self._break_line()
+
+        if tag in VOID_TAGS:
+            return
+
+        self._stack.append(tag)
+        if tag == "tr":
+            self._row_cells.append(0)
+        depth = len(self._stack)
+        if tag in SKIPPED_TAGS and self._skip_depth is None:
+            self._skip_depth = depth
+        element_id = attributes.get("id", "")
+        if element_id in self.texts:
+            self._captures.append((element_id, depth))
+        if tag == "div" and "thumbnails" in attributes.get("class", "").split():
+            self._thumbnail_depths.append(depth)
+            self._card_regions.append([])
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        if tag == "script" and self._script_parts is not None:
+            self.scripts.append("".join(self._script_parts))
+            self._script_parts = None
+        if tag in VOID_TAGS:
+            return
+
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index] == tag:
+                self._pop_to(index)
+                return
+            if tag not in BLOCK_TAGS and self._stack[index] in BLOCK_TAGS:
+                return
+
+    def _close_implied(self, tag: str) -> None:
+        closes, boundaries = IMPLIED_END_TAGS.get(tag, (frozenset(), frozenset()))
+        if tag in P_CLOSING_TAGS:
+            closes = closes | {"p"}
+        if not closes:
+            return
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index] in closes:
+                self._pop_to(index)
+                return
+            if self._stack[index] in boundaries or self._stack[index] in SCOPE_BOUNDARY_TAGS:
+                return
+
+    def _pop_to(self, index: int) -> None:
+        while len(self._stack) > index:
+            depth = len(self._stack)
+            tag = self._stack.pop()
+            if tag == "tr" and self._row_cells:
+                self._row_cells.pop()
+            if tag in BLOCK_TAGS and tag not in TABLE_CELL_TAGS:
+                self._break_line()
+            if self._skip_depth == depth:
+                self._skip_depth = None
+            while self._captures and self._captures[-1][1] >= depth:
+                self._captures.pop()
+            while self._thumbnail_depths and self._thumbnail_depths[-1] >= depth:
+                self._thumbnail_depths.pop()
+                self._close_card_region(self._card_regions.pop())
+
+    def handle_data(self, data: str) -> None:
+        if self._script_parts is not None:
+            self._script_parts.append(data)
+        if self._in_title:
+            self.title_parts.append(data)
+        if self._skip_depth is not None:
+            return
+        if self._card_regions:
+            self._card()["text"].append(data)
+        self._append_text(re.sub(r"\s+", " ", data))
+
+    def close(self) -> None:
+        super().close()
+        while self._card_regions:
+            self._close_card_region(self._card_regions.pop())
+
+    def _card(self, fresh: bool = False) -> dict[str, list[str]]:
+        segments = self._card_regions[-1]
+        if fresh or not segments:
+            segments.append({"hrefs": [], "text": [], "images": []})
+        return segments[-1]
+
+    def _close_card_region(self, segments: list[dict[str, list[str]]]) -> None:
+        if len({href for segment in segments for href in segment["hrefs"]}) <= 1:
+            segments = [{key: [item for segment in segments for item in segment[key]] for key in ("hrefs", "text", "images")}]
+        for segment in segments:
+            text = " ".join("".join(segment["text"]).split())
+            image = segment["images"][0] if segment["images"] else ""
+            for href in dict.fromkeys(segment["hrefs"]):
+                self.listing_cards.append({"href": href, "text": text, "image": image})
+
+    def _start_cell(self) -> None:
+        if not self._row_cells:
+            self._break_line()
+            return
+        if self._row_cells[-1]:
+            self._break_line("\t")
+        self._row_cells[-1] += 1
+
+    def _break_line(self, separator: str = "\n") -> None:
+        if self._card_regions:
+            self._card()["text"].append(separator)
+        self._append_text(separator)
+
+    def _append_text(self, text: str) -> None:
+        for element_id, _ in self._captures:
+            self.texts[element_id].append(text)
+
+    def inner_text(self, element_id: str) -> str:
+        lines = (line.strip(" ") for line in "".join(self.texts[element_id]).split("\n"))
+        return "\n".join(CELL_SEPARATOR_RE.sub("\t", line) for line in lines if line.strip())
+
+
+def _find_balanced_object(text: str, start: int) -> str | None:
+    open_index = text.find("{", start)
+    if open_index < 0:
+        return None
+
+    depth = 0
+    quote: str | None = None
+    escaped = False
+    for index in range(open_index, len(text)):
+        char = text[index]
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+            continue
+        if char in "'\"`":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[open_index : index + 1]
+    return None
+
+
+def _js_object_to_json(source: str) -> str:
+    converted: list[str] = []
+    code: list[str] = []
+    index = 0
+    while index < len(source):
+        char = source[index]
+        if char not in "'\"`":
+            code.append(char)
+            index += 1
+            continue
+
+        converted.append(JS_TRAILING_COMMA_RE.sub(r"\1", JS_BARE_KEY_RE.sub(r'\1"\2"\3', "".join(code))))
+        code = []
+        quote = char
+        index += 1
+        value: list[str] = []
+        while index < len(source) and source[index] != quote:
+            if source[index] == "\\" and index + 1 < len(source):
+                escaped = source[index + 1]
+                value.append(escaped if escaped in "'`\"" else source[index : index + 2])
+                index += 2
+                continue
+            value.append(source[index])
+            index += 1
+        index += 1
+        converted.append('"' + "".join(JSON_STRING_ESCAPES.get(part, part) for part in value) + '"')
+
+    converted.append(JS_TRAILING_COMMA_RE.sub(r"\1", JS_BARE_KEY_RE.sub(r'\1"\2"\3', "".join(code))))
+    return "".join(converted)
+
+
+def extract_data_layer_detail(scripts: list[str], event_name: str = "EnterActivityDetail") -> dict[str, Any]:
+    for script in scripts:
+        if event_name not in script:
+            continue
+        for match in DATA_LAYER_PUSH_RE.finditer(script):
+            source = _find_balanced_object(script, match.end())
+            if not source or event_name not in source:
+                continue
+            for candidate in (source, _js_object_to_json(source)):
+                try:
+                    detail = json.loads(candidate)
+                except ValueError:
+                    continue
+                if isinstance(detail, dict) and detail.get("event") == event_name:
+                    return detail
+    return {}
+
+
+def parse_detail_html(html: str, url: str) -> dict[str, Any]:
+    parser = DetailPageParser()
+    parser.feed(html)
+    parser.close()
+    return {
+        "title": parser.inner_text("synopsisEventTitle"),
+        "intro": parser.inner_text("intro"),
+        "pageTitle": re.sub(r"\s+", " ", "".join(parser.title_parts)).strip(),
+        "currentUrl": url,
+        "dataLayer": extract_data_layer_detail(parser.scripts),
+    }
+
+
+def parse_listing_html(html: str, url: str) -> list[dict[str, str]]:
+    parser = DetailPageParser()
+    parser.feed(html)
+    parser.close()
+    return [
+        {**card, "href": urljoin(url, card["href"]), "image": urljoin(url, card["image"]) if card["image"] else ""}
+        for card in parser.listing_cards
+    ]
+
+
+class HttpPayloadFetcher:
+    def __init__(self, timeout_seconds: float = 20, headers: dict[str, str] | None = None):
+        self.timeout_seconds = timeout_seconds
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[http.client.HTTPConnection] = []
+
+    def _connection(self, scheme: str, netloc: str, fresh: bool = False) -> http.client.HTTPConnection:
+        import http.client
+
+        pool: dict[tuple[str, str], http.client.HTTPConnection] = self._local.__dict__.setdefault("pool", {})
+        key = (scheme, netloc)
+        connection = pool.get(key)
+        if connection is not None and not fresh:
+            return connection
+        if connection is not None:
+            connection.close()
+
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        connection = connection_class(netloc, timeout=self.timeout_seconds)
+        pool[key] = connection
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def _request(self, url: str) -> tuple[int, dict[str, str], bytes]:
+        import http.client
+
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        for attempt in range(2):
+            connection = self._connection(parts.scheme, parts.netloc, fresh=attempt > 0)
+            try:
+                connection.request("GET", path, headers=self.headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError, OSError) as exc:
+                if attempt == 0:
+                    continue
+                raise HttpFetchError(f"{type(exc).__name__}: {exc}") from exc
+            headers = {name.lower(): value for name, value in response.getheaders()}
+            if headers.get("connection", "").lower() == "close":
+                connection.close()
+            self._local.last_response_bytes = len(body)
+            return response.status, headers, body
+        raise HttpFetchError(f"Unable to fetch {url}")
+
+    def _decode_body(self, headers: dict[str, str], body: bytes) -> str:
+        encoding = headers.get("content-encoding", "").lower()
+        try:
+            if encoding == "gzip":
+                body = gzip.decompress(body)
+            elif encoding == "deflate":
+                body = zlib.decompress(body)
+        except (OSError, EOFError, zlib.error) as exc:
+            raise HttpFetchError(f"Corrupt {encoding} body ({type(exc).__name__}: {exc})") from exc
+
+        charset_match = re.search(r"charset=([\w-]+)", headers.get("content-type", ""), flags=re.IGNORECASE)
+        charset = charset_match.group(1) if charset_match else "utf-8"
+        try:
+            codecs.lookup(charset)
+        except LookupError:
+            charset = "utf-8"
+        return body.decode(charset, errors="replace")
+
+    def fetch_html(self, url: str) -> tuple[str, str]:
+        current_url = url
+        for _ in range(MAX_REDIRECTS + 1):
+            status, headers, body = self._request(current_url)
+            if status in {301, 302, 303, 307, 308} and headers.get("location"):
+                current_url = urljoin(current_url, headers["location"])
+                continue
+            if status != 200:
+                raise HttpFetchError(f"HTTP {status} for {current_url}", status=status)
+            return current_url, self._decode_body(headers, body)
+        raise HttpFetchError(f"Too many redirects for {url}")
+
+    def fetch(self, url: str) -> dict[str, Any]:
+        current_url, html = self.fetch_html(url)
+        payload = parse_detail_html(html, current_url)
+        if not payload["title"] and not payload["intro"]:
+            raise HttpFetchError(f"No #synopsisEventTitle or #intro in server-rendered HTML for {current_url}")
+        return payload
+
+    def fetch_listing(self, url: str) -> list[dict[str, str]]:
+        current_url, html = self.fetch_html(url)
+        cards = parse_listing_html(html, current_url)
+        if not cards:
+            raise HttpFetchError(f"No div.thumbnails links in server-rendered HTML for {current_url}")
+        return cards
+
+    def last_response_bytes(self) -> int | None:
+        return getattr(self._local, "last_response_bytes", None)
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from tixcraft_checkpoint import atomic_write_text
+
+
+METRIC_PREFIX = "tixcraft_scraper"
+SUMMARY_QUANTILES = (0.5, 0.95)
+MAX_STAGE_SAMPLES = 2048
+
+
+@dataclass
+class StageTotals:
+    count: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _parent_pids() -> dict[int, int]:
+    parents: dict[int, int] = {}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/stat", encoding="utf-8") as handle:
+                stat = handle.read()
+        except OSError:
+            continue
+        fields = stat[stat.rfind(")") + 2 :].split()
+        parents[int(entry.name)] = int(fields[1])
+    return parents
+
+
+def process_tree_rss(pid: int | None) -> int | None:
+    if not pid or not os.path.isdir("/proc"):
+        return None
+    children: dict[int, list[int]] = {}
+    for child, parent in _parent_pids().items():
+        children.setdefault(parent, []).append(child)
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, ()))
+        try:
+            with open(f"/proc/{current}/statm", encoding="utf-8") as handle:
+                total += int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            continue
+    return total or None
+
+
+class MetricsRecorder:
+    def __init__(
+        self,
+        jsonl_path: Path | None = None,
+        prometheus_path: Path | None = None,
+        run_id: str | None = None,
+    ):
+        self.jsonl_path = jsonl_path
+        self.prometheus_path = prometheus_path
+        self.run_id = run_id or time.strftime("%Y%m%dT%H%M%S")
+        self.samples: dict[str, deque[float]] = {}
+        self.stage_totals: dict[str, StageTotals] = {}
+        self.page_bytes: dict[str, int] = {}
+        self.rss_bytes_max: int | None = None
+        self.throttle: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._handle = None
+        if jsonl_path:
+            jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = jsonl_path.open("a", encoding="utf-8")
+
+    def _emit(self, entry: dict[str, Any]) -> None:
+        if self._handle is None:
+            return
+        line = json.dumps({"run_id": self.run_id, "ts": round(time.time(), 3), **entry}, ensure_ascii=False)
+        with self._lock:
+            if not self._handle.closed:
+                self._handle.write(line + "\n")
+                self._handle.flush()
+
+    def observe(self, stage: str, seconds: float, url: str | None = None, **fields: Any) -> None:
+        with self._lock:
+            self.samples.setdefault(stage, deque(maxlen=MAX_STAGE_SAMPLES)).append(seconds)
+            totals = self.stage_totals.setdefault(stage, StageTotals())
+            totals.count += 1
+            totals.seconds += seconds
+            totals.max_seconds = max(totals.max_seconds, seconds)
+        self._emit({"type": "stage", "stage": stage, "seconds": round(seconds, 6), "url": url, **fields})
+
+    @contextmanager
+    def stage(self, stage: str, url: str | None = None, **fields: Any) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started, url, **fields)
+
+    def record_page(self, url: str, byte_count: int | None = None, rss_bytes: int | None = None) -> None:
+        with self._lock:
+            if byte_count is not None:
+                self.page_bytes[url] = byte_count
+            if rss_bytes is not None:
+                self.rss_bytes_max = max(self.rss_bytes_max or 0, rss_bytes)
+        self._emit({"type": "page", "url": url, "bytes": byte_count, "chrome_rss_bytes": rss_bytes})
+
+    def record_throttle(self, url: str, outcome: str, latency: float, state: dict[str, Any]) -> None:
+        with self._lock:
+            self.throttle = dict(state)
+        self._emit({"type": "throttle", "url": url, "outcome": outcome, "seconds": round(latency, 6), **state})
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            samples = {stage: list(values) for stage, values in self.samples.items()}
+            totals = {stage: StageTotals(**vars(total)) for stage, total in self.stage_totals.items()}
+            page_bytes = list(self.page_bytes.values())
+            rss_bytes_max = self.rss_bytes_max
+            throttle = dict(self.throttle)
+
+        stages = {
+            stage: {
+                "count": totals[stage].count,
+                "total_seconds": round(totals[stage].seconds, 3),
+                "p50_seconds": round(percentile(values, 0.5), 4),
+                "p95_seconds": round(percentile(values, 0.95), 4),
+                "max_seconds": round(totals[stage].max_seconds, 4),
+            }
+            for stage, values in samples.items()
+            if values
+        }
+        return {
+            "stages": stages,
+            "pages": len(page_bytes),
+            "page_bytes_total": sum(page_bytes),
+            "chrome_rss_bytes_max": rss_bytes_max,
+            "throttle": throttle,
+        }
+
+    def render_prometheus(self, summary: dict[str, Any] | None = None) -> str:
+        summary = summary or self.summary()
+        with self._lock:
+            samples = {stage: list(values) for stage, values in self.samples.items()}
+            totals = {stage: (total.count, total.seconds) for stage, total in self.stage_totals.items()}
+
+        lines = [
+            f"# HELP {METRIC_PREFIX}_stage_seconds Wall time spent per scraper stage in the last run.",
+            f"# TYPE {METRIC_PREFIX}_stage_seconds summary",
+        ]
+        for stage, values in sorted(samples.items()):
+            if not values:
+                continue
+            for quantile in SUMMARY_QUANTILES:
+                lines.append(
+                    f'{METRIC_PREFIX}_stage_seconds{{stage="{stage}",quantile="{quantile}"}} '
+                    f"{percentile(values, quantile):.6f}"
+                )
+            count, seconds = totals[stage]
+            lines.append(f'{METRIC_PREFIX}_stage_seconds_sum{{stage="{stage}"}} {seconds:.6f}')
+            lines.append(f'{METRIC_PREFIX}_stage_seconds_count{{stage="{stage}"}} {count}')
+
+        lines.extend(
+            [
+                f"# HELP {METRIC_PREFIX}_page_bytes_total Bytes transferred for detail pages in the last run.",
+                f"# TYPE {METRIC_PREFIX}_page_bytes_total gauge",
+                f"{METRIC_PREFIX}_page_bytes_total {summary['page_bytes_total']}",
+                f"# HELP {METRIC_PREFIX}_pages Detail pages fetched in the last run.",
+                f"# TYPE {METRIC_PREFIX}_pages gauge",
+                f"{METRIC_PREFIX}_pages {summary['pages']}",
+            ]
+        )
+        if summary["chrome_rss_bytes_max"] is not None:
+            lines.extend(
+                [
+                    f"# HELP {METRIC_PREFIX}_chrome_rss_bytes_max Peak RSS of one Chrome process tree in the last run.",
+                    f"# TYPE {METRIC_PREFIX}_chrome_rss_bytes_max gauge",
+                    f"{METRIC_PREFIX}_chrome_rss_bytes_max {summary['chrome_rss_bytes_max']}",
+                ]
+            )
+        for key, value in sorted(summary["throttle"].items()):
+            lines.extend(
+                [
+                    f"# HELP {METRIC_PREFIX}_throttle_{key} Fetch governor {key.replace('_', ' ')} at the end of the run.",
+                    f"# TYPE {METRIC_PREFIX}_throttle_{key} {'counter' if key.endswith('_total') else 'gauge'}",
+                    f"{METRIC_PREFIX}_throttle_{key} {value}",
+                ]
+            )
+        lines.extend(
+            [
+                f"# HELP {METRIC_PREFIX}_last_run_timestamp_seconds Unix time the last run finished.",
+                f"# TYPE {METRIC_PREFIX}_last_run_timestamp_seconds gauge",
+                f"{METRIC_PREFIX}_last_run_timestamp_seconds {time.time():.0f}",
+            ]
+        )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, summary: dict[str, Any] | None = None) -> None:
+        if self.prometheus_path:
+            atomic_write_text(self.prometheus_path, self.render_prometheus(summary))
+
+    def close(self) -> dict[str, Any]:
+        summary = self.summary()
+        self._emit({"type": "summary", **summary})
+        self.write_prometheus(summary)
+        with self._lock:
+            if self._handle is not None and not self._handle.closed:
+                self._handle.close()
+        return summary
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from tixcraft_changes import append_change_feed, iter_changes, load_previous_records
+from tixcraft_checkpoint import atomic_write_text
+from tixcraft_event_store import EventStore
+from tixcraft_metrics import MetricsRecorder
+
+
+LOGGER_NAME = "tixcraft_precision_field_scraper"
+LOG_PATH = Path(__file__).with_name("tixcraft_precision_field.log")
+OUTPUT_FIELDS = (
+    "event_name",
+    "ticket_price",
+    "ticket_types",
+    "event_time",
+    "sale_time",
+    "event_link",
+    "venue_name",
+    "address",
+    "artist_name",
+)
+
+
+def build_logger() -> logging.Logger:
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+    file_handler = logging.FileHandler(LOG_PATH, encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    logger.addHandler(stream_handler)
+
+    return logger
+
+
+def write_event_store(
+    sqlite_path: Path,
+    records: list[dict[str, Any]],
+    retained_links: list[str],
+    metrics: MetricsRecorder,
+    logger: logging.Logger,
+    deactivate_missing: bool = True,
+) -> None:
+    store = EventStore(sqlite_path)
+    try:
+        with metrics.stage("write_sqlite"):
+            count = store.sync(records, retained_links=retained_links, deactivate_missing=deactivate_missing)
+    finally:
+        store.close()
+    logger.info("Upserted %s events into %s", count, sqlite_path)
+
+
+def write_output(
+    output_path: Path,
+    records: list[dict[str, Any]],
+    failures: list[dict[str, Any]] | None = None,
+    sqlite_path: Path | None = None,
+    metrics: MetricsRecorder | None = None,
+    logger: logging.Logger | None = None,
+    shard: dict[str, Any] | None = None,
+    changes_path: Path | None = None,
+) -> dict[str, Any]:
+    metrics = metrics or MetricsRecorder()
+    logger = logger or logging.getLogger(LOGGER_NAME)
+    result = {
+        "scrape_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "total_events": len(records),
+        "fields": list(OUTPUT_FIELDS),
+        "events": records,
+        "failures": failures or [],
+    }
+    if shard:
+        result["shard"] = shard
+    retained_links = [failure["event_link"] for failure in result["failures"]]
+    previous_records = load_previous_records(output_path) if changes_path else None
+    with metrics.stage("write_output"):
+        atomic_write_text(output_path, json.dumps(result, ensure_ascii=False, indent=2))
+    change_counts = None
+    if previous_records is not None:
+        with metrics.stage("write_changes"):
+            changes = iter_changes(previous_records, records, retained_links)
+            change_counts = append_change_feed(changes_path, changes, result["scrape_time"])
+        logger.info(
+            "Change feed %s: %s added, %s changed, %s removed",
+            changes_path,
+            change_counts["added"],
+            change_counts["changed"],
+            change_counts["removed"],
+        )
+    if sqlite_path:
+        write_event_store(sqlite_path, records, retained_links, metrics, logger, deactivate_missing=shard is None)
+    if change_counts is not None:
+        return {**result, "changes": change_counts}
+    return result
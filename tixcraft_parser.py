@@ -0,0 +1,1286 @@
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from tixcraft_text import KeywordIndex, clean_text, compact_lower, compact_text, lower_text
+
+
+DATE_RE = re.compile(
+    r"(?:"
+    r"\d{4}\s*[./-]\s*\d{1,2}\s*[./-]\s*\d{1,2}(?:\s*[-~至]\s*\d{1,2})?"
+    r"|\d{4}年\s*\d{1,2}\s*月\s*\d{1,2}(?:\s*[-~至]\s*\d{1,2})?\s*日"
+    r"|\d{1,2}\s*月\s*\d{1,2}(?:\s*[-~至]\s*\d{1,2})?\s*日"
+    r"|\d{1,2}\s*[./-]\s*\d{1,2}(?:\s*[-~至]\s*\d{1,2})?(?:\s*[./-]\s*\d{2,4})?"
+    r")"
+)
+TIME_RE = re.compile(r"\d{1,2}:\d{2}(?:\s*[AP]M)?", re.IGNORECASE)
+PRICE_RE = re.compile(r"(?:NT\$|\$)\s*\d[\d,]*|\d[\d,]*(?:\s*元)")
+BARE_PRICE_RE = re.compile(r"(?<!\d)(\d{1,3}(?:,\d{3})+|\d{3,5})(?!\d)")
+ADDRESS_RE = re.compile(
+    r"(?:"
+    r"[台臺新北桃竹苗中彰雲嘉南高屏宜花東澎金馬][^ \n]{0,12}[市縣]"
+    r"|[^\n]{0,12}[市縣][^\n]{0,12}(?:區|鄉|鎮|市)"
+    r"|[^\n]{0,20}(?:路|街|大道|巷|弄)(?:[^\n]{0,10}\d+號)?"
+    r"|[^\d\n]{1,20}\d+F"
+    r"|[^\n]{1,12}町"
+    r")"
+)
+GENERIC_ARTIST_KEYWORDS = (
+    "festival",
+    "音樂節",
+    "音乐节",
+    "嘉年華",
+    "嘉年华",
+    "開唱",
+    "开唱",
+    "樂祭",
+    "乐祭",
+    "祭",
+)
+GENERIC_ARTIST_TITLE_KEYWORDS = (
+    "主場賽事",
+    "主场赛事",
+    "季套票",
+    "套票專區",
+    "套票专区",
+    "門票",
+    "门票",
+    "售票",
+    "票券",
+    "票務",
+    "票务",
+    "聯票",
+    "联票",
+    "限定",
+    "聯名",
+    "联名",
+    "銀行",
+    "银行",
+    "專區",
+    "专区",
+)
+ARTIST_EVENT_KEYWORDS = (
+    "年度專場",
+    "專場",
+    "专场",
+    "演唱會",
+    "演唱会",
+    "巡迴",
+    "巡回",
+    "見面會",
+    "见面会",
+    "音樂會",
+    "音乐会",
+    "fancon",
+    "fan meeting",
+    "world tour",
+    "asia tour",
+    "tour",
+    "concert",
+    "live",
+    "showcase",
+    "encore",
+)
+EXPLICIT_ARTIST_LABELS = (
+    "藝人",
+    "艺人",
+    "藝人名稱",
+    "艺人名称",
+    "演出藝人",
+    "演出艺人",
+    "演出者",
+    "出演",
+    "演出單位",
+    "演出单位",
+    "表演嘉賓",
+    "表演嘉宾",
+    "artist",
+    "artists",
+    "lineup",
+    "performer",
+    "performers",
+)
+TITLE_BRAND_MARKERS = (
+    " x ",
+    " × ",
+    "合作",
+    "限定",
+    "聯名",
+    "联名",
+    "銀行",
+    "银行",
+    "presented by",
+    "sponsored by",
+)
+SPORT_CATEGORY_KEYWORDS = (
+    "sports",
+    "sport",
+    "籃球",
+    "篮球",
+    "棒球",
+    "足球",
+    "排球",
+    "網球",
+    "网球",
+    "羽球",
+    "羽毛球",
+    "電競",
+    "电竞",
+    "賽車",
+    "赛车",
+)
+VENUE_KEYWORDS = (
+    "arena",
+    "hall",
+    "stadium",
+    "dome",
+    "center",
+    "centre",
+    "legacy",
+    "zepp",
+    "theater",
+    "theatre",
+    "小巨蛋",
+    "巨蛋",
+    "體育館",
+    "体育馆",
+    "展演",
+    "展覽館",
+    "展览馆",
+    "音樂中心",
+    "音乐中心",
+    "流行音樂中心",
+    "流行音乐中心",
+    "場館",
+    "场馆",
+    "會館",
+    "会馆",
+)
+PLACEHOLDERS = {"", "n/a", "none", "null"}
+SECTION_FIELDS = ("event_time", "sale_time", "price", "location")
+SALE_HEADING_KEYWORDS = (
+    "預售",
+    "預購",
+    "開賣",
+    "公售",
+    "onsale",
+    "publiconsale",
+    "presale",
+    "pre-sale",
+    "會員",
+    "會員售票",
+    "會員抽選",
+    "抽選結果",
+    "抽選登記",
+    "卡友",
+    "優先購",
+    "優先購票",
+    "販售",
+    "售票",
+    "発売",
+    "販売",
+    "一般発売",
+    "一般售票",
+    "正式開賣",
+    "全面開賣",
+    "套票",
+)
+SALE_HEADING_NOISE_KEYWORDS = (
+    "資格",
+    "限量發送",
+    "請詳",
+    "詳見",
+    "更多資訊",
+    "主辦保留",
+    "verification",
+    "cardholder",
+    "information",
+    "email",
+    "successful",
+    "registrant",
+    "accesscode",
+    "receive",
+    "購票流程",
+    "重要注意事項",
+    "注意事項",
+    "請由",
+    "進入購票",
+    "加入大港人",
+)
+PRICE_NOISE_KEYWORDS = (
+    "詳細資訊",
+    "請隨時關注",
+    "關於福利抽選",
+    "抽獎結果",
+    "購票前請",
+    "詳讀",
+    "入場時間",
+    "工作人員",
+    "發票開立",
+    "請至:",
+    "請至",
+    "更多訊息",
+    "更多資訊",
+)
+KEYWORD_INDEX = KeywordIndex(
+    {
+        "generic_artist": GENERIC_ARTIST_KEYWORDS,
+        "generic_artist_title": GENERIC_ARTIST_TITLE_KEYWORDS,
+        "artist_event": ARTIST_EVENT_KEYWORDS,
+        "brand": TITLE_BRAND_MARKERS,
+        "sport": SPORT_CATEGORY_KEYWORDS,
+        "venue": VENUE_KEYWORDS,
+        "sale_heading": SALE_HEADING_KEYWORDS,
+        "sale_heading_noise": SALE_HEADING_NOISE_KEYWORDS,
+        "price_noise": PRICE_NOISE_KEYWORDS,
+    }
+)
+LINE_FEATURE_CACHE_SIZE = 8192
+
+
+@dataclass(slots=True)
+class LineFeatures:
+    text: str
+    stripped: str
+    has_url: bool
+    has_datetime: bool
+    has_price: bool
+    generic_sale_heading: bool
+    sale_heading: bool
+    time_label_only: bool
+    label: tuple[str | None, str] | None = None
+    price_line: bool | None = None
+    price_context: bool | None = None
+    datetime_location_pair: tuple[str | None, str | None] | None = None
+    inline_schedule: tuple[str | None, str | None] | None = None
+
+    @property
+    def sale_context(self) -> bool:
+        return self.generic_sale_heading or self.sale_heading
+
+
+class TixcraftEventParser:
+    def __init__(self) -> None:
+        self._line_features = lru_cache(maxsize=LINE_FEATURE_CACHE_SIZE)(self._classify_line)
+
+    def _clean_text(self, text: str | None) -> str:
+        return clean_text(text)
+
+    def _normalize_value(self, value: str | None) -> str | None:
+        cleaned = self._clean_text(value)
+        if not cleaned:
+            return None
+        if lower_text(value) in PLACEHOLDERS:
+            return None
+        return cleaned
+
+    def _contains_generic_artist_keyword(self, text: str) -> bool:
+        return "generic_artist" in KEYWORD_INDEX.categories(lower_text(text))
+
+    def _contains_generic_artist_title_keyword(self, text: str) -> bool:
+        return "generic_artist_title" in KEYWORD_INDEX.categories(lower_text(text))
+
+    def _is_sports_category(self, *values: str | None) -> bool:
+        return any("sport" in KEYWORD_INDEX.categories(lower_text(value)) for value in values if value)
+
+    def _contains_artist_event_keyword(self, text: str) -> bool:
+        return "artist_event" in KEYWORD_INDEX.categories(lower_text(text))
+
+    def _strip_event_title_prefixes(self, title: str) -> str:
+        cleaned = self._clean_text(title)
+        cleaned = re.sub(r"^【[^】]+】\s*", "", cleaned)
+        cleaned = re.sub(r"^\d{4}(?:-\d{2})?\s*", "", cleaned)
+        return cleaned.strip()
+
+    def _contains_brand_marker(self, text: str) -> bool:
+        return (
+            "brand" in KEYWORD_INDEX.categories(lower_text(text))
+            or bool(re.search(r"[\u4e00-\u9fffA-Za-z0-9][x×][\u4e00-\u9fffA-Za-z0-9]", self._clean_text(text)))
+            or "generic_artist_title" in KEYWORD_INDEX.categories(compact_lower(text))
+        )
+
+    def _clean_artist_candidate(self, value: str | None) -> str | None:
+        cleaned = self._normalize_value(value)
+        if not cleaned:
+            return None
+        cleaned = re.sub(r"^【[^】]+】\s*", "", cleaned)
+        cleaned = re.sub(r"\s+", " ", cleaned).strip(" -:/")
+        if not cleaned:
+            return None
+        return cleaned
+
+    def _has_structured_title_artist_signal(self, event_name: str, candidate: str | None) -> bool:
+        title = self._strip_event_title_prefixes(event_name)
+        cleaned_candidate = self._clean_artist_candidate(candidate)
+        if not title or not cleaned_candidate:
+            return False
+
+        title_lower = title.lower()
+        candidate_lower = cleaned_candidate.lower()
+        if not title_lower.startswith(candidate_lower):
+            return False
+
+        suffix = title[len(cleaned_candidate) :].strip()
+        if not suffix:
+            return False
+        if self._contains_artist_event_keyword(suffix):
+            return True
+        if re.search(r"[《〈＜「『].+[》〉＞」』]", title) and re.search(
+            r"(\bin\b\s+[A-Za-z][A-Za-z ]+|台北站|臺北站|高雄站|台中站|臺中站|桃園站|台南站|臺南站|TAIPEI|KAOHSIUNG|TAICHUNG|TAINAN|TAOYUAN)\s*$",
+            title,
+            flags=re.IGNORECASE,
+        ):
+            return True
+        if re.search(r"(粉絲見面會|粉丝见面会|fan meeting|tour|concert|live)", suffix, flags=re.IGNORECASE):
+            return True
+        return False
+
+    def _looks_like_valid_artist_candidate(
+        self,
+        candidate: str | None,
+        event_name: str,
+        category_values: set[str],
+        require_title_support: bool,
+    ) -> bool:
+        cleaned = self._clean_artist_candidate(candidate)
+        if not cleaned:
+            return False
+
+        lowered = cleaned.lower()
+        if len(cleaned) < 2 or len(cleaned) > 40:
+            return False
+        if lowered in category_values:
+            return False
+        if DATE_RE.search(cleaned) or TIME_RE.search(cleaned) or PRICE_RE.search(cleaned):
+            return False
+        if self._contains_generic_artist_keyword(cleaned) or self._contains_generic_artist_title_keyword(cleaned):
+            return False
+        if self._contains_brand_marker(cleaned):
+            return False
+
+        if not require_title_support:
+            return True
+
+        normalized_title = self._strip_event_title_prefixes(event_name)
+        normalized_title_lower = normalized_title.lower()
+
+        if normalized_title_lower == lowered:
+            return True
+        if self._has_structured_title_artist_signal(normalized_title, cleaned):
+            return True
+        if self._contains_brand_marker(normalized_title) and not self._contains_artist_event_keyword(normalized_title):
+            return False
+
+        if lowered in normalized_title_lower:
+            suffix = normalized_title_lower.split(lowered, 1)[1].strip(" :-:：")
+            if suffix and self._contains_artist_event_keyword(suffix):
+                return True
+            if suffix and not self._contains_brand_marker(suffix) and not self._contains_generic_artist_keyword(suffix):
+                return len(suffix) <= 30
+
+        return self._contains_artist_event_keyword(normalized_title) and not self._contains_brand_marker(normalized_title)
+
+    def _extract_explicit_artist_name(self, intro_lines: list[str], event_name: str, category_values: set[str]) -> str | None:
+        candidates: list[str] = []
+        explicit_labels = {compact_lower(item) for item in EXPLICIT_ARTIST_LABELS}
+        for line in intro_lines:
+            stripped = self._strip_bullet_prefix(line)
+            if ":" not in stripped:
+                continue
+            raw_label, raw_content = stripped.split(":", 1)
+            label = compact_lower(raw_label)
+            if label not in explicit_labels:
+                continue
+            candidate = self._clean_artist_candidate(raw_content)
+            if self._looks_like_valid_artist_candidate(candidate, event_name, category_values, require_title_support=False):
+                candidates.append(candidate)
+
+        deduped = self._dedupe(candidates)
+        return " / ".join(deduped) if deduped else None
+
+    def _compact(self, text: str) -> str:
+        return compact_text(text)
+
+    def _strip_bullet_prefix(self, text: str) -> str:
+        cleaned = self._clean_text(text)
+        while cleaned:
+            first = cleaned[0]
+            if first.isalnum() or "\u4e00" <= first <= "\u9fff":
+                break
+            cleaned = cleaned[1:].lstrip()
+        return cleaned.strip()
+
+    def _clean_location_candidate(self, text: str) -> str:
+        cleaned = self._strip_bullet_prefix(text)
+        cleaned = re.sub(r"^(?:演出地點|活動地點|地點|venue|location)\s*:\s*", "", cleaned, flags=re.IGNORECASE)
+        return self._clean_text(cleaned)
+
+    def _label_matches_aliases(self, label: str, aliases: tuple[str, ...] | list[str] | set[str]) -> bool:
+        compact_label = compact_lower(label)
+        return any(
+            compact_label == compact_alias
+            or compact_label.startswith(compact_alias)
+            or compact_label.endswith(compact_alias)
+            for compact_alias in (compact_lower(alias) for alias in aliases)
+        )
+
+    def _split_intro_lines(self, intro: str) -> list[str]:
+        lines: list[str] = []
+        for raw_line in self._clean_text(intro).splitlines():
+            line = self._strip_bullet_prefix(raw_line)
+            if not line:
+                continue
+            lines.append(line)
+        return lines
+
+    def _is_generic_sale_heading(self, text: str) -> bool:
+        compact = compact_lower(self._strip_bullet_prefix(text)).strip(":：】〛」")
+        generic_aliases = ("售票階段及說明", "售票資訊", "售票方式", "售票相關資訊", "門票販售時間", "ticketsalesschedule")
+        return self._label_matches_aliases(compact, generic_aliases)
+
+    def _has_date_or_time(self, text: str) -> bool:
+        return bool(DATE_RE.search(text) or TIME_RE.search(text))
+
+    def _looks_like_price_context(self, text: str) -> bool:
+        stripped = self._strip_bullet_prefix(text)
+        compact = compact_lower(stripped)
+        lowered = stripped.lower()
+        if any(keyword in compact for keyword in ("票價", "活動票價", "演出票價", "ticketprice", "ticketprices")):
+            return True
+        return bool(re.search(r"\bticket\s*prices?\b|\bprice\b", lowered))
+
+    def _looks_like_sale_heading_text(self, text: str, allow_datetime: bool = False) -> bool:
+        cleaned = self._strip_bullet_prefix(text)
+        compact = compact_lower(cleaned).strip(":：】〛」")
+        if not compact:
+            return False
+        if self._is_generic_sale_heading(cleaned):
+            return True
+        if "http" in compact or PRICE_RE.search(cleaned):
+            return False
+        if not allow_datetime and self._has_date_or_time(cleaned):
+            return False
+        if len(cleaned) > 40:
+            return False
+        if any(mark in cleaned for mark in ("。", "！", "!", "？", "?")):
+            return False
+        categories = KEYWORD_INDEX.categories(compact)
+        if "sale_heading_noise" in categories:
+            return False
+        return "sale_heading" in categories
+
+    def _looks_like_sale_datetime(self, text: str) -> bool:
+        if "sale_heading" in KEYWORD_INDEX.categories(compact_lower(text)):
+            return True
+        return any(marker in text for marker in ("~", "～", "至"))
+
+    def _sale_entry_key(self, text: str) -> str:
+        compact = compact_lower(text)
+        stage_aliases = {
+            "member_draw_registration": ("會員抽選登記", "会員抽選受付"),
+            "member_draw_result": ("會員抽選結果", "会員抽選結果"),
+            "member_sale": ("會員售票時間", "會員售票", "会員販売期間", "会員販売"),
+            "general_sale": ("一般售票", "一般発売", "発売日時"),
+            "member_presale": ("會員預售", "會員預購", "beus會員預購", "livenationtaiwan會員預售"),
+            "card_presale": ("卡友預售", "mastercard"),
+            "general_open": ("正式開賣", "全面開賣", "publiconsale", "onsale"),
+        }
+        stage_key = compact
+        for alias, keywords in stage_aliases.items():
+            if any(keyword in compact for keyword in keywords):
+                stage_key = alias
+                break
+        number_key = "-".join(re.findall(r"\d+", self._normalize_datetime_text(text)))
+        return f"{stage_key}|{number_key}"
+
+    def _split_datetime_location_pair(self, line: str) -> tuple[str | None, str | None]:
+        parts = [self._clean_text(part) for part in re.split(r"\s*[|｜]\s*", self._strip_bullet_prefix(line)) if self._clean_text(part)]
+        if len(parts) != 2:
+            return None, None
+        left, right = parts
+        if self._has_date_or_time(left) and not self._has_date_or_time(right) and not PRICE_RE.search(right):
+            return left, right
+        if self._has_date_or_time(right) and not self._has_date_or_time(left) and not PRICE_RE.search(left):
+            return right, left
+        return None, None
+
+    def _extract_inline_schedule_entry(self, line: str) -> tuple[str | None, str | None]:
+        cleaned = self._strip_bullet_prefix(line)
+        if not re.match(r"^(?:\d{1,4}[./-]\d{1,2}|\d{1,2}\.\d{1,2}|\d{4}年|\d{1,2}月)", cleaned):
+            return None, None
+        match = re.match(r"^(?P<datetime>.+?\d{1,2}:\d{2})\s*(?:[丨|｜]\s*)?(?P<trailing>.+)$", cleaned)
+        if not match:
+            return None, None
+        datetime_text = self._clean_text(match.group("datetime"))
+        trailing = self._clean_text(match.group("trailing"))
+        if not self._has_date_or_time(datetime_text):
+            return None, None
+        return datetime_text, trailing
+
+    def _match_label(self, line: str) -> tuple[str | None, str]:
+        stripped = self._strip_bullet_prefix(line)
+        if ":" not in stripped:
+            return None, stripped
+
+        raw_label, raw_content = stripped.split(":", 1)
+        label = compact_lower(raw_label)
+        content = self._clean_text(raw_content)
+
+        sale_aliases = (
+            "售票時間",
+            "開賣時間",
+            "售票日期",
+            "預售時間",
+            "publiconsale",
+            "ticketsalesschedule",
+            "onsale",
+            "presale",
+            "pre-sale",
+            "售票階段及說明",
+        )
+        event_aliases = (
+            "演出日期",
+            "演出時間",
+            "活動日期",
+            "活動時間",
+            "日期",
+            "時間",
+            "date",
+            "time",
+        )
+        price_aliases = ("活動票價", "演出票價", "票價", "票價資訊", "ticketprice", "ticketprices", "price")
+        location_aliases = ("演出地點", "活動地點", "地點", "venue", "location")
+        exact_sale_aliases = {compact_lower(alias) for alias in sale_aliases}
+
+        if self._label_matches_aliases(label, sale_aliases):
+            if label in exact_sale_aliases:
+                return "sale_time", content
+            cleaned_label = self._strip_bullet_prefix(raw_label)
+            return "sale_time", f"{cleaned_label} {content}".strip()
+        if self._label_matches_aliases(label, location_aliases):
+            return "location", content
+        if self._label_matches_aliases(label, price_aliases):
+            return "price", content
+        if self._label_matches_aliases(label, event_aliases):
+            return "event_time", content
+        if self._has_date_or_time(content) and not PRICE_RE.search(content):
+            cleaned_label = self._strip_bullet_prefix(raw_label)
+            if self._looks_like_sale_heading_text(cleaned_label, allow_datetime=True):
+                return "sale_time", f"{cleaned_label} {content}".strip()
+        return None, stripped
+
+    def _is_sale_stage_heading(self, line: str) -> bool:
+        return self._looks_like_sale_heading_text(line)
+
+    def _is_time_label_only(self, line: str) -> bool:
+        stripped = self._strip_bullet_prefix(line)
+        if ":" not in stripped:
+            return False
+        label = compact_lower(stripped.split(":", 1)[0])
+        return any(alias in label for alias in ("時間", "日期", "time", "date")) and len(label) <= 12
+
+    def _classify_line(self, line: str) -> LineFeatures:
+        return LineFeatures(
+            text=line,
+            stripped=self._strip_bullet_prefix(line),
+            has_url="http" in line.lower(),
+            has_datetime=self._has_date_or_time(line),
+            has_price=bool(PRICE_RE.search(line)),
+            generic_sale_heading=self._is_generic_sale_heading(line),
+            sale_heading=self._is_sale_stage_heading(line),
+            time_label_only=self._is_time_label_only(line),
+        )
+
+    def _line_label(self, features: LineFeatures) -> tuple[str | None, str]:
+        if features.label is None:
+            features.label = self._match_label(features.text)
+        return features.label
+
+    def _line_is_price(self, features: LineFeatures) -> bool:
+        if features.price_line is None:
+            features.price_line = self._looks_like_price_line(features.text)
+        return features.price_line
+
+    def _line_is_price_context(self, features: LineFeatures) -> bool:
+        if features.price_context is None:
+            features.price_context = self._looks_like_price_context(features.text)
+        return features.price_context
+
+    def _line_datetime_location_pair(self, features: LineFeatures) -> tuple[str | None, str | None]:
+        if features.datetime_location_pair is None:
+            features.datetime_location_pair = self._split_datetime_location_pair(features.text)
+        return features.datetime_location_pair
+
+    def _line_inline_schedule(self, features: LineFeatures) -> tuple[str | None, str | None]:
+        if features.inline_schedule is None:
+            features.inline_schedule = self._extract_inline_schedule_entry(features.text)
+        return features.inline_schedule
+
+    def _is_continuation(self, field: str, features: LineFeatures) -> bool:
+        if features.has_url:
+            return False
+        if field == "event_time":
+            return features.has_datetime and not features.sale_heading and not features.has_price
+        if field == "sale_time":
+            return features.has_datetime or features.sale_heading
+        if field == "price":
+            return self._line_is_price(features)
+        if field == "location":
+            return (
+                not features.has_price
+                and not features.has_datetime
+                and not self._line_is_price_context(features)
+                and not features.sale_heading
+                and len(features.text) <= 100
+            )
+        return False
+
+    def _extract_sections(self, lines: list[str]) -> dict[str, list[str]]:
+        sections = {field: [] for field in SECTION_FIELDS}
+        current_field: str | None = None
+        line_features = [self._line_features(line) for line in lines]
+
+        for index, line in enumerate(lines):
+            features = line_features[index]
+            next_has_datetime = index + 1 < len(lines) and line_features[index + 1].has_datetime
+            recent_sale_context = current_field == "sale_time" or any(
+                previous.sale_context for previous in line_features[max(0, index - 2) : index]
+            )
+
+            paired_time, paired_location = self._line_datetime_location_pair(features)
+            if paired_time:
+                sections["event_time"].append(paired_time)
+                if paired_location:
+                    sections["location"].append(paired_location)
+                current_field = None
+                continue
+
+            inline_time, inline_trailing = self._line_inline_schedule(features)
+            if inline_time and inline_trailing:
+                if recent_sale_context:
+                    sections["sale_time"].append(f"{inline_time} {inline_trailing}".strip())
+                elif self._looks_like_sale_heading_text(inline_trailing, allow_datetime=True):
+                    sections["sale_time"].append(f"{inline_trailing} {inline_time}".strip())
+                else:
+                    sections["event_time"].append(inline_time)
+                    if not self._line_is_price(self._line_features(inline_trailing)):
+                        sections["location"].append(inline_trailing)
+                current_field = None
+                continue
+
+            if features.time_label_only:
+                time_content = self._clean_text(line.split(":", 1)[1])
+                if recent_sale_context:
+                    sections["sale_time"].append(time_content)
+                    current_field = "sale_time"
+                    continue
+                if current_field == "event_time":
+                    sections["event_time"].append(time_content)
+                    continue
+
+            if current_field == "sale_time" and features.time_label_only:
+                sections["sale_time"].append(self._clean_text(line.split(":", 1)[1]))
+                continue
+
+            if current_field == "event_time" and features.time_label_only:
+                sections["event_time"].append(self._clean_text(line.split(":", 1)[1]))
+                continue
+
+            field, content = self._line_label(features)
+            if field:
+                current_field = field
+                if content:
+                    sections[field].append(content)
+                elif field == "sale_time" and features.sale_heading and not features.generic_sale_heading:
+                    sections[field].append(features.stripped.rstrip(":"))
+                continue
+
+            if features.generic_sale_heading:
+                current_field = "sale_time"
+                continue
+
+            if features.sale_heading and (current_field == "sale_time" or next_has_datetime):
+                current_field = "sale_time"
+                sections["sale_time"].append(features.stripped.rstrip(":"))
+                continue
+
+            if current_field and self._is_continuation(current_field, features):
+                sections[current_field].append(line)
+                continue
+
+            if self._line_is_price(features):
+                sections["price"].append(line)
+                current_field = "price"
+                continue
+
+            current_field = None
+
+        return {field: self._dedupe(values) for field, values in sections.items()}
+
+    def _dedupe(self, values: list[str]) -> list[str]:
+        seen: set[str] = set()
+        unique: list[str] = []
+        for value in values:
+            cleaned = self._clean_text(value)
+            if not cleaned or cleaned in seen:
+                continue
+            seen.add(cleaned)
+            unique.append(cleaned)
+        return unique
+
+    def _normalize_datetime_text(self, text: str) -> str:
+        normalized = self._clean_text(text)
+        normalized = re.sub(r"(?<=\d)\s*/\s*(?=\d)", "/", normalized)
+        normalized = re.sub(r"(?<=\d)\s*-\s*(?=\d)", "-", normalized)
+        normalized = re.sub(r"\s+", " ", normalized)
+        normalized = re.sub(r"(\d)\s*:\s*(\d)", r"\1:\2", normalized)
+        normalized = re.sub(r"\s*([AaPp][Mm])", r" \1", normalized)
+        return normalized.strip(" /")
+
+    def _format_event_time(self, values: list[str]) -> str | None:
+        normalized = [self._normalize_datetime_text(value) for value in values if self._has_date_or_time(value)]
+        normalized = self._dedupe(normalized)
+        if not normalized:
+            return None
+        filtered = [value for value in normalized if not self._looks_like_sale_datetime(value)]
+        if filtered:
+            normalized = filtered
+
+        result: list[str] = []
+        pending_date: str | None = None
+        for value in normalized:
+            has_date = bool(DATE_RE.search(value))
+            has_time = bool(TIME_RE.search(value))
+            if has_date and not has_time:
+                if pending_date:
+                    result.append(pending_date)
+                pending_date = value
+                continue
+            if has_time and not has_date and pending_date:
+                result.append(f"{pending_date} {value}")
+                pending_date = None
+                continue
+            if pending_date:
+                result.append(pending_date)
+                pending_date = None
+            result.append(value)
+        if pending_date:
+            result.append(pending_date)
+
+        return " / ".join(self._dedupe(result)) if result else None
+
+    def _format_sale_time(self, values: list[str]) -> str | None:
+        cleaned_values = [self._normalize_datetime_text(value) for value in values]
+        cleaned_values = self._dedupe(cleaned_values)
+        if not cleaned_values:
+            return None
+
+        result: list[str] = []
+        current_heading: str | None = None
+        seen_keys: set[str] = set()
+
+        for value in cleaned_values:
+            features = self._line_features(value)
+            if features.generic_sale_heading:
+                continue
+            if features.has_url:
+                continue
+            if features.sale_heading and not features.has_datetime:
+                current_heading = value.rstrip(":")
+                continue
+            if features.has_datetime:
+                entry = value
+                if current_heading:
+                    entry = f"{current_heading} {value}"
+                    current_heading = None
+                entry_key = self._sale_entry_key(entry)
+                if entry_key in seen_keys:
+                    continue
+                seen_keys.add(entry_key)
+                result.append(entry)
+                continue
+
+        return " / ".join(self._dedupe(result)) if result else None
+
+    def _trim_price_noise(self, text: str) -> str:
+        cleaned = self._clean_text(text)
+        for keyword in (
+            "以上票價需",
+            "系統服務費",
+            "服務費另計",
+            "system fee",
+            "福利抽獎券",
+            "關於福利抽選",
+            "購票請洽",
+            "更多資訊",
+            "主辦單位",
+            "演出長度",
+            "拓元註冊",
+            "每個帳號",
+            "工作人員",
+            "依現場",
+        ):
+            if keyword in cleaned:
+                cleaned = cleaned.split(keyword, 1)[0]
+        return cleaned.strip(" /")
+
+    def _looks_like_price_line(self, text: str) -> bool:
+        compact = compact_lower(text)
+        bare_tokens = [match.group(1) for match in BARE_PRICE_RE.finditer(text)]
+        if any(keyword in compact for keyword in ("服務費", "加購資格", "福利抽獎券")) and not self._looks_like_price_context(text):
+            return False
+        if any(marker in text for marker in ("➡", "→")) or "入場順" in text:
+            return False
+        if "price_noise" in KEYWORD_INDEX.categories(compact):
+            return False
+        if "http" in compact:
+            return False
+        if self._has_date_or_time(text) and not self._looks_like_price_context(text) and not re.search(r"(?:NT\$|\$|\d+\s*元)", text):
+            return False
+        explicit_price = bool(PRICE_RE.search(text))
+        if not explicit_price and not self._has_date_or_time(text):
+            explicit_price = bool(bare_tokens) and (
+                self._looks_like_price_context(text)
+                or any("," in token for token in bare_tokens)
+                or (len(bare_tokens) >= 2 and any(marker in text for marker in ("/", "／")))
+            )
+        if explicit_price:
+            return True
+        return self._looks_like_price_context(text) and len(self._strip_bullet_prefix(text)) <= 20
+
+    def _extract_price_tokens(self, text: str, allow_bare: bool) -> list[str]:
+        tokens = [match.group(0) for match in PRICE_RE.finditer(text)]
+        if tokens:
+            return tokens
+        if not allow_bare:
+            return []
+        return [match.group(1) for match in BARE_PRICE_RE.finditer(text)]
+
+    def _normalize_price(self, raw_price: str) -> str:
+        digits = re.search(r"\d[\d,]*", raw_price)
+        if not digits:
+            return self._clean_text(raw_price)
+        value = int(digits.group(0).replace(",", ""))
+        return f"NT${value:,}"
+
+    def _price_amount(self, price: str) -> int | None:
+        digits = re.search(r"\d[\d,]*", price)
+        if not digits:
+            return None
+        return int(digits.group(0).replace(",", ""))
+
+    def _cleanup_ticket_type(self, text: str) -> str | None:
+        cleaned = self._clean_text(text)
+        cleaned = re.sub(
+            r"^(?:活動票價|演出票價|票\s*價|price|ticket\s*price)\s*:\s*",
+            "",
+            cleaned,
+            flags=re.IGNORECASE,
+        )
+        cleaned = re.sub(r"^[#＃❋✦▪️■□◆•*➽➤►▶◎◉・]+", "", cleaned)
+        cleaned = re.sub(r"\bNT\.?\$?\s*$", "", cleaned, flags=re.IGNORECASE)
+        cleaned = re.sub(r"^VIP套票\s*:\s*VIP$", "VIP", cleaned, flags=re.IGNORECASE)
+        cleaned = re.sub(r"^(?:VIP套票\s*)?(?:VIP\s*Package|VIP套票)\s*:\s*(VVIP|VIP)$", r"\1", cleaned, flags=re.IGNORECASE)
+        cleaned = cleaned.replace("身障者席", "身障席")
+        cleaned = re.sub(r"^[\[\(（【]+|[\]\)）】]+$", "", cleaned)
+        cleaned = re.sub(r"\s+", " ", cleaned)
+        cleaned = cleaned.strip(" :/;-")
+        if not cleaned:
+            return None
+        return cleaned
+
+    def _looks_like_ticket_type(self, text: str) -> bool:
+        candidate = self._cleanup_ticket_type(text)
+        if not candidate:
+            return False
+        if len(candidate) > 40:
+            return False
+        lowered = candidate.lower()
+        if lowered in {"票價", "price", "ticket price"}:
+            return False
+        if any(marker in candidate for marker in ("市", "縣", "路", "街", "大道", "巷", "弄", "號")):
+            return False
+        if any(noise in lowered for noise in ("售票", "活動", "演出", "主辦", "購票", "服務費", "時間", "地點")):
+            return False
+        keywords = (
+            "vip",
+            "vvip",
+            "package",
+            "cat",
+            "ga",
+            "pass",
+            "席",
+            "區",
+            "票",
+            "站",
+            "座",
+            "身障",
+            "輪椅",
+            "wheelchair",
+        )
+        if any(keyword in lowered for keyword in keywords):
+            return True
+        if re.fullmatch(r"[A-Z0-9][A-Z0-9 .&+-]{0,20}", candidate, flags=re.IGNORECASE):
+            return True
+        if re.fullmatch(r"\dF(?:站區|座位|座席|區)?", candidate, flags=re.IGNORECASE):
+            return True
+        return False
+
+    def _parse_ticket_segment(self, segment: str, allow_bare: bool) -> tuple[str | None, str] | None:
+        cleaned = self._trim_price_noise(segment)
+        if not cleaned:
+            return None
+
+        tokens = self._extract_price_tokens(cleaned, allow_bare=allow_bare)
+        if not tokens:
+            return None
+
+        first_token = tokens[0]
+        match = re.search(re.escape(first_token), cleaned)
+        if not match:
+            return None
+
+        ticket_type: str | None = None
+        before = self._cleanup_ticket_type(cleaned[: match.start()])
+        after = self._cleanup_ticket_type(cleaned[match.end() :])
+
+        if before and self._looks_like_ticket_type(before):
+            ticket_type = before
+        elif after:
+            trailing = re.split(r"[，。,/]", after, maxsplit=1)[0]
+            trailing = self._cleanup_ticket_type(trailing)
+            if trailing and self._looks_like_ticket_type(trailing):
+                ticket_type = trailing
+
+        return ticket_type, self._normalize_price(first_token)
+
+    def _split_price_segments(self, text: str) -> list[str]:
+        cleaned = self._trim_price_noise(text)
+        if not cleaned:
+            return []
+
+        parts: list[str] = []
+        current: list[str] = []
+        depth = 0
+        for char in cleaned:
+            if char in "（(":
+                depth += 1
+            elif char in "）)":
+                depth = max(0, depth - 1)
+
+            if depth == 0 and char in "/／、；;｜|":
+                segment = self._clean_text("".join(current))
+                if segment:
+                    parts.append(segment)
+                current = []
+                continue
+
+            current.append(char)
+
+        tail = self._clean_text("".join(current))
+        if tail:
+            parts.append(tail)
+        return parts or [cleaned]
+
+    def _extract_ticket_data(self, sections: dict[str, list[str]], intro_lines: list[str]) -> tuple[str | None, str | None]:
+        price_lines: list[str] = []
+        for line in sections["price"]:
+            cleaned = self._trim_price_noise(line)
+            if cleaned:
+                price_lines.append(cleaned)
+
+        for line in intro_lines:
+            if not self._line_is_price(self._line_features(line)):
+                continue
+            cleaned = self._trim_price_noise(line)
+            if cleaned:
+                price_lines.append(cleaned)
+
+        price_lines = self._dedupe(price_lines)
+        if not price_lines:
+            return None, None
+
+        typed_entries: list[tuple[str, str]] = []
+        raw_prices: list[str] = []
+
+        for line in price_lines:
+            bare_tokens = [match.group(1) for match in BARE_PRICE_RE.finditer(line)]
+            allow_bare = bool(
+                re.search(r"(?:NT\$|\$|\d+\s*元)", line)
+                or self._looks_like_price_context(line)
+                or any("," in token for token in bare_tokens)
+                or (len(bare_tokens) >= 2 and any(marker in line for marker in ("/", "／")))
+            )
+            parts = self._split_price_segments(line)
+            if not parts:
+                parts = [line]
+
+            for part in parts:
+                parsed = self._parse_ticket_segment(part, allow_bare=allow_bare)
+                if not parsed:
+                    for raw_price in self._extract_price_tokens(part, allow_bare=allow_bare):
+                        raw_prices.append(self._normalize_price(raw_price))
+                    continue
+
+                ticket_type, price = parsed
+                raw_prices.append(price)
+                if ticket_type:
+                    typed_entries.append((ticket_type, price))
+
+        raw_prices = self._dedupe(raw_prices)
+        unique_typed_entries = list(dict.fromkeys(typed_entries))
+        ticket_types = self._dedupe([ticket_type for ticket_type, _ in unique_typed_entries])
+
+        price_amounts = [amount for amount in (self._price_amount(price) for price in raw_prices) if amount is not None]
+        if price_amounts and max(price_amounts) >= 1000:
+            raw_prices = [price for price in raw_prices if (self._price_amount(price) or 0) >= 300]
+            unique_typed_entries = [
+                entry for entry in unique_typed_entries if (self._price_amount(entry[1]) or 0) >= 300
+            ]
+            ticket_types = self._dedupe([ticket_type for ticket_type, _ in unique_typed_entries])
+
+        if unique_typed_entries:
+            typed_price_set = {price for _, price in unique_typed_entries}
+            if raw_prices and len(unique_typed_entries) == len(raw_prices) and len(typed_price_set) == len(raw_prices):
+                raw_price_order = {price: index for index, price in enumerate(raw_prices)}
+                ordered_entries = sorted(
+                    enumerate(unique_typed_entries),
+                    key=lambda item: (raw_price_order.get(item[1][1], len(raw_prices)), item[0]),
+                )
+                typed_entries_in_order = [entry for _, entry in ordered_entries]
+                return (
+                    " / ".join(price for _, price in typed_entries_in_order),
+                    " / ".join(self._dedupe([ticket_type for ticket_type, _ in typed_entries_in_order])),
+                )
+
+        if raw_prices:
+            partial_types = " / ".join(ticket_types) if ticket_types else None
+            return " / ".join(raw_prices), partial_types
+
+        return None, None
+
+    def _looks_like_address(self, text: str) -> bool:
+        if self._looks_like_ticket_type(text):
+            return False
+        return bool(ADDRESS_RE.search(text))
+
+    def _is_reasonable_address_candidate(self, text: str) -> bool:
+        cleaned = self._clean_text(text)
+        if not cleaned or len(cleaned) > 40 or "。" in cleaned or "http" in cleaned.lower():
+            return False
+        if any(
+            keyword in cleaned
+            for keyword in ("排隊", "進場", "限購", "帳號", "工作人員", "註冊", "開賣", "售票", "序號", "抽選")
+        ):
+            return False
+        return self._looks_like_address(cleaned)
+
+    def _looks_like_venue(self, text: str) -> bool:
+        return "venue" in KEYWORD_INDEX.categories(text.lower())
+
+    def _pick_best_venue(self, candidates: list[str]) -> str | None:
+        cleaned_candidates = self._dedupe(
+            [candidate for candidate in candidates if candidate and "http" not in candidate.lower()]
+        )
+        if not cleaned_candidates:
+            return None
+        ordered = sorted(
+            cleaned_candidates,
+            key=lambda value: (
+                0 if self._looks_like_venue(value) else 1,
+                0 if re.search(r"[\u4e00-\u9fff]", value) else 1,
+                len(value),
+            ),
+        )
+        return ordered[0]
+
+    def _pick_best_address(self, candidates: list[str]) -> str | None:
+        cleaned_candidates = self._dedupe(
+            [candidate for candidate in candidates if candidate and "http" not in candidate.lower()]
+        )
+        if not cleaned_candidates:
+            return None
+        ordered = sorted(cleaned_candidates, key=lambda value: (0 if self._looks_like_address(value) else 1, len(value)))
+        return ordered[0]
+
+    def _extract_location(self, sections: dict[str, list[str]], intro_lines: list[str]) -> tuple[str | None, str | None]:
+        venue_candidates: list[str] = []
+        address_candidates: list[str] = []
+
+        for raw_line in sections["location"]:
+            line = self._clean_location_candidate(raw_line)
+            if not line:
+                continue
+
+            bracket_match = re.match(r"(.+?)\s*[(（]([^()（）]+)[)）]$", line)
+            if bracket_match:
+                outer = self._clean_text(bracket_match.group(1))
+                inner = self._clean_text(bracket_match.group(2))
+                if self._looks_like_address(inner):
+                    venue_candidates.append(outer)
+                    address_candidates.append(inner)
+                    continue
+                venue_candidates.append(line)
+                continue
+
+            if self._is_reasonable_address_candidate(line) and not self._looks_like_venue(line):
+                address_candidates.append(line)
+                continue
+
+            venue_candidates.append(line)
+
+        if not address_candidates:
+            for line in intro_lines:
+                cleaned_line = self._clean_location_candidate(line)
+                if not self._is_reasonable_address_candidate(cleaned_line):
+                    continue
+                features = self._line_features(cleaned_line)
+                if not features.has_datetime and not self._line_is_price(features):
+                    address_candidates.append(cleaned_line)
+
+        venue_name = self._pick_best_venue(venue_candidates)
+        address = self._pick_best_address(address_candidates)
+
+        if venue_name and address and compact_lower(venue_name) == compact_lower(address):
+            address = None
+        if address and self._looks_like_venue(address) and not self._looks_like_address(address):
+            address = None
+        if not venue_name and address:
+            return None, address
+        return venue_name, address
+
+    def _simplify_page_title(self, page_title: str) -> str | None:
+        title = self._clean_text(page_title)
+        title = re.sub(r"\s*\|\s*tixcraft.*$", "", title, flags=re.IGNORECASE)
+        title = re.sub(r"\s*@\s*.+$", "", title)
+        return self._normalize_value(title)
+
+    def _extract_event_name(self, payload: dict[str, Any]) -> str:
+        title = self._normalize_value(payload.get("title"))
+        if title:
+            return title
+
+        page_title = self._simplify_page_title(payload.get("pageTitle", ""))
+        if page_title:
+            return page_title
+
+        data_layer = payload.get("dataLayer") or {}
+        artist_name = self._normalize_value(data_layer.get("artistName"))
+        if artist_name:
+            return artist_name
+
+        return "Unknown Event"
+
+    def _guess_artist_from_title(self, event_name: str, category_values: set[str]) -> str | None:
+        working = self._strip_event_title_prefixes(event_name)
+        if not working:
+            return None
+
+        if self._contains_generic_artist_keyword(working) or self._contains_generic_artist_title_keyword(working):
+            return None
+        if not self._contains_artist_event_keyword(working):
+            return None
+
+        candidate: str | None = None
+        match = re.search(
+            r"(年度專場|專場|专场|演唱會|演唱会|巡迴|巡回|見面會|见面会|音樂會|音乐会|FANCON|FAN MEETING|WORLD TOUR|ASIA TOUR|TOUR|CONCERT|LIVE|SHOWCASE|ENCORE)",
+            working,
+            flags=re.IGNORECASE,
+        )
+        if match:
+            candidate = self._clean_artist_candidate(working[: match.start()])
+
+        if not candidate and ("：" in working or ":" in working):
+            separator = "：" if "：" in working else ":"
+            candidate = self._clean_artist_candidate(working.split(separator, 1)[0])
+
+        if not candidate and re.search(r"\b20\d{2}\b", working):
+            candidate = self._clean_artist_candidate(re.split(r"\b20\d{2}\b", working, maxsplit=1)[0])
+
+        if self._looks_like_valid_artist_candidate(candidate, event_name, category_values, require_title_support=True):
+            return candidate
+        return None
+
+    def _extract_artist_name(self, payload: dict[str, Any], event_name: str, intro_lines: list[str]) -> str | None:
+        data_layer = payload.get("dataLayer") or {}
+        artist_name = self._normalize_value(data_layer.get("artistName"))
+        artist_name_en = self._normalize_value(data_layer.get("artistNameEn"))
+        child_category = self._normalize_value(data_layer.get("childCategoryName"))
+        child_category_en = self._normalize_value(data_layer.get("childCategoryNameEn"))
+        parent_category = self._normalize_value(data_layer.get("parentCategoryName"))
+        parent_category_en = self._normalize_value(data_layer.get("parentCategoryNameEn"))
+
+        if self._is_sports_category(child_category, child_category_en, parent_category, parent_category_en):
+            return None
+
+        category_values = {
+            value.lower()
+            for value in (child_category, child_category_en, parent_category, parent_category_en)
+            if value
+        }
+
+        explicit_artist = self._extract_explicit_artist_name(intro_lines, event_name, category_values)
+        if explicit_artist:
+            return explicit_artist
+
+        for candidate in (artist_name, artist_name_en):
+            if self._looks_like_valid_artist_candidate(candidate, event_name, category_values, require_title_support=True):
+                return self._clean_artist_candidate(candidate)
+
+        return self._guess_artist_from_title(event_name, category_values)
+
+    def _build_event_record(self, url: str, payload: dict[str, Any]) -> dict[str, Any]:
+        intro_lines = self._split_intro_lines(payload.get("intro", ""))
+        sections = self._extract_sections(intro_lines)
+
+        event_name = self._extract_event_name(payload)
+        ticket_price, ticket_types = self._extract_ticket_data(sections, intro_lines)
+        event_time = self._format_event_time(sections["event_time"])
+        sale_time = self._format_sale_time(sections["sale_time"])
+        venue_name, address = self._extract_location(sections, intro_lines)
+        artist_name = self._extract_artist_name(payload, event_name, intro_lines)
+
+        record: dict[str, Any] = {
+            "event_name": event_name,
+            "event_link": url,
+        }
+
+        optional_fields = {
+            "ticket_price": ticket_price,
+            "ticket_types": ticket_types,
+            "event_time": event_time,
+            "sale_time": sale_time,
+            "venue_name": venue_name,
+            "address": address,
+            "artist_name": artist_name,
+        }
+        for key, value in optional_fields.items():
+            normalized = self._normalize_value(value)
+            if normalized:
+                record[key] = normalized
+
+        return record
+
+
+_worker_parser: TixcraftEventParser | None = None
+
+
+def parse_payload(url: str, payload: dict[str, Any]) -> dict[str, Any]:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = TixcraftEventParser()
+    return _worker_parser._build_event_record(url, payload)
+
+
+def parse_payload_timed(url: str, payload: dict[str, Any]) -> tuple[dict[str, Any], float]:
+    started = time.perf_counter()
+    record = parse_payload(url, payload)
+    return record, time.perf_counter() - started
+
+
+def parse_payload_batch(items: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+    return [parse_payload(url, payload) for url, payload in items]
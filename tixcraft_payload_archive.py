@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+
+INDEX_FILENAME = "index.jsonl"
+OBJECTS_DIRNAME = "objects"
+
+
+class PayloadArchive:
+    def __init__(self, root: Path | str):
+        self.root = Path(root)
+        self.objects_dir = self.root / OBJECTS_DIRNAME
+        self.index_path = self.root / INDEX_FILENAME
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest[2:]}.json"
+
+    def store(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        run_id: str | None = None,
+        position: int | None = None,
+        fetched_at: float | None = None,
+    ) -> str:
+        data = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        entry = {
+            "url": url,
+            "fetched_at": round(fetched_at if fetched_at is not None else time.time(), 3),
+            "sha256": digest,
+            "run_id": run_id,
+            "position": position,
+        }
+
+        path = self._object_path(digest)
+        with self._lock:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                temp_path.write_bytes(data)
+                os.replace(temp_path, path)
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.index_path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return digest
+
+    def reference(self, links: list[tuple[str, int | None]], run_id: str | None = None) -> int:
+        wanted = dict(links)
+        latest: dict[str, dict[str, Any]] = {}
+        for entry in self.entries():
+            if entry["url"] in wanted:
+                latest[entry["url"]] = entry
+        references = [
+            {
+                "url": url,
+                "fetched_at": latest[url]["fetched_at"],
+                "sha256": latest[url]["sha256"],
+                "run_id": run_id,
+                "position": position,
+                "reference": True,
+            }
+            for url, position in wanted.items()
+            if url in latest
+        ]
+        if references:
+            with self._lock:
+                with self.index_path.open("a", encoding="utf-8") as handle:
+                    for entry in references:
+                        handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return len(references)
+
+    def load(self, digest: str) -> dict[str, Any]:
+        return json.loads(self._object_path(digest).read_text(encoding="utf-8"))
+
+    def entries(self) -> Iterator[dict[str, Any]]:
+        if not self.index_path.exists():
+            return
+        with self.index_path.open(encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and entry.get("url") and entry.get("sha256"):
+                    yield entry
+
+    def run_ids(self) -> list[str]:
+        return list(dict.fromkeys(entry["run_id"] for entry in self.entries() if entry.get("run_id")))
+
+    def iter_run(self, run_id: str | None = None) -> Iterator[tuple[str, dict[str, Any]]]:
+        run_ids = self.run_ids()
+        if run_id is None and run_ids:
+            run_id = run_ids[-1]
+
+        selected: dict[str, dict[str, Any]] = {}
+        for entry in self.entries():
+            if run_id is not None and entry.get("run_id") != run_id:
+                continue
+            selected[entry["url"]] = entry
+
+        ordered = sorted(
+            selected.values(),
+            key=lambda entry: (entry.get("position") is None, entry.get("position") or 0, entry["fetched_at"]),
+        )
+        for entry in ordered:
+            yield entry["url"], self.load(entry["sha256"])
@@ -1,241 +1,177 @@
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import itertools
 import json
-import logging
-import re
+import queue
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from tixcraft_checkpoint import CheckpointWriter, atomic_write_text, load_checkpoint
+from tixcraft_driver_cache import DEFAULT_DRIVER_CACHE_PATH, ChromedriverResolver
+from tixcraft_http_fetcher import HttpFetchError, HttpPayloadFetcher
+from tixcraft_metrics import MetricsRecorder, process_tree_rss
+from tixcraft_output import build_logger, write_output
+from tixcraft_parser import TixcraftEventParser, parse_payload_timed
+from tixcraft_payload_archive import PayloadArchive
+from tixcraft_replay import build_parse_executor, resolve_parse_workers
+from tixcraft_scheduler import DEFAULT_LISTING_INTERVAL_SECONDS, DEFAULT_REQUESTS_PER_HOUR, RescrapeScheduler
+from tixcraft_shard import select_shard, shard_metadata
+from tixcraft_throttle import (
+    DEFAULT_LATENCY_TARGET_SECONDS,
+    AdaptiveThrottle,
+    PageBlockedError,
+    ThrottleTicket,
+    looks_blocked,
+)
+from tixcraft_work_queue import DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS, WorkQueue, default_worker_id
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 
 HOME_URL = "https://tixcraft.com/activity"
+RETRYABLE_FETCH_ERRORS = (HttpFetchError, PageBlockedError)
 DETAIL_LINK_PATTERN = "/activity/detail/"
-DATE_RE = re.compile(
-    r"(?:"
-    r"\d{4}\s*[./-]\s*\d{1,2}\s*[./-]\s*\d{1,2}(?:\s*[-~至]\s*\d{1,2})?"
-    r"|\d{4}年\s*\d{1,2}\s*月\s*\d{1,2}(?:\s*[-~至]\s*\d{1,2})?\s*日"
-    r"|\d{1,2}\s*月\s*\d{1,2}(?:\s*[-~至]\s*\d{1,2})?\s*日"
-    r"|\d{1,2}\s*[./-]\s*\d{1,2}(?:\s*[-~至]\s*\d{1,2})?(?:\s*[./-]\s*\d{2,4})?"
-    r")"
-)
-TIME_RE = re.compile(r"\d{1,2}:\d{2}(?:\s*[AP]M)?", re.IGNORECASE)
-PRICE_RE = re.compile(r"(?:NT\$|\$)\s*\d[\d,]*|\d[\d,]*(?:\s*元)")
-BARE_PRICE_RE = re.compile(r"(?<!\d)(\d{1,3}(?:,\d{3})+|\d{3,5})(?!\d)")
-ADDRESS_RE = re.compile(
-    r"(?:"
-    r"[台臺新北桃竹苗中彰雲嘉南高屏宜花東澎金馬][^ \n]{0,12}[市縣]"
-    r"|[^\n]{0,12}[市縣][^\n]{0,12}(?:區|鄉|鎮|市)"
-    r"|[^\n]{0,20}(?:路|街|大道|巷|弄)(?:[^\n]{0,10}\d+號)?"
-    r"|[^\d\n]{1,20}\d+F"
-    r"|[^\n]{1,12}町"
-    r")"
-)
-GENERIC_ARTIST_KEYWORDS = (
-    "festival",
-    "音樂節",
-    "音乐节",
-    "嘉年華",
-    "嘉年华",
-    "開唱",
-    "开唱",
-    "樂祭",
-    "乐祭",
-    "祭",
-)
-GENERIC_ARTIST_TITLE_KEYWORDS = (
-    "主場賽事",
-    "主场赛事",
-    "季套票",
-    "套票專區",
-    "套票专区",
-    "門票",
-    "门票",
-    "售票",
-    "票券",
-    "票務",
-    "票务",
-    "聯票",
-    "联票",
-    "限定",
-    "聯名",
-    "联名",
-    "銀行",
-    "银行",
-    "專區",
-    "专区",
-)
-ARTIST_EVENT_KEYWORDS = (
-    "年度專場",
-    "專場",
-    "专场",
-    "演唱會",
-    "演唱会",
-    "巡迴",
-    "巡回",
-    "見面會",
-    "见面会",
-    "音樂會",
-    "音乐会",
-    "fancon",
-    "fan meeting",
-    "world tour",
-    "asia tour",
-    "tour",
-    "concert",
-    "live",
-    "showcase",
-    "encore",
-)
-EXPLICIT_ARTIST_LABELS = (
-    "藝人",
-    "艺人",
-    "藝人名稱",
-    "艺人名称",
-    "演出藝人",
-    "演出艺人",
-    "演出者",
-    "出演",
-    "演出單位",
-    "演出单位",
-    "表演嘉賓",
-    "表演嘉宾",
-    "artist",
-    "artists",
-    "lineup",
-    "performer",
-    "performers",
-)
-TITLE_BRAND_MARKERS = (
-    " x ",
-    " × ",
-    "合作",
-    "限定",
-    "聯名",
-    "联名",
-    "銀行",
-    "银行",
-    "presented by",
-    "sponsored by",
-)
-SPORT_CATEGORY_KEYWORDS = (
-    "sports",
-    "sport",
-    "籃球",
-    "篮球",
-    "棒球",
-    "足球",
-    "排球",
-    "網球",
-    "网球",
-    "羽球",
-    "羽毛球",
-    "電競",
-    "电竞",
-    "賽車",
-    "赛车",
+WORKER_IDLE_POLL_SECONDS = 2.0
+DEAD_SESSION_MARKERS = (
+    "invalid session id",
+    "session deleted",
+    "not reachable",
+    "disconnected",
+    "crashed",
+    "no such window",
+    "target window already closed",
 )
-VENUE_KEYWORDS = (
-    "arena",
-    "hall",
-    "stadium",
-    "dome",
-    "center",
-    "centre",
-    "legacy",
-    "zepp",
-    "theater",
-    "theatre",
-    "小巨蛋",
-    "巨蛋",
-    "體育館",
-    "体育馆",
-    "展演",
-    "展覽館",
-    "展览馆",
-    "音樂中心",
-    "音乐中心",
-    "流行音樂中心",
-    "流行音乐中心",
-    "場館",
-    "场馆",
-    "會館",
-    "会馆",
+READINESS_OBSERVER_SCRIPT = """
+if (!window.__tixcraftReadiness) {
+    window.__tixcraftReadiness = { lastMutation: performance.now() };
+    new MutationObserver(() => {
+        window.__tixcraftReadiness.lastMutation = performance.now();
+    }).observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+}
+const idleMs = performance.now() - window.__tixcraftReadiness.lastMutation;
+const loaded = document.readyState === 'complete' && !window.__tixcraftNavigating;
+"""
+NAVIGATION_MARKER_SCRIPT = "window.__tixcraftNavigating = true;"
+TAB_NAVIGATION_SCRIPT = NAVIGATION_MARKER_SCRIPT + "window.location.href = arguments[0];"
+STEALTH_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'languages', {get: () => ['zh-TW', 'zh', 'en']});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3]});
+window.chrome = { runtime: {} };
+"""
+DETAIL_READINESS_SCRIPT = READINESS_OBSERVER_SCRIPT + """
+const readText = (selector) => document.querySelector(selector)?.innerText || '';
+const title = readText('#synopsisEventTitle');
+const intro = readText('#intro');
+const detail = Array.isArray(window.dataLayer)
+    && window.dataLayer.some((item) => item && item.event === 'EnterActivityDetail');
+return {
+    loaded: loaded,
+    ready: Boolean(title || intro),
+    signature: [title.length, intro.length, detail].join('|'),
+    idleMs: idleMs,
+};
+"""
+PAGE_WEIGHT_SCRIPT = """
+const entries = [
+    ...performance.getEntriesByType('navigation'),
+    ...performance.getEntriesByType('resource'),
+];
+return {
+    transferBytes: entries.reduce((total, entry) => total + (entry.transferSize || 0), 0),
+    decodedBytes: entries.reduce((total, entry) => total + (entry.decodedBodySize || 0), 0),
+    requests: entries.length,
+};
+"""
+BLOCKED_RESOURCE_EXTENSIONS = (
+    "png",
+    "jpg",
+    "jpeg",
+    "gif",
+    "webp",
+    "avif",
+    "svg",
+    "ico",
+    "bmp",
+    "woff",
+    "woff2",
+    "ttf",
+    "otf",
+    "eot",
+    "mp4",
+    "webm",
+    "mp3",
+    "m4a",
+    "ogg",
 )
-PLACEHOLDERS = {"", "n/a", "none", "null"}
-SECTION_FIELDS = ("event_time", "sale_time", "price", "location")
-SALE_HEADING_KEYWORDS = (
-    "預售",
-    "預購",
-    "開賣",
-    "公售",
-    "onsale",
-    "publiconsale",
-    "presale",
-    "pre-sale",
-    "會員",
-    "會員售票",
-    "會員抽選",
-    "抽選結果",
-    "抽選登記",
-    "卡友",
-    "優先購",
-    "優先購票",
-    "販售",
-    "售票",
-    "発売",
-    "販売",
-    "一般発売",
-    "一般售票",
-    "正式開賣",
-    "全面開賣",
-    "套票",
+BLOCKED_TRACKER_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googleadservices.com*",
+    "*connect.facebook.net*",
+    "*facebook.com/tr*",
+    "*analytics.tiktok.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*scorecardresearch.com*",
+    "*criteo.com*",
+    "*criteo.net*",
 )
-SALE_HEADING_NOISE_KEYWORDS = (
-    "資格",
-    "限量發送",
-    "請詳",
-    "詳見",
-    "更多資訊",
-    "主辦保留",
-    "verification",
-    "cardholder",
-    "information",
-    "email",
-    "successful",
-    "registrant",
-    "accesscode",
-    "receive",
-    "購票流程",
-    "重要注意事項",
-    "注意事項",
-    "請由",
-    "進入購票",
-    "加入大港人",
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    *(pattern for extension in BLOCKED_RESOURCE_EXTENSIONS for pattern in (f"*.{extension}", f"*.{extension}?*")),
+    *BLOCKED_TRACKER_PATTERNS,
 )
-PRICE_NOISE_KEYWORDS = (
-    "詳細資訊",
-    "請隨時關注",
-    "關於福利抽選",
-    "抽獎結果",
-    "購票前請",
-    "詳讀",
-    "入場時間",
-    "工作人員",
-    "發票開立",
-    "請至:",
-    "請至",
-    "更多訊息",
-    "更多資訊",
+DEFAULT_ALLOWED_URL_PATTERNS = (
+    "*tixcraft.com/*.js",
+    "*tixcraft.com/*.js?*",
+    "*tixcraft.com/activity/*",
 )
+LISTING_READINESS_SCRIPT = READINESS_OBSERVER_SCRIPT + """
+const count = document.querySelectorAll('div.thumbnails a[href*="/activity/detail/"]').length;
+return { loaded: loaded, ready: count > 0, signature: String(count), idleMs: idleMs };
+"""
+LISTING_CARDS_SCRIPT = """
+const detailLinks = (element) => new Set(
+    [...element.querySelectorAll('a[href*="/activity/detail/"]')].map((link) => link.href)
+).size;
+return [...document.querySelectorAll('div.thumbnails a[href*="/activity/detail/"]')]
+    .filter((node) => node.href)
+    .map((node) => {
+        let card = node;
+        while (!card.matches('div.thumbnails') && card.parentElement && detailLinks(card.parentElement) === 1) {
+            card = card.parentElement;
+        }
+        const image = card.querySelector('img');
+        return {
+            href: node.href,
+            text: card.innerText || '',
+            image: image ? image.currentSrc || image.src || '' : '',
+        };
+    });
+"""
+PAYLOAD_SCRIPT = """
+const readText = (selector) => document.querySelector(selector)?.innerText || '';
+const detail = Array.isArray(window.dataLayer)
+    ? window.dataLayer.find((item) => item && item.event === 'EnterActivityDetail') || {}
+    : {};
+return {
+    title: readText('#synopsisEventTitle'),
+    intro: readText('#intro'),
+    pageTitle: document.title || '',
+    currentUrl: window.location.href,
+    dataLayer: detail,
+};
+"""
 
 
 @dataclass
@@ -245,33 +181,120 @@ class ScraperConfig:
     headless: bool = True
     timeout_seconds: int = 20
     settle_seconds: float = 4.0
+    quiet_seconds: float = 0.5
+    readiness_poll_seconds: float = 0.1
+    workers: int = 1
+    tabs: int = 1
+    parse_workers: int = 1
+    fetcher: str = "selenium"
+    archive_dir: Path | None = None
+    incremental: bool = False
+    refresh_ttl_hours: float = 24.0
+    state_path: Path | None = None
+    checkpoint_path: Path | None = None
+    checkpoint_fsync_every: int = 10
+    resume: bool = False
+    block_resources: bool = False
+    blocked_url_patterns: tuple[str, ...] = DEFAULT_BLOCKED_URL_PATTERNS
+    allowed_url_patterns: tuple[str, ...] = DEFAULT_ALLOWED_URL_PATTERNS
+    chromedriver_path: Path | None = None
+    driver_cache_path: Path = DEFAULT_DRIVER_CACHE_PATH
+    offline: bool = False
+    metrics_path: Path | None = None
+    prometheus_path: Path | None = None
+    sqlite_path: Path | None = None
+    adaptive_concurrency: bool = False
+    min_concurrency: int = 1
+    max_requests_per_second: float = 0.0
+    latency_target_seconds: float = DEFAULT_LATENCY_TARGET_SECONDS
+    fetch_retries: int = 2
+    retry_backoff_seconds: float = 2.0
+    recycle_after_pages: int = 200
+    recycle_rss_mb: float = 1536.0
+    shard_index: int = 0
+    shard_count: int = 1
+    changes_path: Path | None = None
+
+
+@dataclass
+class PageLoadState:
+    url: str
+    started: float = field(default_factory=time.monotonic)
+    loaded_at: float | None = None
+    signature: str | None = None
+    stable_since: float = 0.0
+    ticket: ThrottleTicket | None = None
 
 
-class TixcraftPrecisionFieldScraper:
+class TixcraftPrecisionFieldScraper(TixcraftEventParser):
     def __init__(self, config: ScraperConfig | None = None):
+        super().__init__()
         self.config = config or ScraperConfig()
-        self.logger = self._build_logger()
+        self.logger = build_logger()
         self.driver: webdriver.Chrome | None = None
-
-    def _build_logger(self) -> logging.Logger:
-        logger = logging.getLogger("tixcraft_precision_field_scraper")
-        logger.setLevel(logging.INFO)
-        logger.handlers.clear()
-
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        log_path = Path(__file__).with_name("tixcraft_precision_field.log")
-
-        file_handler = logging.FileHandler(log_path, encoding="utf-8")
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
-
-        return logger
+        self.pool_drivers: list[webdriver.Chrome] = []
+        self.readiness_waits: dict[str, float] = {}
+        self.page_weights: dict[str, dict[str, int]] = {}
+        self.listing_fingerprints: dict[str, str | None] = {}
+        self.listing_links: list[str] = []
+        self.startup_timings: list[dict[str, float]] = []
+        self._progress = itertools.count(1)
+        self.driver_resolver = ChromedriverResolver(
+            cache_path=self.config.driver_cache_path,
+            override_path=self.config.chromedriver_path,
+            offline=self.config.offline,
+        )
+        self.http_fetcher: HttpPayloadFetcher | None = None
+        self._browser_fallback_lock = threading.Lock()
+        self._driver_lock = threading.Lock()
+        self._failure_lock = threading.Lock()
+        self._driver_pages: dict[int, int] = {}
+        self._driver_rss: dict[int, int] = {}
+        self._attempts: dict[str, int] = {}
+        self._retry_at: dict[str, float] = {}
+        self.failures: dict[str, dict[str, Any]] = {}
+        self.retryable_errors: tuple[type[BaseException], ...] = RETRYABLE_FETCH_ERRORS
+        self._selenium_available: bool | None = None
+        self.request_budget: RescrapeScheduler | None = None
+        self.archive = PayloadArchive(self.config.archive_dir) if self.config.archive_dir else None
+        self.metrics = MetricsRecorder(self.config.metrics_path, self.config.prometheus_path)
+        tabs = self.config.tabs if self.config.fetcher == "selenium" else 1
+        self.throttle = AdaptiveThrottle(
+            max_concurrency=max(1, self.config.workers) * max(1, tabs),
+            min_concurrency=self.config.min_concurrency,
+            adaptive=self.config.adaptive_concurrency,
+            rate=self.config.max_requests_per_second,
+            latency_target_seconds=self.config.latency_target_seconds,
+            timeout_errors=(TimeoutError,),
+            metrics=self.metrics,
+        )
+        if self.config.fetcher == "selenium":
+            self._load_selenium()
+
+    def _load_selenium(self) -> None:
+        if self.retryable_errors is not RETRYABLE_FETCH_ERRORS:
+            return
+        with self.metrics.stage("selenium_import"):
+            importlib.import_module("selenium.webdriver")
+            from selenium.common.exceptions import TimeoutException, WebDriverException
+
+        self.retryable_errors = (*RETRYABLE_FETCH_ERRORS, WebDriverException)
+        self.throttle.timeout_errors = (TimeoutException, TimeoutError)
+
+    def _browser_fallback_available(self) -> bool:
+        if self._selenium_available is None:
+            self._selenium_available = importlib.util.find_spec("selenium") is not None
+            if not self._selenium_available:
+                self.logger.warning("Selenium is not installed; HTTP fetch failures will not fall back to Chrome")
+        return self._selenium_available
 
     def _build_driver(self) -> webdriver.Chrome:
+        self._load_selenium()
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service as ChromeService
+
         options = Options()
         if self.config.headless:
             options.add_argument("--headless=new")
@@ -286,1121 +309,1213 @@ class TixcraftPrecisionFieldScraper:
         )
         options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         options.add_experimental_option("useAutomationExtension", False)
+        if self.config.block_resources:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+        if self.config.tabs > 1:
+            options.page_load_strategy = "none"
 
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.execute_cdp_cmd(
-            "Page.addScriptToEvaluateOnNewDocument",
-            {
-                "source": """
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                Object.defineProperty(navigator, 'languages', {get: () => ['zh-TW', 'zh', 'en']});
-                Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3]});
-                window.chrome = { runtime: {} };
-                """,
-            },
+        resolve_started = time.monotonic()
+        driver_path = self.driver_resolver.resolve()
+        resolve_seconds = time.monotonic() - resolve_started
+
+        launch_started = time.monotonic()
+        try:
+            driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+        except SessionNotCreatedException:
+            if not self.driver_resolver.invalidate():
+                raise
+            self.logger.warning("Cached chromedriver %s no longer matches Chrome; resolving again", driver_path)
+            driver_path = self.driver_resolver.resolve()
+            driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+        launch_seconds = time.monotonic() - launch_started
+
+        browser_version = (driver.capabilities or {}).get("browserVersion")
+        self.driver_resolver.record_browser_version(browser_version)
+        self.startup_timings.append({"resolve_seconds": resolve_seconds, "launch_seconds": launch_seconds})
+        self.metrics.observe(
+            "driver_startup",
+            resolve_seconds + launch_seconds,
+            resolve_seconds=round(resolve_seconds, 6),
+            launch_seconds=round(launch_seconds, 6),
         )
+        self.logger.info(
+            "Chrome %s started: chromedriver resolved in %.2fs (%s), browser launched in %.2fs",
+            browser_version or "unknown",
+            resolve_seconds,
+            self.driver_resolver.source,
+            launch_seconds,
+        )
+        self._prepare_tab(driver)
         return driver
 
+    def _prepare_tab(self, driver: webdriver.Chrome) -> None:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_SCRIPT})
+        if self.config.block_resources:
+            self._apply_resource_blocking(driver)
+
+    def _ensure_tabs(self, driver: webdriver.Chrome, count: int) -> list[str]:
+        handles = list(driver.window_handles)
+        while len(handles) < count:
+            driver.switch_to.new_window("tab")
+            self._prepare_tab(driver)
+            handles.append(driver.current_window_handle)
+        return handles[:count]
+
+    def _blocked_url_patterns(self) -> list[str]:
+        allowed = self.config.allowed_url_patterns
+        return [
+            pattern
+            for pattern in dict.fromkeys(self.config.blocked_url_patterns)
+            if not any(fnmatchcase(allow, pattern) or fnmatchcase(pattern, allow) for allow in allowed)
+        ]
+
+    def _apply_resource_blocking(self, driver: webdriver.Chrome) -> None:
+        patterns = self._blocked_url_patterns()
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        self.logger.debug("Blocking %s URL patterns via CDP", len(patterns))
+
     def _ensure_driver(self) -> webdriver.Chrome:
         if self.driver is None:
             self.driver = self._build_driver()
         return self.driver
 
+    def _ensure_driver_pool(self, size: int) -> list[webdriver.Chrome]:
+        missing = size - 1 - len(self.pool_drivers)
+        if missing > 0:
+            with ThreadPoolExecutor(max_workers=missing) as executor:
+                self.pool_drivers.extend(executor.map(lambda _: self._build_driver(), range(missing)))
+        return [self._ensure_driver(), *self.pool_drivers[: size - 1]]
+
+    def _ensure_http_fetcher(self) -> HttpPayloadFetcher:
+        if self.http_fetcher is None:
+            self.http_fetcher = HttpPayloadFetcher(timeout_seconds=self.config.timeout_seconds)
+        return self.http_fetcher
+
     def close(self) -> None:
+        if self.http_fetcher:
+            self.http_fetcher.close()
+            self.http_fetcher = None
+        for driver in self.pool_drivers:
+            driver.quit()
+        self.pool_drivers = []
         if self.driver:
             self.driver.quit()
             self.driver = None
 
-    def _wait_for_page_ready(self, driver: webdriver.Chrome) -> None:
-        WebDriverWait(driver, self.config.timeout_seconds).until(
-            lambda current: current.execute_script("return document.readyState") == "complete"
+    def _advance_page_load(self, state: PageLoadState, probe: dict[str, Any]) -> bool:
+        now = time.monotonic()
+        if now - state.started >= self.config.timeout_seconds:
+            from selenium.common.exceptions import TimeoutException
+
+            raise TimeoutException(f"Timed out after {self.config.timeout_seconds}s waiting for {state.url}")
+        if not probe.get("loaded"):
+            return False
+
+        if state.loaded_at is None:
+            state.loaded_at = now
+        signature = probe.get("signature")
+        if signature != state.signature:
+            state.signature = signature
+            state.stable_since = now
+            return False
+        if not probe.get("ready"):
+            return False
+
+        quiet = (
+            now - state.stable_since >= self.config.quiet_seconds
+            and probe.get("idleMs", 0) >= self.config.quiet_seconds * 1000
         )
-        time.sleep(self.config.settle_seconds)
+        return quiet or now - state.loaded_at >= self.config.settle_seconds
+
+    def _wait_for_page_ready(
+        self,
+        driver: webdriver.Chrome,
+        probe_script: str = DETAIL_READINESS_SCRIPT,
+        url: str = "",
+    ) -> float:
+        state = PageLoadState(url=url or "page")
+        while not self._advance_page_load(state, driver.execute_script(probe_script) or {}):
+            time.sleep(self.config.readiness_poll_seconds)
+        return self._finish_page_load(state)
+
+    def _finish_page_load(self, state: PageLoadState) -> float:
+        now = time.monotonic()
+        loaded_at = state.loaded_at or now
+        self.metrics.observe("readiness", loaded_at - state.started, state.url)
+        self.metrics.observe("settle", now - loaded_at, state.url)
+        return now - state.started
+
+    def _navigate(self, driver: webdriver.Chrome, url: str) -> None:
+        with self.metrics.stage("navigate", url):
+            driver.execute_script(NAVIGATION_MARKER_SCRIPT)
+            driver.get(url)
+
+    def _load_listing_cards(self) -> list[dict[str, str]]:
+        with self.metrics.stage("listing", HOME_URL):
+            return self._fetch_listing_cards()
+
+    def _fetch_listing_cards(self) -> list[dict[str, str]]:
+        if self.config.fetcher == "http":
+            try:
+                self._spend_request_budget()
+                return self._ensure_http_fetcher().fetch_listing(HOME_URL)
+            except HttpFetchError as exc:
+                if not self._browser_fallback_available():
+                    raise
+                self.logger.warning("HTTP listing fetch failed (%s); falling back to Selenium", exc)
+
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
 
-    def _load_listing_page(self) -> list[str]:
         driver = self._ensure_driver()
-        driver.get(HOME_URL)
-        self._wait_for_page_ready(driver)
+        self._spend_request_budget()
+        self._navigate(driver, HOME_URL)
+        self.readiness_waits[HOME_URL] = self._wait_for_page_ready(driver, LISTING_READINESS_SCRIPT, HOME_URL)
         WebDriverWait(driver, self.config.timeout_seconds).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "div.thumbnails a"))
         )
 
-        links = driver.execute_script(
-            """
-            return [...document.querySelectorAll('div.thumbnails a[href*="/activity/detail/"]')]
-                .map((node) => node.href)
-                .filter(Boolean);
-            """
-        )
+        return driver.execute_script(LISTING_CARDS_SCRIPT)
+
+    def _load_listing_page(self) -> list[str]:
+        cards = self._load_listing_cards()
 
         unique_links: list[str] = []
-        seen: set[str] = set()
-        for link in links:
-            if DETAIL_LINK_PATTERN not in link or link in seen:
+        self.listing_fingerprints = {}
+        for card in cards:
+            link = card.get("href") or ""
+            if DETAIL_LINK_PATTERN not in link or link in self.listing_fingerprints:
                 continue
-            seen.add(link)
+            self.listing_fingerprints[link] = listing_card_fingerprint(card)
             unique_links.append(link)
 
         if self.config.limit:
             unique_links = unique_links[: self.config.limit]
 
         self.logger.info("Collected %s activity links", len(unique_links))
-        return unique_links
-
-    def _fetch_payload(self, url: str) -> dict[str, Any]:
-        driver = self._ensure_driver()
-        driver.get(url)
-        self._wait_for_page_ready(driver)
-        WebDriverWait(driver, self.config.timeout_seconds).until(
-            lambda current: current.execute_script(
-                "return Boolean(document.querySelector('#synopsisEventTitle') || document.querySelector('#intro'));"
+        self.listing_links = unique_links
+        if self.config.shard_count > 1:
+            unique_links = select_shard(unique_links, self.config.shard_index, self.config.shard_count)
+            self.logger.info(
+                "Shard %s/%s: scraping %s of %s links",
+                self.config.shard_index,
+                self.config.shard_count,
+                len(unique_links),
+                len(self.listing_links),
             )
-        )
-
-        return driver.execute_script(
-            """
-            const readText = (selector) => document.querySelector(selector)?.innerText || '';
-            const detail = Array.isArray(window.dataLayer)
-                ? window.dataLayer.find((item) => item && item.event === 'EnterActivityDetail') || {}
-                : {};
-            return {
-                title: readText('#synopsisEventTitle'),
-                intro: readText('#intro'),
-                pageTitle: document.title || '',
-                currentUrl: window.location.href,
-                dataLayer: detail,
-            };
-            """
-        )
-
-    def _clean_text(self, text: str | None) -> str:
-        if not text:
-            return ""
-        cleaned = text.replace("\u00a0", " ").replace("\u3000", " ").replace("\ufeff", "").replace("\u200b", "")
-        cleaned = cleaned.replace("｜", ":").replace("：", ":").replace("﹕", ":").replace("／", "/")
-        cleaned = cleaned.replace("\r", "\n")
-        cleaned = re.sub(r"[ \t]+", " ", cleaned)
-        cleaned = re.sub(r"\n{2,}", "\n", cleaned)
-        return cleaned.strip()
-
-    def _normalize_value(self, value: str | None) -> str | None:
-        cleaned = self._clean_text(value)
-        if not cleaned:
-            return None
-        if cleaned.lower() in PLACEHOLDERS:
-            return None
-        return cleaned
-
-    def _contains_generic_artist_keyword(self, text: str) -> bool:
-        lowered = self._clean_text(text).lower()
-        return any(keyword in lowered for keyword in GENERIC_ARTIST_KEYWORDS)
-
-    def _contains_generic_artist_title_keyword(self, text: str) -> bool:
-        lowered = self._clean_text(text).lower()
-        return any(keyword in lowered for keyword in GENERIC_ARTIST_TITLE_KEYWORDS)
-
-    def _is_sports_category(self, *values: str | None) -> bool:
-        lowered_values = [self._clean_text(value).lower() for value in values if value]
-        return any(any(keyword in value for keyword in SPORT_CATEGORY_KEYWORDS) for value in lowered_values)
-
-    def _contains_artist_event_keyword(self, text: str) -> bool:
-        lowered = self._clean_text(text).lower()
-        return any(keyword in lowered for keyword in ARTIST_EVENT_KEYWORDS)
-
-    def _strip_event_title_prefixes(self, title: str) -> str:
-        cleaned = self._clean_text(title)
-        cleaned = re.sub(r"^【[^】]+】\s*", "", cleaned)
-        cleaned = re.sub(r"^\d{4}(?:-\d{2})?\s*", "", cleaned)
-        return cleaned.strip()
-
-    def _contains_brand_marker(self, text: str) -> bool:
-        lowered = self._clean_text(text).lower()
-        compact = self._compact(text).lower()
-        return (
-            any(marker in lowered for marker in TITLE_BRAND_MARKERS)
-            or bool(re.search(r"[\u4e00-\u9fffA-Za-z0-9][x×][\u4e00-\u9fffA-Za-z0-9]", self._clean_text(text)))
-            or any(
-            keyword in compact for keyword in GENERIC_ARTIST_TITLE_KEYWORDS
-        )
-        )
-
-    def _clean_artist_candidate(self, value: str | None) -> str | None:
-        cleaned = self._normalize_value(value)
-        if not cleaned:
-            return None
-        cleaned = re.sub(r"^【[^】]+】\s*", "", cleaned)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip(" -:/")
-        if not cleaned:
-            return None
-        return cleaned
-
-    def _has_structured_title_artist_signal(self, event_name: str, candidate: str | None) -> bool:
-        title = self._strip_event_title_prefixes(event_name)
-        cleaned_candidate = self._clean_artist_candidate(candidate)
-        if not title or not cleaned_candidate:
-            return False
-
-        title_lower = title.lower()
-        candidate_lower = cleaned_candidate.lower()
-        if not title_lower.startswith(candidate_lower):
-            return False
+        return unique_links
 
-        suffix = title[len(cleaned_candidate) :].strip()
-        if not suffix:
-            return False
-        if self._contains_artist_event_keyword(suffix):
-            return True
-        if re.search(r"[《〈＜「『].+[》〉＞」』]", title) and re.search(
-            r"(\bin\b\s+[A-Za-z][A-Za-z ]+|台北站|臺北站|高雄站|台中站|臺中站|桃園站|台南站|臺南站|TAIPEI|KAOHSIUNG|TAICHUNG|TAINAN|TAOYUAN)\s*$",
-            title,
-            flags=re.IGNORECASE,
-        ):
-            return True
-        if re.search(r"(粉絲見面會|粉丝见面会|fan meeting|tour|concert|live)", suffix, flags=re.IGNORECASE):
-            return True
-        return False
-
-    def _looks_like_valid_artist_candidate(
+    def _fetch_payload(self, url: str, driver: webdriver.Chrome | None = None) -> dict[str, Any]:
+        if self.config.fetcher == "http":
+            try:
+                return self._fetch_http_payload(url)
+            except HttpFetchError as exc:
+                if not self._browser_fallback_available():
+                    raise
+                self.logger.warning("HTTP fetch failed for %s (%s); falling back to Selenium", url, exc)
+            if driver is None:
+                with self._browser_fallback_lock:
+                    return self._fetch_browser_payload(url, self._ensure_driver())
+        return self._fetch_browser_payload(url, driver)
+
+    def _fetch_http_payload(self, url: str) -> dict[str, Any]:
+        fetcher = self._ensure_http_fetcher()
+        self._spend_request_budget()
+        with self.throttle.slot(url), self.metrics.stage("http_fetch", url):
+            payload = fetcher.fetch(url)
+        self.metrics.record_page(url, fetcher.last_response_bytes())
+        return payload
+
+    def _fetch_browser_payload(self, url: str, driver: webdriver.Chrome | None = None) -> dict[str, Any]:
+        driver = driver or self._ensure_driver()
+        self._spend_request_budget()
+        with self.throttle.slot(url):
+            self._navigate(driver, url)
+            self.readiness_waits[url] = self._wait_for_page_ready(driver, DETAIL_READINESS_SCRIPT, url)
+            payload = self._extract_browser_payload(url, driver)
+            if looks_blocked(payload):
+                raise PageBlockedError(f"Blocked page for {url} (title {payload.get('pageTitle')!r})")
+        return payload
+
+    def _fetch_with_retries(
         self,
-        candidate: str | None,
-        event_name: str,
-        category_values: set[str],
-        require_title_support: bool,
-    ) -> bool:
-        cleaned = self._clean_artist_candidate(candidate)
-        if not cleaned:
-            return False
-
-        lowered = cleaned.lower()
-        if len(cleaned) < 2 or len(cleaned) > 40:
-            return False
-        if lowered in category_values:
-            return False
-        if DATE_RE.search(cleaned) or TIME_RE.search(cleaned) or PRICE_RE.search(cleaned):
-            return False
-        if self._contains_generic_artist_keyword(cleaned) or self._contains_generic_artist_title_keyword(cleaned):
-            return False
-        if self._contains_brand_marker(cleaned):
-            return False
-
-        if not require_title_support:
-            return True
-
-        normalized_title = self._strip_event_title_prefixes(event_name)
-        normalized_title_lower = normalized_title.lower()
-
-        if normalized_title_lower == lowered:
-            return True
-        if self._has_structured_title_artist_signal(normalized_title, cleaned):
-            return True
-        if self._contains_brand_marker(normalized_title) and not self._contains_artist_event_keyword(normalized_title):
-            return False
-
-        if lowered in normalized_title_lower:
-            suffix = normalized_title_lower.split(lowered, 1)[1].strip(" :-:：")
-            if suffix and self._contains_artist_event_keyword(suffix):
-                return True
-            if suffix and not self._contains_brand_marker(suffix) and not self._contains_generic_artist_keyword(suffix):
-                return len(suffix) <= 30
-
-        return self._contains_artist_event_keyword(normalized_title) and not self._contains_brand_marker(normalized_title)
-
-    def _extract_explicit_artist_name(self, intro_lines: list[str], event_name: str, category_values: set[str]) -> str | None:
-        candidates: list[str] = []
-        explicit_labels = {self._compact(item).lower() for item in EXPLICIT_ARTIST_LABELS}
-        for line in intro_lines:
-            stripped = self._strip_bullet_prefix(line)
-            if ":" not in stripped:
-                continue
-            raw_label, raw_content = stripped.split(":", 1)
-            label = self._compact(raw_label).lower()
-            if label not in explicit_labels:
-                continue
-            candidate = self._clean_artist_candidate(raw_content)
-            if self._looks_like_valid_artist_candidate(candidate, event_name, category_values, require_title_support=False):
-                candidates.append(candidate)
-
-        deduped = self._dedupe(candidates)
-        return " / ".join(deduped) if deduped else None
-
-    def _compact(self, text: str) -> str:
-        return re.sub(r"\s+", "", self._clean_text(text))
-
-    def _strip_bullet_prefix(self, text: str) -> str:
-        cleaned = self._clean_text(text)
-        while cleaned:
-            first = cleaned[0]
-            if first.isalnum() or "\u4e00" <= first <= "\u9fff":
-                break
-            cleaned = cleaned[1:].lstrip()
-        return cleaned.strip()
-
-    def _clean_location_candidate(self, text: str) -> str:
-        cleaned = self._strip_bullet_prefix(text)
-        cleaned = re.sub(r"^(?:演出地點|活動地點|地點|venue|location)\s*:\s*", "", cleaned, flags=re.IGNORECASE)
-        return self._clean_text(cleaned)
-
-    def _label_matches_aliases(self, label: str, aliases: tuple[str, ...] | list[str] | set[str]) -> bool:
-        compact_label = self._compact(label).lower()
-        return any(
-            compact_label == compact_alias
-            or compact_label.startswith(compact_alias)
-            or compact_label.endswith(compact_alias)
-            for compact_alias in (self._compact(alias).lower() for alias in aliases)
-        )
-
-    def _split_intro_lines(self, intro: str) -> list[str]:
-        lines: list[str] = []
-        for raw_line in self._clean_text(intro).splitlines():
-            line = self._strip_bullet_prefix(raw_line)
-            if not line:
+        url: str,
+        driver: webdriver.Chrome | None = None,
+    ) -> tuple[dict[str, Any] | None, webdriver.Chrome | None]:
+        with self._failure_lock:
+            self._attempts.pop(url, None)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                payload = self._fetch_payload(url, driver)
+            except self.retryable_errors as exc:
+                if self._session_lost(exc):
+                    driver = self._replace_driver(driver, f"{type(exc).__name__} on {url}")
+                if not self._note_failure(url, exc):
+                    return None, driver
+                time.sleep(self.config.retry_backoff_seconds * 2 ** (attempt - 1))
                 continue
-            lines.append(line)
-        return lines
-
-    def _is_generic_sale_heading(self, text: str) -> bool:
-        compact = self._compact(self._strip_bullet_prefix(text)).lower().strip(":：】〛」")
-        generic_aliases = ("售票階段及說明", "售票資訊", "售票方式", "售票相關資訊", "門票販售時間", "ticketsalesschedule")
-        return self._label_matches_aliases(compact, generic_aliases)
-
-    def _has_date_or_time(self, text: str) -> bool:
-        return bool(DATE_RE.search(text) or TIME_RE.search(text))
-
-    def _looks_like_price_context(self, text: str) -> bool:
-        stripped = self._strip_bullet_prefix(text)
-        compact = self._compact(stripped).lower()
-        lowered = stripped.lower()
-        if any(keyword in compact for keyword in ("票價", "活動票價", "演出票價", "ticketprice", "ticketprices")):
-            return True
-        return bool(re.search(r"\bticket\s*prices?\b|\bprice\b", lowered))
-
-    def _looks_like_sale_heading_text(self, text: str, allow_datetime: bool = False) -> bool:
-        cleaned = self._strip_bullet_prefix(text)
-        compact = self._compact(cleaned).lower().strip(":：】〛」")
-        if not compact:
-            return False
-        if self._is_generic_sale_heading(cleaned):
-            return True
-        if "http" in compact or PRICE_RE.search(cleaned):
-            return False
-        if not allow_datetime and self._has_date_or_time(cleaned):
-            return False
-        if len(cleaned) > 40:
+            self._note_success(url)
+            return payload, driver
+
+    def _spend_request_budget(self) -> None:
+        if self.request_budget is None:
+            return
+        wait = self.request_budget.budget_wait(time.time())
+        if wait > 0:
+            self.logger.info("Request budget exhausted; waiting %.0fs", wait)
+            time.sleep(wait)
+        self.request_budget.spend(time.time())
+
+    def _session_lost(self, exc: BaseException) -> bool:
+        if isinstance(exc, RETRYABLE_FETCH_ERRORS) or isinstance(exc, self.throttle.timeout_errors):
             return False
-        if any(mark in cleaned for mark in ("。", "！", "!", "？", "?")):
-            return False
-        if any(noise in compact for noise in SALE_HEADING_NOISE_KEYWORDS):
-            return False
-        return any(keyword in compact for keyword in SALE_HEADING_KEYWORDS)
-
-    def _looks_like_sale_datetime(self, text: str) -> bool:
-        compact = self._compact(text).lower()
-        if any(keyword in compact for keyword in SALE_HEADING_KEYWORDS):
-            return True
-        return any(marker in text for marker in ("~", "～", "至"))
-
-    def _sale_entry_key(self, text: str) -> str:
-        compact = self._compact(text).lower()
-        stage_aliases = {
-            "member_draw_registration": ("會員抽選登記", "会員抽選受付"),
-            "member_draw_result": ("會員抽選結果", "会員抽選結果"),
-            "member_sale": ("會員售票時間", "會員售票", "会員販売期間", "会員販売"),
-            "general_sale": ("一般售票", "一般発売", "発売日時"),
-            "member_presale": ("會員預售", "會員預購", "beus會員預購", "livenationtaiwan會員預售"),
-            "card_presale": ("卡友預售", "mastercard"),
-            "general_open": ("正式開賣", "全面開賣", "publiconsale", "onsale"),
-        }
-        stage_key = compact
-        for alias, keywords in stage_aliases.items():
-            if any(keyword in compact for keyword in keywords):
-                stage_key = alias
-                break
-        number_key = "-".join(re.findall(r"\d+", self._normalize_datetime_text(text)))
-        return f"{stage_key}|{number_key}"
-
-    def _split_datetime_location_pair(self, line: str) -> tuple[str | None, str | None]:
-        parts = [self._clean_text(part) for part in re.split(r"\s*[|｜]\s*", self._strip_bullet_prefix(line)) if self._clean_text(part)]
-        if len(parts) != 2:
-            return None, None
-        left, right = parts
-        if self._has_date_or_time(left) and not self._has_date_or_time(right) and not PRICE_RE.search(right):
-            return left, right
-        if self._has_date_or_time(right) and not self._has_date_or_time(left) and not PRICE_RE.search(left):
-            return right, left
-        return None, None
-
-    def _extract_inline_schedule_entry(self, line: str) -> tuple[str | None, str | None]:
-        cleaned = self._strip_bullet_prefix(line)
-        if not re.match(r"^(?:\d{1,4}[./-]\d{1,2}|\d{1,2}\.\d{1,2}|\d{4}年|\d{1,2}月)", cleaned):
-            return None, None
-        match = re.match(r"^(?P<datetime>.+?\d{1,2}:\d{2})\s*(?:[丨|｜]\s*)?(?P<trailing>.+)$", cleaned)
-        if not match:
-            return None, None
-        datetime_text = self._clean_text(match.group("datetime"))
-        trailing = self._clean_text(match.group("trailing"))
-        if not self._has_date_or_time(datetime_text):
-            return None, None
-        return datetime_text, trailing
-
-    def _match_label(self, line: str) -> tuple[str | None, str]:
-        stripped = self._strip_bullet_prefix(line)
-        if ":" not in stripped:
-            return None, stripped
-
-        raw_label, raw_content = stripped.split(":", 1)
-        label = self._compact(raw_label).lower()
-        content = self._clean_text(raw_content)
-
-        sale_aliases = (
-            "售票時間",
-            "開賣時間",
-            "售票日期",
-            "預售時間",
-            "publiconsale",
-            "ticketsalesschedule",
-            "onsale",
-            "presale",
-            "pre-sale",
-            "售票階段及說明",
-        )
-        event_aliases = (
-            "演出日期",
-            "演出時間",
-            "活動日期",
-            "活動時間",
-            "日期",
-            "時間",
-            "date",
-            "time",
-        )
-        price_aliases = ("活動票價", "演出票價", "票價", "票價資訊", "ticketprice", "ticketprices", "price")
-        location_aliases = ("演出地點", "活動地點", "地點", "venue", "location")
-        exact_sale_aliases = {self._compact(alias).lower() for alias in sale_aliases}
-
-        if self._label_matches_aliases(label, sale_aliases):
-            if label in exact_sale_aliases:
-                return "sale_time", content
-            cleaned_label = self._strip_bullet_prefix(raw_label)
-            return "sale_time", f"{cleaned_label} {content}".strip()
-        if self._label_matches_aliases(label, location_aliases):
-            return "location", content
-        if self._label_matches_aliases(label, price_aliases):
-            return "price", content
-        if self._label_matches_aliases(label, event_aliases):
-            return "event_time", content
-        if self._has_date_or_time(content) and not PRICE_RE.search(content):
-            cleaned_label = self._strip_bullet_prefix(raw_label)
-            if self._looks_like_sale_heading_text(cleaned_label, allow_datetime=True):
-                return "sale_time", f"{cleaned_label} {content}".strip()
-        return None, stripped
-
-    def _is_sale_stage_heading(self, line: str) -> bool:
-        return self._looks_like_sale_heading_text(line)
-
-    def _is_time_label_only(self, line: str) -> bool:
-        stripped = self._strip_bullet_prefix(line)
-        if ":" not in stripped:
-            return False
-        label = self._compact(stripped.split(":", 1)[0]).lower()
-        return any(alias in label for alias in ("時間", "日期", "time", "date")) and len(label) <= 12
-
-    def _is_continuation(self, field: str, line: str) -> bool:
-        if "http" in line.lower():
-            return False
-        if field == "event_time":
-            return self._has_date_or_time(line) and not self._is_sale_stage_heading(line) and not PRICE_RE.search(line)
-        if field == "sale_time":
-            return self._has_date_or_time(line) or self._is_sale_stage_heading(line)
-        if field == "price":
-            return self._looks_like_price_line(line)
-        if field == "location":
-            return (
-                not PRICE_RE.search(line)
-                and not self._has_date_or_time(line)
-                and not self._looks_like_price_context(line)
-                and not self._is_sale_stage_heading(line)
-                and len(line) <= 100
+        message = str(exc).lower()
+        return any(marker in message for marker in DEAD_SESSION_MARKERS)
+
+    def _note_failure(self, url: str, exc: BaseException) -> bool:
+        message = str(exc).strip().splitlines()[0] if str(exc).strip() else ""
+        with self._failure_lock:
+            attempts = self._attempts[url] = self._attempts.get(url, 0) + 1
+            retry = attempts <= self.config.fetch_retries
+            if not retry:
+                self.failures[url] = {
+                    "event_link": url,
+                    "error_type": type(exc).__name__,
+                    "error": message[:500],
+                    "attempts": attempts,
+                    "failed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                }
+        if retry:
+            self.logger.warning(
+                "Fetch failed for %s (attempt %s/%s, %s: %s); retrying",
+                url,
+                attempts,
+                self.config.fetch_retries + 1,
+                type(exc).__name__,
+                message,
             )
-        return False
-
-    def _extract_sections(self, lines: list[str]) -> dict[str, list[str]]:
-        sections = {field: [] for field in SECTION_FIELDS}
-        current_field: str | None = None
-
-        for index, line in enumerate(lines):
-            next_line = lines[index + 1] if index + 1 < len(lines) else ""
-            recent_lines = lines[max(0, index - 2) : index]
-            recent_sale_context = current_field == "sale_time" or any(
-                self._is_generic_sale_heading(previous) or self._is_sale_stage_heading(previous)
-                for previous in recent_lines
-            )
-
-            paired_time, paired_location = self._split_datetime_location_pair(line)
-            if paired_time:
-                sections["event_time"].append(paired_time)
-                if paired_location:
-                    sections["location"].append(paired_location)
-                current_field = None
-                continue
-
-            inline_time, inline_trailing = self._extract_inline_schedule_entry(line)
-            if inline_time and inline_trailing:
-                if recent_sale_context:
-                    sections["sale_time"].append(f"{inline_time} {inline_trailing}".strip())
-                elif self._looks_like_sale_heading_text(inline_trailing, allow_datetime=True):
-                    sections["sale_time"].append(f"{inline_trailing} {inline_time}".strip())
-                else:
-                    sections["event_time"].append(inline_time)
-                    if not self._looks_like_price_line(inline_trailing):
-                        sections["location"].append(inline_trailing)
-                current_field = None
-                continue
-
-            if self._is_time_label_only(line):
-                time_content = self._clean_text(line.split(":", 1)[1])
-                if recent_sale_context:
-                    sections["sale_time"].append(time_content)
-                    current_field = "sale_time"
-                    continue
-                if current_field == "event_time":
-                    sections["event_time"].append(time_content)
-                    continue
-
-            if current_field == "sale_time" and self._is_time_label_only(line):
-                sections["sale_time"].append(self._clean_text(line.split(":", 1)[1]))
-                continue
-
-            if current_field == "event_time" and self._is_time_label_only(line):
-                sections["event_time"].append(self._clean_text(line.split(":", 1)[1]))
-                continue
-
-            field, content = self._match_label(line)
-            if field:
-                current_field = field
-                if content:
-                    sections[field].append(content)
-                elif field == "sale_time" and self._is_sale_stage_heading(line) and not self._is_generic_sale_heading(line):
-                    sections[field].append(self._strip_bullet_prefix(line).rstrip(":"))
-                continue
-
-            if self._is_generic_sale_heading(line):
-                current_field = "sale_time"
-                continue
-
-            if self._is_sale_stage_heading(line) and (current_field == "sale_time" or self._has_date_or_time(next_line)):
-                current_field = "sale_time"
-                sections["sale_time"].append(self._strip_bullet_prefix(line).rstrip(":"))
-                continue
-
-            if current_field and self._is_continuation(current_field, line):
-                sections[current_field].append(line)
-                continue
-
-            if self._looks_like_price_line(line):
-                sections["price"].append(line)
-                current_field = "price"
-                continue
-
-            current_field = None
-
-        return {field: self._dedupe(values) for field, values in sections.items()}
-
-    def _dedupe(self, values: list[str]) -> list[str]:
-        seen: set[str] = set()
-        unique: list[str] = []
-        for value in values:
-            cleaned = self._clean_text(value)
-            if not cleaned or cleaned in seen:
-                continue
-            seen.add(cleaned)
-            unique.append(cleaned)
-        return unique
-
-    def _normalize_datetime_text(self, text: str) -> str:
-        normalized = self._clean_text(text)
-        normalized = re.sub(r"(?<=\d)\s*/\s*(?=\d)", "/", normalized)
-        normalized = re.sub(r"(?<=\d)\s*-\s*(?=\d)", "-", normalized)
-        normalized = re.sub(r"\s+", " ", normalized)
-        normalized = re.sub(r"(\d)\s*:\s*(\d)", r"\1:\2", normalized)
-        normalized = re.sub(r"\s*([AaPp][Mm])", r" \1", normalized)
-        return normalized.strip(" /")
-
-    def _format_event_time(self, values: list[str]) -> str | None:
-        normalized = [self._normalize_datetime_text(value) for value in values if self._has_date_or_time(value)]
-        normalized = self._dedupe(normalized)
-        if not normalized:
-            return None
-        filtered = [value for value in normalized if not self._looks_like_sale_datetime(value)]
-        if filtered:
-            normalized = filtered
-
-        result: list[str] = []
-        pending_date: str | None = None
-        for value in normalized:
-            has_date = bool(DATE_RE.search(value))
-            has_time = bool(TIME_RE.search(value))
-            if has_date and not has_time:
-                if pending_date:
-                    result.append(pending_date)
-                pending_date = value
-                continue
-            if has_time and not has_date and pending_date:
-                result.append(f"{pending_date} {value}")
-                pending_date = None
-                continue
-            if pending_date:
-                result.append(pending_date)
-                pending_date = None
-            result.append(value)
-        if pending_date:
-            result.append(pending_date)
-
-        return " / ".join(self._dedupe(result)) if result else None
-
-    def _format_sale_time(self, values: list[str]) -> str | None:
-        cleaned_values = [self._normalize_datetime_text(value) for value in values]
-        cleaned_values = self._dedupe(cleaned_values)
-        if not cleaned_values:
+        else:
+            self.logger.error("Giving up on %s after %s attempts (%s: %s)", url, attempts, type(exc).__name__, message)
+        return retry
+
+    def _note_success(self, url: str) -> None:
+        with self._failure_lock:
+            self._attempts.pop(url, None)
+            self.failures.pop(url, None)
+
+    def _driver_recycle_reason(self, driver: webdriver.Chrome | None) -> str | None:
+        driver = driver or self.driver
+        if driver is None:
             return None
+        pages = self._driver_pages.get(id(driver), 0)
+        if self.config.recycle_after_pages and pages >= self.config.recycle_after_pages:
+            return f"recycle after {pages} pages"
+        rss = self._driver_rss.get(id(driver), 0)
+        if self.config.recycle_rss_mb and rss >= self.config.recycle_rss_mb * 1024 * 1024:
+            return f"recycle at {rss / 1024 / 1024:.0f} MiB RSS"
+        return None
 
-        result: list[str] = []
-        current_heading: str | None = None
-        seen_keys: set[str] = set()
-
-        for value in cleaned_values:
-            if self._is_generic_sale_heading(value):
-                continue
-            if "http" in value.lower():
-                continue
-            if self._is_sale_stage_heading(value) and not self._has_date_or_time(value):
-                current_heading = value.rstrip(":")
-                continue
-            if self._has_date_or_time(value):
-                entry = value
-                if current_heading:
-                    entry = f"{current_heading} {value}"
-                    current_heading = None
-                entry_key = self._sale_entry_key(entry)
-                if entry_key in seen_keys:
+    def _recycle_driver(self, driver: webdriver.Chrome | None) -> webdriver.Chrome | None:
+        reason = self._driver_recycle_reason(driver)
+        return self._replace_driver(driver, reason) if reason else driver
+
+    def _replace_driver(self, driver: webdriver.Chrome | None, reason: str) -> webdriver.Chrome | None:
+        from selenium.common.exceptions import WebDriverException
+
+        target = driver or self.driver
+        if target is None:
+            return driver
+        with self.metrics.stage("driver_replace", reason=reason):
+            try:
+                target.quit()
+            except (WebDriverException, OSError) as exc:
+                self.logger.debug("Ignoring error while quitting Chrome: %s", exc)
+            self._driver_pages.pop(id(target), None)
+            self._driver_rss.pop(id(target), None)
+            replacement = self._build_driver()
+            with self._driver_lock:
+                if target is self.driver:
+                    self.driver = replacement
+                self.pool_drivers = [replacement if pooled is target else pooled for pooled in self.pool_drivers]
+        self.logger.warning("Replaced Chrome session (%s)", reason)
+        return replacement if driver is not None else None
+
+    def _extract_browser_payload(self, url: str, driver: webdriver.Chrome) -> dict[str, Any]:
+        with self.metrics.stage("extract", url):
+            payload = driver.execute_script(PAYLOAD_SCRIPT)
+        self._driver_pages[id(driver)] = self._driver_pages.get(id(driver), 0) + 1
+        self._record_page_weight(url, driver)
+        return payload
+
+    def _driver_pid(self, driver: webdriver.Chrome) -> int | None:
+        process = getattr(getattr(driver, "service", None), "process", None)
+        return getattr(process, "pid", None)
+
+    def _iter_tab_payloads(
+        self,
+        driver: webdriver.Chrome,
+        pending: queue.Queue[str],
+        total: int,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+
+        handles = self._ensure_tabs(driver, self.config.tabs)
+        loads: dict[str, PageLoadState] = {}
+        while True:
+            recycle_reason = self._driver_recycle_reason(driver)
+            current: PageLoadState | None = None
+            try:
+                for handle in handles:
+                    if recycle_reason or handle in loads:
+                        continue
+                    ticket = self.throttle.try_acquire()
+                    if ticket is None:
+                        break
+                    try:
+                        url = pending.get_nowait()
+                    except queue.Empty:
+                        self.throttle.cancel(ticket)
+                        break
+                    if not self._retry_due(url):
+                        pending.put(url)
+                        self.throttle.cancel(ticket)
+                        break
+                    ticket.url = url
+                    self._log_progress(url, total)
+                    current = loads[handle] = PageLoadState(url=url, ticket=ticket)
+                    driver.switch_to.window(handle)
+                    with self.metrics.stage("navigate", url):
+                        driver.execute_script(TAB_NAVIGATION_SCRIPT, url)
+                current = None
+
+                if not loads:
+                    if recycle_reason:
+                        driver = self._replace_driver(driver, recycle_reason)
+                        handles = self._ensure_tabs(driver, self.config.tabs)
+                        continue
+                    if pending.empty():
+                        return
+                    time.sleep(self.config.readiness_poll_seconds)
                     continue
-                seen_keys.add(entry_key)
-                result.append(entry)
-                continue
 
-        return " / ".join(self._dedupe(result)) if result else None
-
-    def _trim_price_noise(self, text: str) -> str:
-        cleaned = self._clean_text(text)
-        for keyword in (
-            "以上票價需",
-            "系統服務費",
-            "服務費另計",
-            "system fee",
-            "福利抽獎券",
-            "關於福利抽選",
-            "購票請洽",
-            "更多資訊",
-            "主辦單位",
-            "演出長度",
-            "拓元註冊",
-            "每個帳號",
-            "工作人員",
-            "依現場",
-        ):
-            if keyword in cleaned:
-                cleaned = cleaned.split(keyword, 1)[0]
-        return cleaned.strip(" /")
-
-    def _looks_like_price_line(self, text: str) -> bool:
-        compact = self._compact(text).lower()
-        bare_tokens = [match.group(1) for match in BARE_PRICE_RE.finditer(text)]
-        if any(keyword in compact for keyword in ("服務費", "加購資格", "福利抽獎券")) and not self._looks_like_price_context(text):
-            return False
-        if any(marker in text for marker in ("➡", "→")) or "入場順" in text:
-            return False
-        if any(keyword in compact for keyword in PRICE_NOISE_KEYWORDS):
-            return False
-        if "http" in compact:
-            return False
-        if self._has_date_or_time(text) and not self._looks_like_price_context(text) and not re.search(r"(?:NT\$|\$|\d+\s*元)", text):
-            return False
-        explicit_price = bool(PRICE_RE.search(text))
-        if not explicit_price and not self._has_date_or_time(text):
-            explicit_price = bool(bare_tokens) and (
-                self._looks_like_price_context(text)
-                or any("," in token for token in bare_tokens)
-                or (len(bare_tokens) >= 2 and any(marker in text for marker in ("/", "／")))
-            )
-        if explicit_price:
-            return True
-        return self._looks_like_price_context(text) and len(self._strip_bullet_prefix(text)) <= 20
-
-    def _extract_price_tokens(self, text: str, allow_bare: bool) -> list[str]:
-        tokens = [match.group(0) for match in PRICE_RE.finditer(text)]
-        if tokens:
-            return tokens
-        if not allow_bare:
-            return []
-        return [match.group(1) for match in BARE_PRICE_RE.finditer(text)]
-
-    def _normalize_price(self, raw_price: str) -> str:
-        digits = re.search(r"\d[\d,]*", raw_price)
-        if not digits:
-            return self._clean_text(raw_price)
-        value = int(digits.group(0).replace(",", ""))
-        return f"NT${value:,}"
-
-    def _price_amount(self, price: str) -> int | None:
-        digits = re.search(r"\d[\d,]*", price)
-        if not digits:
-            return None
-        return int(digits.group(0).replace(",", ""))
-
-    def _cleanup_ticket_type(self, text: str) -> str | None:
-        cleaned = self._clean_text(text)
-        cleaned = re.sub(
-            r"^(?:活動票價|演出票價|票\s*價|price|ticket\s*price)\s*:\s*",
-            "",
-            cleaned,
-            flags=re.IGNORECASE,
+                for handle, state in list(loads.items()):
+                    current = state
+                    driver.switch_to.window(handle)
+                    try:
+                        ready = self._advance_page_load(state, driver.execute_script(DETAIL_READINESS_SCRIPT) or {})
+                    except TimeoutException as exc:
+                        del loads[handle]
+                        self.throttle.release(state.ticket, "timeout")
+                        self._requeue_or_fail(state.url, exc, pending)
+                        continue
+                    if not ready:
+                        continue
+                    self.readiness_waits[state.url] = self._finish_page_load(state)
+                    payload = self._extract_browser_payload(state.url, driver)
+                    del loads[handle]
+                    if looks_blocked(payload):
+                        self.throttle.release(state.ticket, "blocked")
+                        exc = PageBlockedError(f"Blocked page for {state.url} (title {payload.get('pageTitle')!r})")
+                        self._requeue_or_fail(state.url, exc, pending)
+                        continue
+                    self.throttle.release(state.ticket, "ok")
+                    self._note_success(state.url)
+                    yield state.url, payload
+                current = None
+            except WebDriverException as exc:
+                for state in loads.values():
+                    if state is current:
+                        self.throttle.release(state.ticket, self.throttle.classify(exc))
+                        self._requeue_or_fail(state.url, exc, pending)
+                    else:
+                        self.throttle.cancel(state.ticket)
+                        pending.put(state.url)
+                loads.clear()
+                if self._session_lost(exc):
+                    driver = self._replace_driver(driver, f"{type(exc).__name__} while loading tabs")
+                handles = self._ensure_tabs(driver, self.config.tabs)
+                continue
+            time.sleep(self.config.readiness_poll_seconds)
+
+    def _requeue_or_fail(self, url: str, exc: BaseException, pending: queue.Queue[str]) -> None:
+        if not self._note_failure(url, exc):
+            return
+        with self._failure_lock:
+            backoff = self.config.retry_backoff_seconds * 2 ** (self._attempts.get(url, 1) - 1)
+            self._retry_at[url] = time.monotonic() + backoff
+        pending.put(url)
+
+    def _retry_due(self, url: str) -> bool:
+        with self._failure_lock:
+            if self._retry_at.get(url, 0.0) > time.monotonic():
+                return False
+            self._retry_at.pop(url, None)
+        return True
+
+    def _record_page_weight(self, url: str, driver: webdriver.Chrome) -> None:
+        weight = driver.execute_script(PAGE_WEIGHT_SCRIPT) or {}
+        self.page_weights[url] = {key: int(weight.get(key) or 0) for key in ("transferBytes", "decodedBytes", "requests")}
+        rss = process_tree_rss(self._driver_pid(driver))
+        if rss is not None:
+            self._driver_rss[id(driver)] = rss
+        self.metrics.record_page(url, self.page_weights[url]["transferBytes"], rss)
+        self.logger.info(
+            "Page weight %s: %s bytes transferred over %s requests",
+            url,
+            self.page_weights[url]["transferBytes"],
+            self.page_weights[url]["requests"],
         )
-        cleaned = re.sub(r"^[#＃❋✦▪️■□◆•*➽➤►▶◎◉・]+", "", cleaned)
-        cleaned = re.sub(r"\bNT\.?\$?\s*$", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"^VIP套票\s*:\s*VIP$", "VIP", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"^(?:VIP套票\s*)?(?:VIP\s*Package|VIP套票)\s*:\s*(VVIP|VIP)$", r"\1", cleaned, flags=re.IGNORECASE)
-        cleaned = cleaned.replace("身障者席", "身障席")
-        cleaned = re.sub(r"^[\[\(（【]+|[\]\)）】]+$", "", cleaned)
-        cleaned = re.sub(r"\s+", " ", cleaned)
-        cleaned = cleaned.strip(" :/;-")
-        if not cleaned:
-            return None
-        return cleaned
 
-    def _looks_like_ticket_type(self, text: str) -> bool:
-        candidate = self._cleanup_ticket_type(text)
-        if not candidate:
-            return False
-        if len(candidate) > 40:
-            return False
-        lowered = candidate.lower()
-        if lowered in {"票價", "price", "ticket price"}:
-            return False
-        if any(marker in candidate for marker in ("市", "縣", "路", "街", "大道", "巷", "弄", "號")):
-            return False
-        if any(noise in lowered for noise in ("售票", "活動", "演出", "主辦", "購票", "服務費", "時間", "地點")):
-            return False
-        keywords = (
-            "vip",
-            "vvip",
-            "package",
-            "cat",
-            "ga",
-            "pass",
-            "席",
-            "區",
-            "票",
-            "站",
-            "座",
-            "身障",
-            "輪椅",
-            "wheelchair",
+    def _write_output(
+        self,
+        records: list[dict[str, Any]],
+        failures: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        return write_output(
+            self.config.output_path,
+            records,
+            failures,
+            sqlite_path=self.config.sqlite_path,
+            metrics=self.metrics,
+            logger=self.logger,
+            shard=self._shard_metadata(),
+            changes_path=self.config.changes_path,
         )
-        if any(keyword in lowered for keyword in keywords):
-            return True
-        if re.fullmatch(r"[A-Z0-9][A-Z0-9 .&+-]{0,20}", candidate, flags=re.IGNORECASE):
-            return True
-        if re.fullmatch(r"\dF(?:站區|座位|座席|區)?", candidate, flags=re.IGNORECASE):
-            return True
-        return False
-
-    def _parse_ticket_segment(self, segment: str, allow_bare: bool) -> tuple[str | None, str] | None:
-        cleaned = self._trim_price_noise(segment)
-        if not cleaned:
-            return None
-
-        tokens = self._extract_price_tokens(cleaned, allow_bare=allow_bare)
-        if not tokens:
-            return None
 
-        first_token = tokens[0]
-        match = re.search(re.escape(first_token), cleaned)
-        if not match:
+    def _shard_metadata(self) -> dict[str, Any] | None:
+        if self.config.shard_count <= 1:
             return None
+        return shard_metadata(self.config.shard_index, self.config.shard_count, self.listing_links)
 
-        ticket_type: str | None = None
-        before = self._cleanup_ticket_type(cleaned[: match.start()])
-        after = self._cleanup_ticket_type(cleaned[match.end() :])
-
-        if before and self._looks_like_ticket_type(before):
-            ticket_type = before
-        elif after:
-            trailing = re.split(r"[，。,/]", after, maxsplit=1)[0]
-            trailing = self._cleanup_ticket_type(trailing)
-            if trailing and self._looks_like_ticket_type(trailing):
-                ticket_type = trailing
-
-        return ticket_type, self._normalize_price(first_token)
-
-    def _split_price_segments(self, text: str) -> list[str]:
-        cleaned = self._trim_price_noise(text)
-        if not cleaned:
-            return []
-
-        parts: list[str] = []
-        current: list[str] = []
-        depth = 0
-        for char in cleaned:
-            if char in "（(":
-                depth += 1
-            elif char in "）)":
-                depth = max(0, depth - 1)
-
-            if depth == 0 and char in "/／、；;｜|":
-                segment = self._clean_text("".join(current))
-                if segment:
-                    parts.append(segment)
-                current = []
-                continue
+    def _log_progress(self, url: str, total: int) -> None:
+        self.logger.info("Scraping %s/%s %s", next(self._progress), total, url)
 
-            current.append(char)
+    def _iter_worker_payloads(
+        self,
+        driver: webdriver.Chrome | None,
+        pending: queue.Queue[str],
+        total: int,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        if driver is not None and self.config.tabs > 1:
+            yield from self._iter_tab_payloads(driver, pending, total)
+            return
+        while True:
+            try:
+                url = pending.get_nowait()
+            except queue.Empty:
+                return
+            self._log_progress(url, total)
+            payload, driver = self._fetch_with_retries(url, driver)
+            if payload is not None:
+                yield url, payload
+            driver = self._recycle_driver(driver)
+
+    def _iter_payloads(self, links: list[str]) -> Iterator[tuple[str, dict[str, Any]]]:
+        self._progress = itertools.count(1)
+        pending: queue.Queue[str] = queue.Queue()
+        for url in links:
+            pending.put(url)
+
+        workers = max(1, min(self.config.workers, len(links)))
+        if self.config.fetcher == "http":
+            drivers: list[webdriver.Chrome | None] = [None] * workers
+        elif workers > 1 or self.config.tabs > 1:
+            drivers = [*self._ensure_driver_pool(workers)]
+        else:
+            drivers = [None]
+
+        if len(drivers) == 1:
+            yield from self._iter_worker_payloads(drivers[0], pending, len(links))
+            return
+
+        self.logger.info(
+            "Fetching detail pages with %s %s workers x %s tabs",
+            workers,
+            self.config.fetcher,
+            self.config.tabs if self.config.fetcher == "selenium" else 1,
+        )
+        results: queue.Queue[tuple[str, dict[str, Any]] | BaseException | None] = queue.Queue()
 
-        tail = self._clean_text("".join(current))
-        if tail:
-            parts.append(tail)
-        return parts or [cleaned]
+        def work(driver: webdriver.Chrome | None) -> None:
+            try:
+                for item in self._iter_worker_payloads(driver, pending, len(links)):
+                    results.put(item)
+            except BaseException as exc:
+                results.put(exc)
+            finally:
+                results.put(None)
 
-    def _extract_ticket_data(self, sections: dict[str, list[str]], intro_lines: list[str]) -> tuple[str | None, str | None]:
-        price_lines: list[str] = []
-        for line in sections["price"]:
-            cleaned = self._trim_price_noise(line)
-            if cleaned:
-                price_lines.append(cleaned)
+        threads = [threading.Thread(target=work, args=(driver,), daemon=True) for driver in drivers]
+        for thread in threads:
+            thread.start()
 
-        for line in intro_lines:
-            if not self._looks_like_price_line(line):
-                continue
-            cleaned = self._trim_price_noise(line)
-            if cleaned:
-                price_lines.append(cleaned)
-
-        price_lines = self._dedupe(price_lines)
-        if not price_lines:
-            return None, None
-
-        typed_entries: list[tuple[str, str]] = []
-        raw_prices: list[str] = []
-
-        for line in price_lines:
-            bare_tokens = [match.group(1) for match in BARE_PRICE_RE.finditer(line)]
-            allow_bare = bool(
-                re.search(r"(?:NT\$|\$|\d+\s*元)", line)
-                or self._looks_like_price_context(line)
-                or any("," in token for token in bare_tokens)
-                or (len(bare_tokens) >= 2 and any(marker in line for marker in ("/", "／")))
+        try:
+            finished = 0
+            while finished < len(threads):
+                item = results.get()
+                if item is None:
+                    finished += 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+        finally:
+            while not pending.empty():
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+            for thread in threads:
+                thread.join()
+
+    def _iter_records(
+        self,
+        payloads: Iterable[tuple[str, dict[str, Any]]],
+    ) -> Iterator[tuple[str, dict[str, Any], dict[str, Any]]]:
+        if self.config.parse_workers <= 1:
+            for url, payload in payloads:
+                with self.metrics.stage("parse", url):
+                    record = self._build_event_record(url, payload)
+                yield url, payload, record
+            return
+
+        with build_parse_executor(self.config.parse_workers) as executor:
+            in_flight: dict[Future[tuple[dict[str, Any], float]], tuple[str, dict[str, Any]]] = {}
+            max_in_flight = self.config.parse_workers * 4
+            for url, payload in payloads:
+                in_flight[executor.submit(parse_payload_timed, url, payload)] = (url, payload)
+                timeout = 0 if len(in_flight) < max_in_flight else None
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield self._collect_parsed(*in_flight.pop(future), future)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield self._collect_parsed(*in_flight.pop(future), future)
+
+    def _collect_parsed(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        future: Future[tuple[dict[str, Any], float]],
+    ) -> tuple[str, dict[str, Any], dict[str, Any]]:
+        record, seconds = future.result()
+        self.metrics.observe("parse", seconds, url)
+        return url, payload, record
+
+    def _log_readiness_summary(self, links: list[str]) -> None:
+        waits = [self.readiness_waits[url] for url in links if url in self.readiness_waits]
+        if waits:
+            self.logger.info(
+                "Readiness wait avg %.2fs / max %.2fs over %s pages (upper bound %.2fs after load)",
+                sum(waits) / len(waits),
+                max(waits),
+                len(waits),
+                self.config.settle_seconds,
             )
-            parts = self._split_price_segments(line)
-            if not parts:
-                parts = [line]
-
-            for part in parts:
-                parsed = self._parse_ticket_segment(part, allow_bare=allow_bare)
-                if not parsed:
-                    for raw_price in self._extract_price_tokens(part, allow_bare=allow_bare):
-                        raw_prices.append(self._normalize_price(raw_price))
-                    continue
-
-                ticket_type, price = parsed
-                raw_prices.append(price)
-                if ticket_type:
-                    typed_entries.append((ticket_type, price))
-
-        raw_prices = self._dedupe(raw_prices)
-        unique_typed_entries = list(dict.fromkeys(typed_entries))
-        ticket_types = self._dedupe([ticket_type for ticket_type, _ in unique_typed_entries])
 
-        price_amounts = [amount for amount in (self._price_amount(price) for price in raw_prices) if amount is not None]
-        if price_amounts and max(price_amounts) >= 1000:
-            raw_prices = [price for price in raw_prices if (self._price_amount(price) or 0) >= 300]
-            unique_typed_entries = [
-                entry for entry in unique_typed_entries if (self._price_amount(entry[1]) or 0) >= 300
-            ]
-            ticket_types = self._dedupe([ticket_type for ticket_type, _ in unique_typed_entries])
-
-        if unique_typed_entries:
-            typed_price_set = {price for _, price in unique_typed_entries}
-            if raw_prices and len(unique_typed_entries) == len(raw_prices) and len(typed_price_set) == len(raw_prices):
-                raw_price_order = {price: index for index, price in enumerate(raw_prices)}
-                ordered_entries = sorted(
-                    enumerate(unique_typed_entries),
-                    key=lambda item: (raw_price_order.get(item[1][1], len(raw_prices)), item[0]),
-                )
-                typed_entries_in_order = [entry for _, entry in ordered_entries]
-                return (
-                    " / ".join(price for _, price in typed_entries_in_order),
-                    " / ".join(self._dedupe([ticket_type for ticket_type, _ in typed_entries_in_order])),
-                )
+        weights = [self.page_weights[url]["transferBytes"] for url in links if url in self.page_weights]
+        if weights:
+            self.logger.info(
+                "Page weight avg %.0f bytes / total %s bytes over %s pages (resource blocking %s)",
+                sum(weights) / len(weights),
+                sum(weights),
+                len(weights),
+                "on" if self.config.block_resources else "off",
+            )
 
-        if raw_prices:
-            partial_types = " / ".join(ticket_types) if ticket_types else None
-            return " / ".join(raw_prices), partial_types
+    def _log_metrics_summary(self) -> None:
+        summary = self.metrics.close()
+        for stage, stats in summary["stages"].items():
+            self.logger.info(
+                "Stage %s: %s samples, p50 %.3fs, p95 %.3fs, max %.3fs, total %.2fs",
+                stage,
+                stats["count"],
+                stats["p50_seconds"],
+                stats["p95_seconds"],
+                stats["max_seconds"],
+                stats["total_seconds"],
+            )
+        if summary["chrome_rss_bytes_max"]:
+            self.logger.info("Peak Chrome RSS %.1f MiB", summary["chrome_rss_bytes_max"] / 1024 / 1024)
+        throttle = summary["throttle"]
+        if throttle:
+            self.logger.info(
+                "Throttle: concurrency %s/%s, %s ok, %s slow, %s timeouts, %s blocked, %s errors, waited %.1fs",
+                throttle["concurrency_limit"],
+                throttle["concurrency_max"],
+                throttle["ok_total"],
+                throttle["slow_total"],
+                throttle["timeout_total"],
+                throttle["blocked_total"],
+                throttle["error_total"],
+                throttle["wait_seconds_total"],
+            )
 
-        return None, None
+    def _state_path(self) -> Path:
+        if self.config.state_path:
+            return self.config.state_path
+        output_path = self.config.output_path
+        return output_path.with_name(f"{output_path.stem}.state.json")
 
-    def _looks_like_address(self, text: str) -> bool:
-        if self._looks_like_ticket_type(text):
-            return False
-        return bool(ADDRESS_RE.search(text))
+    def _load_incremental_baseline(self) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        output_path = self.config.output_path
+        try:
+            previous = json.loads(output_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}, {}
+        except (OSError, ValueError) as exc:
+            self.logger.warning("Ignoring unreadable previous output %s (%s)", output_path, exc)
+            return {}, {}
+
+        records = {
+            record["event_link"]: record
+            for record in previous.get("events", [])
+            if isinstance(record, dict) and record.get("event_link")
+        }
 
-    def _is_reasonable_address_candidate(self, text: str) -> bool:
-        cleaned = self._clean_text(text)
-        if not cleaned or len(cleaned) > 40 or "。" in cleaned or "http" in cleaned.lower():
-            return False
-        if any(
-            keyword in cleaned
-            for keyword in ("排隊", "進場", "限購", "帳號", "工作人員", "註冊", "開賣", "售票", "序號", "抽選")
-        ):
-            return False
-        return self._looks_like_address(cleaned)
+        state: dict[str, dict[str, Any]] = {}
+        state_path = self._state_path()
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8")).get("links", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as exc:
+            self.logger.warning("Ignoring unreadable state file %s (%s)", state_path, exc)
 
-    def _looks_like_venue(self, text: str) -> bool:
-        lowered = text.lower()
-        return any(keyword in lowered for keyword in VENUE_KEYWORDS)
+        try:
+            scrape_time = time.mktime(time.strptime(previous.get("scrape_time", ""), "%Y-%m-%d %H:%M:%S"))
+        except ValueError:
+            scrape_time = None
+        for url in records:
+            entry = state.setdefault(url, {})
+            if entry.get("fetched_at") is None and scrape_time is not None:
+                entry["fetched_at"] = scrape_time
 
-    def _pick_best_venue(self, candidates: list[str]) -> str | None:
-        cleaned_candidates = self._dedupe(
-            [candidate for candidate in candidates if candidate and "http" not in candidate.lower()]
-        )
-        if not cleaned_candidates:
-            return None
-        ordered = sorted(
-            cleaned_candidates,
-            key=lambda value: (
-                0 if self._looks_like_venue(value) else 1,
-                0 if re.search(r"[\u4e00-\u9fff]", value) else 1,
-                len(value),
-            ),
-        )
-        return ordered[0]
+        return records, state
 
-    def _pick_best_address(self, candidates: list[str]) -> str | None:
-        cleaned_candidates = self._dedupe(
-            [candidate for candidate in candidates if candidate and "http" not in candidate.lower()]
+    def _plan_incremental_fetch(
+        self,
+        links: list[str],
+        previous_records: dict[str, dict[str, Any]],
+        state: dict[str, dict[str, Any]],
+    ) -> list[str]:
+        now = time.time()
+        ttl_seconds = self.config.refresh_ttl_hours * 3600
+        pending: list[str] = []
+        changed = 0
+        for url in links:
+            fetched_at = state.get(url, {}).get("fetched_at")
+            if url not in previous_records or fetched_at is None or now - fetched_at >= ttl_seconds:
+                pending.append(url)
+            elif self._listing_card_changed(url, state):
+                pending.append(url)
+                changed += 1
+        self.logger.info(
+            "Incremental plan: %s of %s links to fetch (%s listing cards changed, %s unchanged and fresh)",
+            len(pending),
+            len(links),
+            changed,
+            len(links) - len(pending),
         )
-        if not cleaned_candidates:
-            return None
-        ordered = sorted(cleaned_candidates, key=lambda value: (0 if self._looks_like_address(value) else 1, len(value)))
-        return ordered[0]
+        return pending
+
+    def _listing_card_changed(self, url: str, state: dict[str, dict[str, Any]]) -> bool:
+        fingerprint = self.listing_fingerprints.get(url)
+        stored = state.get(url, {}).get("fingerprint")
+        return bool(fingerprint and stored and fingerprint != stored)
+
+    def _remember_fingerprint(self, url: str, state: dict[str, dict[str, Any]], fetched: bool) -> None:
+        fingerprint = self.listing_fingerprints.get(url)
+        if not fingerprint:
+            return
+        entry = state.setdefault(url, {})
+        if fetched or not entry.get("fingerprint"):
+            entry["fingerprint"] = fingerprint
+
+    def _write_state(self, state: dict[str, dict[str, Any]]) -> None:
+        atomic_write_text(self._state_path(), json.dumps({"links": state}, ensure_ascii=False, indent=2))
+
+    def _checkpoint_path(self) -> Path:
+        if self.config.checkpoint_path:
+            return self.config.checkpoint_path
+        output_path = self.config.output_path
+        return output_path.with_name(f"{output_path.stem}.checkpoint.jsonl")
 
-    def _extract_location(self, sections: dict[str, list[str]], intro_lines: list[str]) -> tuple[str | None, str | None]:
-        venue_candidates: list[str] = []
-        address_candidates: list[str] = []
-
-        for raw_line in sections["location"]:
-            line = self._clean_location_candidate(raw_line)
-            if not line:
-                continue
-
-            bracket_match = re.match(r"(.+?)\s*[(（]([^()（）]+)[)）]$", line)
-            if bracket_match:
-                outer = self._clean_text(bracket_match.group(1))
-                inner = self._clean_text(bracket_match.group(2))
-                if self._looks_like_address(inner):
-                    venue_candidates.append(outer)
-                    address_candidates.append(inner)
-                    continue
-                venue_candidates.append(line)
-                continue
-
-            if self._is_reasonable_address_candidate(line) and not self._looks_like_venue(line):
-                address_candidates.append(line)
-                continue
+    def scrape_all_events(self, limit: int | None = None) -> dict[str, Any]:
+        if limit is not None:
+            self.config.limit = limit
 
-            venue_candidates.append(line)
-
-        if not address_candidates:
-            for line in intro_lines:
-                cleaned_line = self._clean_location_candidate(line)
-                if (
-                    self._is_reasonable_address_candidate(cleaned_line)
-                    and not self._has_date_or_time(cleaned_line)
-                    and not self._looks_like_price_line(cleaned_line)
-                ):
-                    address_candidates.append(cleaned_line)
-
-        venue_name = self._pick_best_venue(venue_candidates)
-        address = self._pick_best_address(address_candidates)
-
-        if venue_name and address and self._compact(venue_name).lower() == self._compact(address).lower():
-            address = None
-        if address and self._looks_like_venue(address) and not self._looks_like_address(address):
-            address = None
-        if not venue_name and address:
-            return None, address
-        return venue_name, address
-
-    def _simplify_page_title(self, page_title: str) -> str | None:
-        title = self._clean_text(page_title)
-        title = re.sub(r"\s*\|\s*tixcraft.*$", "", title, flags=re.IGNORECASE)
-        title = re.sub(r"\s*@\s*.+$", "", title)
-        return self._normalize_value(title)
-
-    def _extract_event_name(self, payload: dict[str, Any]) -> str:
-        title = self._normalize_value(payload.get("title"))
-        if title:
-            return title
-
-        page_title = self._simplify_page_title(payload.get("pageTitle", ""))
-        if page_title:
-            return page_title
-
-        data_layer = payload.get("dataLayer") or {}
-        artist_name = self._normalize_value(data_layer.get("artistName"))
-        if artist_name:
-            return artist_name
-
-        return "Unknown Event"
-
-    def _guess_artist_from_title(self, event_name: str, category_values: set[str]) -> str | None:
-        working = self._strip_event_title_prefixes(event_name)
-        if not working:
-            return None
+        try:
+            links = self._load_listing_page()
+            previous_records: dict[str, dict[str, Any]] = {}
+            state: dict[str, dict[str, Any]] = {}
+            fetch_links = links
+            if self.config.incremental:
+                previous_records, state = self._load_incremental_baseline()
+                fetch_links = self._plan_incremental_fetch(links, previous_records, state)
+
+            positions = {url: position for position, url in enumerate(links)}
+            checkpoint_path = self._checkpoint_path()
+            resumed = load_checkpoint(checkpoint_path) if self.config.resume else {}
+            pending = [url for url in fetch_links if url not in resumed]
+            if resumed:
+                self.logger.info(
+                    "Resuming from %s: skipping %s checkpointed links",
+                    checkpoint_path,
+                    len(fetch_links) - len(pending),
+                )
 
-        if self._contains_generic_artist_keyword(working) or self._contains_generic_artist_title_keyword(working):
-            return None
-        if not self._contains_artist_event_keyword(working):
-            return None
+            run_id = self.metrics.run_id
+            fetched_links: set[str] = set()
+            writer = CheckpointWriter(checkpoint_path, self.config.checkpoint_fsync_every, resume=self.config.resume)
+            try:
+                for url, payload, record in self._iter_records(self._iter_payloads(pending)):
+                    if self.archive:
+                        self.archive.store(url, payload, run_id=run_id, position=positions[url])
+                    writer.write(url, record)
+                    fetched_links.add(url)
+            finally:
+                writer.close()
+            fetched = len(fetched_links)
+
+            self._log_readiness_summary(pending)
+
+            streamed = {url: entry for url, entry in load_checkpoint(checkpoint_path).items() if url in positions}
+            for url, entry in streamed.items():
+                state.setdefault(url, {})["fetched_at"] = entry["fetched_at"]
+            for url in links:
+                self._remember_fingerprint(url, state, fetched=url in streamed)
+            records = [
+                streamed[url]["record"] if url in streamed else previous_records[url]
+                for url in links
+                if url in streamed or url in previous_records
+            ]
+            failures = [self.failures[url] for url in links if url in self.failures and url not in streamed]
+            if self.archive:
+                self._archive_references(
+                    [url for url in links if url not in fetched_links and (url in streamed or url in previous_records)],
+                    positions,
+                    run_id,
+                )
+            summary = {
+                "fetched": fetched,
+                "resumed": len(streamed) - fetched,
+                "reused": len(records) - len(streamed),
+                "removed": len(set(previous_records) - set(links)),
+                "failed": len(failures),
+            }
+            if self.config.incremental:
+                self._write_state({url: state[url] for url in links if url in state})
+
+            result = self._write_output(records, failures)
+            checkpoint_path.unlink(missing_ok=True)
+            self.logger.info(
+                "Saved results to %s (fetched %s, resumed %s, reused %s, removed %s, failed %s)",
+                self.config.output_path,
+                summary["fetched"],
+                summary["resumed"],
+                summary["reused"],
+                summary["removed"],
+                summary["failed"],
+            )
+            return {**result, "summary": summary}
+        finally:
+            self.close()
+            self._log_metrics_summary()
+
+    def _archive_references(self, links: list[str], positions: dict[str, int], run_id: str) -> None:
+        if not links:
+            return
+        referenced = self.archive.reference([(url, positions[url]) for url in links], run_id=run_id)
+        if referenced < len(links):
+            self.logger.warning(
+                "%s reused links have no archived payload; replaying run %s will omit them",
+                len(links) - referenced,
+                run_id,
+            )
 
-        candidate: str | None = None
-        match = re.search(
-            r"(年度專場|專場|专场|演唱會|演唱会|巡迴|巡回|見面會|见面会|音樂會|音乐会|FANCON|FAN MEETING|WORLD TOUR|ASIA TOUR|TOUR|CONCERT|LIVE|SHOWCASE|ENCORE)",
-            working,
-            flags=re.IGNORECASE,
+    def _flush_schedule(
+        self,
+        links: list[str],
+        records: dict[str, dict[str, Any]],
+        state: dict[str, dict[str, Any]],
+    ) -> None:
+        self._write_output(
+            [records[url] for url in links if url in records],
+            [self.failures[url] for url in links if url in self.failures],
         )
-        if match:
-            candidate = self._clean_artist_candidate(working[: match.start()])
-
-        if not candidate and ("：" in working or ":" in working):
-            separator = "：" if "：" in working else ":"
-            candidate = self._clean_artist_candidate(working.split(separator, 1)[0])
-
-        if not candidate and re.search(r"\b20\d{2}\b", working):
-            candidate = self._clean_artist_candidate(re.split(r"\b20\d{2}\b", working, maxsplit=1)[0])
-
-        if self._looks_like_valid_artist_candidate(candidate, event_name, category_values, require_title_support=True):
-            return candidate
-        return None
-
-    def _extract_artist_name(self, payload: dict[str, Any], event_name: str, intro_lines: list[str]) -> str | None:
-        data_layer = payload.get("dataLayer") or {}
-        artist_name = self._normalize_value(data_layer.get("artistName"))
-        artist_name_en = self._normalize_value(data_layer.get("artistNameEn"))
-        child_category = self._normalize_value(data_layer.get("childCategoryName"))
-        child_category_en = self._normalize_value(data_layer.get("childCategoryNameEn"))
-        parent_category = self._normalize_value(data_layer.get("parentCategoryName"))
-        parent_category_en = self._normalize_value(data_layer.get("parentCategoryNameEn"))
-
-        if self._is_sports_category(child_category, child_category_en, parent_category, parent_category_en):
-            return None
-
-        category_values = {
-            value.lower()
-            for value in (child_category, child_category_en, parent_category, parent_category_en)
-            if value
-        }
-
-        explicit_artist = self._extract_explicit_artist_name(intro_lines, event_name, category_values)
-        if explicit_artist:
-            return explicit_artist
-
-        for candidate in (artist_name, artist_name_en):
-            if self._looks_like_valid_artist_candidate(candidate, event_name, category_values, require_title_support=True):
-                return self._clean_artist_candidate(candidate)
-
-        return self._guess_artist_from_title(event_name, category_values)
+        self._write_state({url: state[url] for url in links if url in state})
+        self.metrics.write_prometheus()
+
+    def run_schedule(self, scheduler: RescrapeScheduler, max_fetches: int | None = None) -> dict[str, Any]:
+        records, state = self._load_incremental_baseline()
+        links = list(records)
+        run_id = self.metrics.run_id
+        if self.archive:
+            self._archive_references(links, {url: position for position, url in enumerate(links)}, run_id)
+        fetched = failed = 0
+        dirty = False
+        self.request_budget = scheduler
+        try:
+            while max_fetches is None or fetched + failed < max_fetches:
+                now = time.time()
+                budget_wait = scheduler.budget_wait(now)
+                if budget_wait <= 0 and scheduler.listing_is_due(now):
+                    try:
+                        links = self._load_listing_page()
+                    except self.retryable_errors as exc:
+                        if self._session_lost(exc):
+                            self._replace_driver(None, f"{type(exc).__name__} on listing refresh")
+                        retry_at = scheduler.listing_failed(time.time())
+                        self.logger.warning(
+                            "Scheduled listing refresh failed (%s: %s); retrying in %.0fs",
+                            type(exc).__name__,
+                            exc,
+                            retry_at - time.time(),
+                        )
+                        continue
+                    now = time.time()
+                    added = scheduler.sync_links(links, records, state, now)
+                    changed = [url for url in links if url not in added and self._listing_card_changed(url, state)]
+                    for url in changed:
+                        scheduler.plan(url, None, None, now)
+                    for url in links:
+                        self._remember_fingerprint(url, state, fetched=False)
+                    self.logger.info(
+                        "Listing refreshed: %s links, %s newly scheduled, %s changed cards re-queued",
+                        len(links),
+                        len(added),
+                        len(changed),
+                    )
+                    scheduler.listing_fetched(time.time())
+                    continue
 
-    def _build_event_record(self, url: str, payload: dict[str, Any]) -> dict[str, Any]:
-        intro_lines = self._split_intro_lines(payload.get("intro", ""))
-        sections = self._extract_sections(intro_lines)
+                url = scheduler.pop_due(now) if budget_wait <= 0 else None
+                if url is None:
+                    if dirty:
+                        self._flush_schedule(links, records, state)
+                        dirty = False
+                    next_due = scheduler.next_due_at()
+                    wake_at = min(scheduler.listing_due, next_due if next_due is not None else scheduler.listing_due)
+                    time.sleep(max(budget_wait, wake_at - now, self.config.readiness_poll_seconds))
+                    continue
 
-        event_name = self._extract_event_name(payload)
-        ticket_price, ticket_types = self._extract_ticket_data(sections, intro_lines)
-        event_time = self._format_event_time(sections["event_time"])
-        sale_time = self._format_sale_time(sections["sale_time"])
-        venue_name, address = self._extract_location(sections, intro_lines)
-        artist_name = self._extract_artist_name(payload, event_name, intro_lines)
+                payload, _ = self._fetch_with_retries(url)
+                self._recycle_driver(None)
+                if payload is None:
+                    failed += 1
+                    dirty = True
+                    scheduler.defer(url, time.time())
+                    continue
 
-        record: dict[str, Any] = {
-            "event_name": event_name,
-            "event_link": url,
-        }
+                with self.metrics.stage("parse", url):
+                    record = self._build_event_record(url, payload)
+                if self.archive:
+                    position = links.index(url) if url in links else len(links)
+                    self.archive.store(url, payload, run_id=run_id, position=position)
+                fetched_at = time.time()
+                records[url] = record
+                state.setdefault(url, {})["fetched_at"] = fetched_at
+                self._remember_fingerprint(url, state, fetched=True)
+                fetched += 1
+                dirty = True
+                due = scheduler.plan(url, record, fetched_at, fetched_at)
+                self.logger.info(
+                    "Refreshed %s (next in %s, %s scheduled)",
+                    url,
+                    "never" if due is None else f"{due - fetched_at:.0f}s",
+                    len(scheduler),
+                )
 
-        optional_fields = {
-            "ticket_price": ticket_price,
-            "ticket_types": ticket_types,
-            "event_time": event_time,
-            "sale_time": sale_time,
-            "venue_name": venue_name,
-            "address": address,
-            "artist_name": artist_name,
-        }
-        for key, value in optional_fields.items():
-            normalized = self._normalize_value(value)
-            if normalized:
-                record[key] = normalized
-
-        return record
-
-    def _write_output(self, records: list[dict[str, Any]]) -> dict[str, Any]:
-        result = {
-            "scrape_time": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "total_events": len(records),
-            "fields": [
-                "event_name",
-                "ticket_price",
-                "ticket_types",
-                "event_time",
-                "sale_time",
-                "event_link",
-                "venue_name",
-                "address",
-                "artist_name",
-            ],
-            "events": records,
-        }
-        self.config.output_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
-        return result
+            if dirty:
+                self._flush_schedule(links, records, state)
+            return {"fetched": fetched, "failed": failed, "scheduled": len(scheduler)}
+        finally:
+            self.request_budget = None
+            self.close()
+            self._log_metrics_summary()
 
-    def scrape_all_events(self, limit: int | None = None) -> dict[str, Any]:
-        if limit is not None:
-            self.config.limit = limit
+    def enqueue_listing(self, jobs: WorkQueue) -> dict[str, int]:
+        try:
+            counts = jobs.enqueue(self._load_listing_page(), run_id=self.metrics.run_id)
+        finally:
+            self.close()
+        self.logger.info(
+            "Enqueued %s links into %s (%s new, %s removed)",
+            counts["enqueued"],
+            jobs.path,
+            counts["added"],
+            counts["removed"],
+        )
+        return counts
 
+    def run_worker(
+        self,
+        jobs: WorkQueue,
+        owner: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_jobs: int | None = None,
+    ) -> dict[str, Any]:
+        run_id = self.metrics.run_id
+        done = failed = lost = 0
         try:
-            links = self._load_listing_page()
-            records: list[dict[str, Any]] = []
+            while max_jobs is None or done + failed + lost < max_jobs:
+                job = jobs.claim(owner, lease_seconds)
+                if job is None:
+                    counts = jobs.counts()
+                    if not counts["pending"] and not counts["leased"]:
+                        break
+                    time.sleep(WORKER_IDLE_POLL_SECONDS)
+                    continue
+
+                url = job["event_link"]
+                self.logger.info("Worker %s claimed %s (attempt %s)", owner, url, job["attempt"])
+                payload, _ = self._fetch_with_retries(url)
+                self._recycle_driver(None)
+                if payload is None:
+                    jobs.fail(url, owner, self.failures[url])
+                    failed += 1
+                    continue
 
-            for index, url in enumerate(links, 1):
-                self.logger.info("Scraping %s/%s %s", index, len(links), url)
-                payload = self._fetch_payload(url)
-                records.append(self._build_event_record(url, payload))
+                with self.metrics.stage("parse", url):
+                    record = self._build_event_record(url, payload)
+                if self.archive:
+                    self.archive.store(url, payload, run_id=job["run_id"] or run_id, position=job["position"])
+                if jobs.complete(url, owner, record):
+                    done += 1
+                else:
+                    lost += 1
+                    self.logger.warning("Lease on %s expired and was taken over; dropping this result", url)
 
-            result = self._write_output(records)
-            self.logger.info("Saved results to %s", self.config.output_path)
-            return result
+            self.logger.info("Worker %s finished: %s done, %s failed, %s leases lost", owner, done, failed, lost)
+            return {"done": done, "failed": failed, "lost_leases": lost, "jobs": jobs.counts()}
         finally:
             self.close()
+            self._log_metrics_summary()
 
 
-def main(limit: int | None = None, output_path: str = "tixcraft_activities.json", headless: bool = True) -> dict[str, Any]:
+def listing_card_fingerprint(card: dict[str, str]) -> str | None:
+    text = " ".join((card.get("text") or "").split())
+    image = card.get("image") or ""
+    if not text and not image:
+        return None
+    return hashlib.sha1(f"{text}\n{image}".encode("utf-8")).hexdigest()[:16]
+
+
+def main(
+    limit: int | None = None,
+    output_path: str = "tixcraft_activities.json",
+    headless: bool = True,
+    workers: int = 1,
+    tabs: int = 1,
+    parse_workers: int = 1,
+    fetcher: str = "selenium",
+    archive_dir: str | None = None,
+    incremental: bool = False,
+    refresh_ttl_hours: float = 24.0,
+    state_path: str | None = None,
+    resume: bool = False,
+    checkpoint_path: str | None = None,
+    checkpoint_fsync_every: int = 10,
+    block_resources: bool = False,
+    allowed_url_patterns: list[str] | None = None,
+    chromedriver_path: str | None = None,
+    offline: bool = False,
+    metrics_path: str | None = None,
+    prometheus_path: str | None = None,
+    sqlite_path: str | None = None,
+    adaptive_concurrency: bool = False,
+    min_concurrency: int = 1,
+    max_requests_per_second: float = 0.0,
+    latency_target_seconds: float = DEFAULT_LATENCY_TARGET_SECONDS,
+    fetch_retries: int = 2,
+    retry_backoff_seconds: float = 2.0,
+    recycle_after_pages: int = 200,
+    recycle_rss_mb: float = 1536.0,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    changes_path: str | None = None,
+) -> dict[str, Any]:
     scraper = TixcraftPrecisionFieldScraper(
         ScraperConfig(
             output_path=Path(output_path),
             limit=limit,
             headless=headless,
+            workers=workers,
+            tabs=max(1, tabs),
+            parse_workers=resolve_parse_workers(parse_workers),
+            fetcher=fetcher,
+            archive_dir=Path(archive_dir) if archive_dir else None,
+            incremental=incremental,
+            refresh_ttl_hours=refresh_ttl_hours,
+            state_path=Path(state_path) if state_path else None,
+            resume=resume,
+            checkpoint_path=Path(checkpoint_path) if checkpoint_path else None,
+            checkpoint_fsync_every=checkpoint_fsync_every,
+            block_resources=block_resources,
+            allowed_url_patterns=(*DEFAULT_ALLOWED_URL_PATTERNS, *(allowed_url_patterns or ())),
+            chromedriver_path=Path(chromedriver_path) if chromedriver_path else None,
+            offline=offline,
+            metrics_path=Path(metrics_path) if metrics_path else None,
+            prometheus_path=Path(prometheus_path) if prometheus_path else None,
+            sqlite_path=Path(sqlite_path) if sqlite_path else None,
+            adaptive_concurrency=adaptive_concurrency,
+            min_concurrency=min_concurrency,
+            max_requests_per_second=max_requests_per_second,
+            latency_target_seconds=latency_target_seconds,
+            fetch_retries=fetch_retries,
+            retry_backoff_seconds=retry_backoff_seconds,
+            recycle_after_pages=recycle_after_pages,
+            recycle_rss_mb=recycle_rss_mb,
+            shard_index=shard_index,
+            shard_count=shard_count,
+            changes_path=Path(changes_path) if changes_path else None,
         )
     )
     return scraper.scrape_all_events(limit=limit)
 
 
+def schedule(
+    output_path: str = "tixcraft_activities.json",
+    headless: bool = True,
+    fetcher: str = "selenium",
+    archive_dir: str | None = None,
+    state_path: str | None = None,
+    block_resources: bool = False,
+    allowed_url_patterns: list[str] | None = None,
+    chromedriver_path: str | None = None,
+    offline: bool = False,
+    metrics_path: str | None = None,
+    prometheus_path: str | None = None,
+    sqlite_path: str | None = None,
+    limit: int | None = None,
+    requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR,
+    listing_interval_seconds: float = DEFAULT_LISTING_INTERVAL_SECONDS,
+    max_fetches: int | None = None,
+    max_requests_per_second: float = 0.0,
+    fetch_retries: int = 2,
+    retry_backoff_seconds: float = 2.0,
+    recycle_after_pages: int = 200,
+    recycle_rss_mb: float = 1536.0,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    changes_path: str | None = None,
+) -> dict[str, Any]:
+    scraper = TixcraftPrecisionFieldScraper(
+        ScraperConfig(
+            output_path=Path(output_path),
+            limit=limit,
+            headless=headless,
+            fetcher=fetcher,
+            archive_dir=Path(archive_dir) if archive_dir else None,
+            state_path=Path(state_path) if state_path else None,
+            block_resources=block_resources,
+            allowed_url_patterns=(*DEFAULT_ALLOWED_URL_PATTERNS, *(allowed_url_patterns or ())),
+            chromedriver_path=Path(chromedriver_path) if chromedriver_path else None,
+            offline=offline,
+            metrics_path=Path(metrics_path) if metrics_path else None,
+            prometheus_path=Path(prometheus_path) if prometheus_path else None,
+            sqlite_path=Path(sqlite_path) if sqlite_path else None,
+            max_requests_per_second=max_requests_per_second,
+            fetch_retries=fetch_retries,
+            retry_backoff_seconds=retry_backoff_seconds,
+            recycle_after_pages=recycle_after_pages,
+            recycle_rss_mb=recycle_rss_mb,
+            shard_index=shard_index,
+            shard_count=shard_count,
+            changes_path=Path(changes_path) if changes_path else None,
+        )
+    )
+    scheduler = RescrapeScheduler(requests_per_hour, listing_interval_seconds)
+    return scraper.run_schedule(scheduler, max_fetches=max_fetches)
+
+
+def enqueue(
+    queue_path: str,
+    headless: bool = True,
+    fetcher: str = "selenium",
+    block_resources: bool = False,
+    allowed_url_patterns: list[str] | None = None,
+    chromedriver_path: str | None = None,
+    offline: bool = False,
+    metrics_path: str | None = None,
+    prometheus_path: str | None = None,
+    limit: int | None = None,
+    shard_index: int = 0,
+    shard_count: int = 1,
+) -> dict[str, Any]:
+    scraper = TixcraftPrecisionFieldScraper(
+        ScraperConfig(
+            limit=limit,
+            headless=headless,
+            fetcher=fetcher,
+            block_resources=block_resources,
+            allowed_url_patterns=(*DEFAULT_ALLOWED_URL_PATTERNS, *(allowed_url_patterns or ())),
+            chromedriver_path=Path(chromedriver_path) if chromedriver_path else None,
+            offline=offline,
+            metrics_path=Path(metrics_path) if metrics_path else None,
+            prometheus_path=Path(prometheus_path) if prometheus_path else None,
+            shard_index=shard_index,
+            shard_count=shard_count,
+        )
+    )
+    jobs = WorkQueue(queue_path)
+    try:
+        return scraper.enqueue_listing(jobs)
+    finally:
+        jobs.close()
+
+
+def work(
+    queue_path: str,
+    worker_id: str | None = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    max_jobs: int | None = None,
+    headless: bool = True,
+    fetcher: str = "selenium",
+    archive_dir: str | None = None,
+    block_resources: bool = False,
+    allowed_url_patterns: list[str] | None = None,
+    chromedriver_path: str | None = None,
+    offline: bool = False,
+    metrics_path: str | None = None,
+    prometheus_path: str | None = None,
+    max_requests_per_second: float = 0.0,
+    fetch_retries: int = 2,
+    retry_backoff_seconds: float = 2.0,
+    recycle_after_pages: int = 200,
+    recycle_rss_mb: float = 1536.0,
+) -> dict[str, Any]:
+    scraper = TixcraftPrecisionFieldScraper(
+        ScraperConfig(
+            headless=headless,
+            fetcher=fetcher,
+            archive_dir=Path(archive_dir) if archive_dir else None,
+            block_resources=block_resources,
+            allowed_url_patterns=(*DEFAULT_ALLOWED_URL_PATTERNS, *(allowed_url_patterns or ())),
+            chromedriver_path=Path(chromedriver_path) if chromedriver_path else None,
+            offline=offline,
+            metrics_path=Path(metrics_path) if metrics_path else None,
+            prometheus_path=Path(prometheus_path) if prometheus_path else None,
+            max_requests_per_second=max_requests_per_second,
+            fetch_retries=fetch_retries,
+            retry_backoff_seconds=retry_backoff_seconds,
+            recycle_after_pages=recycle_after_pages,
+            recycle_rss_mb=recycle_rss_mb,
+        )
+    )
+    jobs = WorkQueue(queue_path, max_attempts=max_attempts)
+    try:
+        return scraper.run_worker(jobs, worker_id or default_worker_id(), lease_seconds, max_jobs)
+    finally:
+        jobs.close()
+
+
 if __name__ == "__main__":
     main()
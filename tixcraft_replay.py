@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator
+
+from tixcraft_output import build_logger, write_output
+from tixcraft_parser import parse_payload, parse_payload_batch
+from tixcraft_payload_archive import PayloadArchive
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+
+DEFAULT_PARSE_BATCH_SIZE = 200
+STREAM_PROGRESS_EVERY = 10000
+MAX_REPORTED_SKIPPED_LINES = 100
+
+
+def build_parse_executor(workers: int) -> ProcessPoolExecutor:
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def resolve_parse_workers(parse_workers: int) -> int:
+    return parse_workers if parse_workers > 0 else os.cpu_count() or 1
+
+
+def replay(
+    archive_dir: str,
+    output_path: str = "tixcraft_activities.json",
+    run_id: str | None = None,
+    parse_workers: int = 1,
+    sqlite_path: str | None = None,
+    changes_path: str | None = None,
+) -> dict[str, Any]:
+    parse_workers = resolve_parse_workers(parse_workers)
+    logger = build_logger()
+    archive = PayloadArchive(archive_dir)
+    items = list(archive.iter_run(run_id))
+    urls = [url for url, _ in items]
+    payloads = [payload for _, payload in items]
+    if parse_workers > 1 and len(items) > 1:
+        with build_parse_executor(parse_workers) as executor:
+            chunksize = max(1, len(items) // (parse_workers * 4))
+            records = list(executor.map(parse_payload, urls, payloads, chunksize=chunksize))
+    else:
+        records = list(map(parse_payload, urls, payloads))
+    result = write_output(
+        Path(output_path),
+        records,
+        sqlite_path=Path(sqlite_path) if sqlite_path else None,
+        logger=logger,
+        changes_path=Path(changes_path) if changes_path else None,
+    )
+    logger.info("Replayed %s archived payloads from %s into %s", len(records), archive_dir, output_path)
+    return result
+
+
+def _payload_entry(line: str) -> tuple[str, dict[str, Any]] | None:
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("payload"), dict):
+        return None
+    url = entry.get("url") or entry.get("event_link")
+    return (url, entry["payload"]) if url else None
+
+
+def iter_payload_lines(
+    lines: Iterable[str],
+    stats: dict[str, Any],
+    logger: logging.Logger,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        item = _payload_entry(line)
+        if item is not None:
+            yield item
+            continue
+        stats["skipped"] += 1
+        if len(stats["skipped_lines"]) < MAX_REPORTED_SKIPPED_LINES:
+            stats["skipped_lines"].append(line_number)
+        logger.warning("Skipping input line %s: expected a JSON object with url and payload", line_number)
+
+
+def iter_batches(items: Iterable[tuple[str, dict[str, Any]]], size: int) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def iter_parsed_batches(
+    batches: Iterable[list[tuple[str, dict[str, Any]]]],
+    parse_workers: int,
+) -> Iterator[list[dict[str, Any]]]:
+    if parse_workers <= 1:
+        yield from map(parse_payload_batch, batches)
+        return
+
+    with build_parse_executor(parse_workers) as executor:
+        in_flight: deque[Future[list[dict[str, Any]]]] = deque()
+        for batch in batches:
+            in_flight.append(executor.submit(parse_payload_batch, batch))
+            if len(in_flight) >= parse_workers * 2:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def _write_records(handle: IO[str], records: Iterable[dict[str, Any]]) -> None:
+    for record in records:
+        handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def parse_stream(
+    input_path: str = "-",
+    output_path: str = "-",
+    parse_workers: int = 1,
+    batch_size: int = DEFAULT_PARSE_BATCH_SIZE,
+) -> dict[str, Any]:
+    parse_workers = resolve_parse_workers(parse_workers)
+    logger = build_logger()
+    started = time.perf_counter()
+    stats: dict[str, Any] = {"parsed": 0, "skipped": 0, "skipped_lines": []}
+
+    source = sys.stdin if input_path == "-" else open(input_path, encoding="utf-8")
+    target_path = None if output_path == "-" else Path(output_path)
+    temp_path = None
+    if target_path is None:
+        target = sys.stdout
+    else:
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        target = temp_path.open("w", encoding="utf-8")
+    try:
+        items = iter_payload_lines(source, stats, logger)
+        for records in iter_parsed_batches(iter_batches(items, max(1, batch_size)), parse_workers):
+            _write_records(target, records)
+            previous = stats["parsed"]
+            stats["parsed"] += len(records)
+            if stats["parsed"] // STREAM_PROGRESS_EVERY > previous // STREAM_PROGRESS_EVERY:
+                logger.info("Parsed %s payloads", stats["parsed"])
+        target.flush()
+        if temp_path is not None:
+            os.fsync(target.fileno())
+            target.close()
+            os.replace(temp_path, target_path)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if temp_path is not None:
+            target.close()
+            if temp_path.exists():
+                temp_path.unlink()
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "Parsed %s payloads from %s into %s in %.2fs (%s skipped)",
+        stats["parsed"],
+        input_path,
+        output_path,
+        elapsed,
+        stats["skipped"],
+    )
+    return {
+        **stats,
+        "seconds": round(elapsed, 3),
+        "pages_per_second": round(stats["parsed"] / elapsed, 1) if elapsed else None,
+    }
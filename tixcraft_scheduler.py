@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections import deque
+from datetime import datetime
+from typing import Any
+
+from tixcraft_event_store import parse_datetimes, sale_datetimes
+
+
+SALE_REFRESH_TIERS = (
+    (3600.0, 120.0),
+    (6 * 3600.0, 600.0),
+    (48 * 3600.0, 3600.0),
+    (7 * 24 * 3600.0, 6 * 3600.0),
+)
+IDLE_REFRESH_SECONDS = 24 * 3600.0
+SALE_GRACE_SECONDS = 3600.0
+EVENT_RETIRE_SECONDS = 24 * 3600.0
+RETRY_DELAY_SECONDS = 600.0
+BUDGET_WINDOW_SECONDS = 3600.0
+DEFAULT_REQUESTS_PER_HOUR = 120
+DEFAULT_LISTING_INTERVAL_SECONDS = 1800.0
+
+
+def next_sale_start(record: dict[str, Any], now: datetime) -> datetime | None:
+    upcoming = [
+        moment
+        for moment in sale_datetimes(record, now)
+        if (moment - now).total_seconds() >= -SALE_GRACE_SECONDS
+    ]
+    return min(upcoming) if upcoming else None
+
+
+def event_is_over(record: dict[str, Any], now: datetime) -> bool:
+    moments = parse_datetimes(record.get("event_time"), now)
+    return bool(moments) and (now - max(moments)).total_seconds() > EVENT_RETIRE_SECONDS
+
+
+def refresh_interval(record: dict[str, Any], now: datetime) -> float:
+    sale_start = next_sale_start(record, now)
+    if sale_start is None:
+        return IDLE_REFRESH_SECONDS
+    lead_seconds = (sale_start - now).total_seconds()
+    for horizon, interval in SALE_REFRESH_TIERS:
+        if lead_seconds <= horizon:
+            return interval
+    return IDLE_REFRESH_SECONDS
+
+
+class RescrapeScheduler:
+    def __init__(
+        self,
+        requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR,
+        listing_interval_seconds: float = DEFAULT_LISTING_INTERVAL_SECONDS,
+    ):
+        self.requests_per_hour = max(1, requests_per_hour)
+        self.listing_interval_seconds = listing_interval_seconds
+        self.listing_due = 0.0
+        self.intervals: dict[str, float] = {}
+        self._versions: dict[str, int] = {}
+        self._waiting: list[tuple[float, int, str]] = []
+        self._ready: list[tuple[float, float, int, str]] = []
+        self._sequence = itertools.count()
+        self._spent: deque[float] = deque()
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def _push(self, url: str, due: float, interval: float) -> None:
+        version = next(self._sequence)
+        self._versions[url] = version
+        self.intervals[url] = interval
+        heapq.heappush(self._waiting, (due, version, url))
+
+    def plan(self, url: str, record: dict[str, Any] | None, fetched_at: float | None, now: float) -> float | None:
+        if record is None or fetched_at is None:
+            self._push(url, now, 0.0)
+            return now
+
+        moment = datetime.fromtimestamp(now)
+        if event_is_over(record, moment):
+            self.retire(url)
+            return None
+
+        interval = refresh_interval(record, moment)
+        due = fetched_at + interval
+        sale_start = next_sale_start(record, moment)
+        if sale_start is not None and fetched_at < sale_start.timestamp() < due:
+            due = sale_start.timestamp()
+        self._push(url, due, interval)
+        return due
+
+    def defer(self, url: str, now: float) -> float:
+        due = now + RETRY_DELAY_SECONDS
+        self._push(url, due, self.intervals.get(url) or RETRY_DELAY_SECONDS)
+        return due
+
+    def retire(self, url: str) -> None:
+        self._versions.pop(url, None)
+        self.intervals.pop(url, None)
+
+    def sync_links(
+        self,
+        links: list[str],
+        records: dict[str, dict[str, Any]],
+        state: dict[str, dict[str, Any]],
+        now: float,
+    ) -> list[str]:
+        current = set(links)
+        for url in [url for url in self._versions if url not in current]:
+            self.retire(url)
+        added = [url for url in links if url not in self._versions]
+        for url in added:
+            self.plan(url, records.get(url), state.get(url, {}).get("fetched_at"), now)
+        return added
+
+    def _promote(self, now: float) -> None:
+        while self._waiting and self._waiting[0][0] <= now:
+            due, version, url = heapq.heappop(self._waiting)
+            if self._versions.get(url) == version:
+                heapq.heappush(self._ready, (self.intervals[url], due, version, url))
+
+    def pop_due(self, now: float) -> str | None:
+        self._promote(now)
+        while self._ready:
+            _, _, version, url = heapq.heappop(self._ready)
+            if self._versions.get(url) == version:
+                del self._versions[url]
+                return url
+        return None
+
+    def next_due_at(self) -> float | None:
+        while self._ready and self._versions.get(self._ready[0][3]) != self._ready[0][2]:
+            heapq.heappop(self._ready)
+        while self._waiting and self._versions.get(self._waiting[0][2]) != self._waiting[0][1]:
+            heapq.heappop(self._waiting)
+        if self._ready:
+            return self._ready[0][1]
+        return self._waiting[0][0] if self._waiting else None
+
+    def listing_is_due(self, now: float) -> bool:
+        return now >= self.listing_due
+
+    def listing_fetched(self, now: float) -> None:
+        self.listing_due = now + self.listing_interval_seconds
+
+    def listing_failed(self, now: float) -> float:
+        self.listing_due = now + min(RETRY_DELAY_SECONDS, self.listing_interval_seconds)
+        return self.listing_due
+
+    def budget_wait(self, now: float) -> float:
+        while self._spent and self._spent[0] <= now - BUDGET_WINDOW_SECONDS:
+            self._spent.popleft()
+        if len(self._spent) < self.requests_per_hour:
+            return 0.0
+        return self._spent[0] + BUDGET_WINDOW_SECONDS - now
+
+    def spend(self, now: float) -> None:
+        self._spent.append(now)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Iterable
+
+from tixcraft_output import LOGGER_NAME, write_output
+
+
+def shard_of(url: str, count: int) -> int:
+    if count <= 1:
+        return 0
+    return int.from_bytes(hashlib.sha1(url.encode("utf-8")).digest()[:8], "big") % count
+
+
+def select_shard(links: Iterable[str], index: int, count: int) -> list[str]:
+    return [link for link in links if shard_of(link, count) == index]
+
+
+def shard_metadata(index: int, count: int, listing: list[str]) -> dict[str, Any]:
+    return {"index": index, "count": count, "listing": listing}
+
+
+def _load_shard(path: Path) -> dict[str, Any]:
+    output = json.loads(path.read_text(encoding="utf-8"))
+    shard = output.get("shard")
+    if not isinstance(shard, dict) or not isinstance(shard.get("listing"), list):
+        raise ValueError(f"{path} has no shard metadata; was it written with --shard?")
+    return output
+
+
+def merge_shards(
+    paths: list[Path],
+    output_path: Path,
+    sqlite_path: Path | None = None,
+    allow_partial: bool = False,
+    logger: logging.Logger | None = None,
+    changes_path: Path | None = None,
+) -> dict[str, Any]:
+    logger = logger or logging.getLogger(LOGGER_NAME)
+    outputs = sorted((_load_shard(path) for path in paths), key=lambda output: output["shard"]["index"])
+    counts = {output["shard"]["count"] for output in outputs}
+    if len(counts) != 1:
+        raise ValueError(f"Shard outputs disagree on the shard count: {sorted(counts)}")
+    count = counts.pop()
+    indexes = [output["shard"]["index"] for output in outputs]
+    if len(set(indexes)) != len(indexes):
+        raise ValueError(f"Duplicate shard outputs: {indexes}")
+    missing = sorted(set(range(count)) - set(indexes))
+    if missing and not allow_partial:
+        raise ValueError(f"Missing shard outputs for {', '.join(f'{index}/{count}' for index in missing)}")
+
+    order = list(dict.fromkeys(link for output in outputs for link in output["shard"]["listing"]))
+    records: dict[str, dict[str, Any]] = {}
+    failures: dict[str, dict[str, Any]] = {}
+    for output in outputs:
+        for record in output.get("events", []):
+            records.setdefault(record["event_link"], record)
+        for failure in output.get("failures", []):
+            failures.setdefault(failure["event_link"], failure)
+    positions = {link: position for position, link in enumerate(order)}
+    records_in_order = sorted(records, key=lambda link: positions.get(link, len(positions)))
+    failures_in_order = sorted(failures, key=lambda link: positions.get(link, len(positions)))
+
+    result = write_output(
+        output_path,
+        [records[link] for link in records_in_order],
+        [failures[link] for link in failures_in_order],
+        sqlite_path=sqlite_path,
+        logger=logger,
+        changes_path=changes_path,
+    )
+    logger.info(
+        "Merged %s of %s shard outputs (%s events, %s failures) into %s",
+        len(outputs),
+        count,
+        result["total_events"],
+        len(result["failures"]),
+        output_path,
+    )
+    return {**result, "shards": indexes, "shard_count": count, "missing_shards": missing}
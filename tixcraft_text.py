@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from functools import lru_cache
+
+
+NORMALIZE_CACHE_SIZE = 16384
+TEXT_TRANSLATION = str.maketrans(
+    {
+        "\u00a0": " ",
+        "\u3000": " ",
+        "\ufeff": None,
+        "\u200b": None,
+        "｜": ":",
+        "：": ":",
+        "﹕": ":",
+        "／": "/",
+        "\r": "\n",
+    }
+)
+HORIZONTAL_SPACE_RE = re.compile(r"[ \t]+")
+BLANK_LINES_RE = re.compile(r"\n{2,}")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def clean_text(text: str | None) -> str:
+    if not text:
+        return ""
+    cleaned = HORIZONTAL_SPACE_RE.sub(" ", text.translate(TEXT_TRANSLATION))
+    return BLANK_LINES_RE.sub("\n", cleaned).strip()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def lower_text(text: str | None) -> str:
+    return clean_text(text).lower()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def compact_text(text: str | None) -> str:
+    return WHITESPACE_RE.sub("", clean_text(text))
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def compact_lower(text: str | None) -> str:
+    return compact_text(text).lower()
+
+
+class KeywordIndex:
+    def __init__(self, tables: dict[str, tuple[str, ...]], cache_size: int = NORMALIZE_CACHE_SIZE):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[frozenset[str]] = [frozenset()]
+        for category, keywords in tables.items():
+            for keyword in keywords:
+                self._add(keyword, category)
+        self._link()
+        self.categories = lru_cache(maxsize=cache_size)(self._scan)
+
+    def _add(self, keyword: str, category: str) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(frozenset())
+            state = next_state
+        self._output[state] = self._output[state] | {category}
+
+    def _link(self) -> None:
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0) if state else 0
+                self._output[next_state] = self._output[next_state] | self._output[self._fail[next_state]]
+
+    def _scan(self, text: str) -> frozenset[str]:
+        goto, fail, output = self._goto, self._fail, self._output
+        hits: set[str] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+        return frozenset(hits)
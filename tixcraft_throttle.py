@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from tixcraft_metrics import MetricsRecorder
+
+
+BLOCK_STATUSES = frozenset({403, 429})
+BLOCKED_PAGE_MARKERS = (
+    "access denied",
+    "attention required",
+    "too many requests",
+    "403 forbidden",
+    "just a moment",
+    "請求過於頻繁",
+    "存取被拒",
+)
+OUTCOMES = ("ok", "slow", "error", "timeout", "blocked")
+DEFAULT_LATENCY_TARGET_SECONDS = 10.0
+DEFAULT_BLOCK_COOLDOWN_SECONDS = 30.0
+MAX_BLOCK_COOLDOWN_SECONDS = 600.0
+SLOW_DECREASE_FACTOR = 0.8
+FAILURE_DECREASE_FACTOR = 0.5
+
+
+def looks_blocked(payload: dict[str, Any]) -> bool:
+    if payload.get("title") or payload.get("intro"):
+        return False
+    page_title = str(payload.get("pageTitle") or "").lower()
+    return any(marker in page_title for marker in BLOCKED_PAGE_MARKERS)
+
+
+class PageBlockedError(RuntimeError):
+    pass
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = 1.0):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        wait = max(0.0, self.paused_until - now)
+        if self.rate <= 0:
+            return wait
+        self._refill(now)
+        self.tokens -= 1
+        return max(wait, -self.tokens / self.rate if self.tokens < 0 else 0.0)
+
+    def try_take(self, now: float) -> bool:
+        if now < self.paused_until:
+            return False
+        if self.rate <= 0:
+            return True
+        self._refill(now)
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def pause(self, until: float) -> None:
+        self.paused_until = max(self.paused_until, until)
+
+
+@dataclass
+class ThrottleTicket:
+    url: str
+    started: float = field(default_factory=time.monotonic)
+    outcome: str | None = None
+
+
+class AdaptiveThrottle:
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        adaptive: bool = False,
+        rate: float = 0.0,
+        burst: float = 1.0,
+        latency_target_seconds: float = DEFAULT_LATENCY_TARGET_SECONDS,
+        block_cooldown_seconds: float = DEFAULT_BLOCK_COOLDOWN_SECONDS,
+        timeout_errors: tuple[type[BaseException], ...] = (TimeoutError,),
+        metrics: MetricsRecorder | None = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.adaptive = adaptive
+        self.limit = float(max(self.min_concurrency, self.max_concurrency // 2) if adaptive else self.max_concurrency)
+        self.bucket = TokenBucket(rate, burst)
+        self.latency_target_seconds = latency_target_seconds
+        self.block_cooldown_seconds = block_cooldown_seconds
+        self.timeout_errors = timeout_errors
+        self.metrics = metrics
+        self.in_flight = 0
+        self.counts = {outcome: 0 for outcome in OUTCOMES}
+        self.wait_seconds = 0.0
+        self._cooldown = block_cooldown_seconds
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def acquire(self, url: str) -> ThrottleTicket:
+        started = time.monotonic()
+        with self._condition:
+            while not self._has_slot():
+                self._condition.wait()
+            self.in_flight += 1
+            ticket = ThrottleTicket(url)
+            delay = self.bucket.reserve(time.monotonic())
+        if delay > 0:
+            time.sleep(delay)
+        ticket.started = time.monotonic()
+        with self._condition:
+            self.wait_seconds += ticket.started - started
+        return ticket
+
+    def try_acquire(self, url: str = "") -> ThrottleTicket | None:
+        with self._condition:
+            if not self._has_slot() or not self.bucket.try_take(time.monotonic()):
+                return None
+            self.in_flight += 1
+            return ThrottleTicket(url)
+
+    def cancel(self, ticket: ThrottleTicket) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def classify(self, exc: BaseException) -> str:
+        if getattr(exc, "status", None) in BLOCK_STATUSES or isinstance(exc, PageBlockedError):
+            return "blocked"
+        if isinstance(exc, self.timeout_errors) or isinstance(exc.__cause__, self.timeout_errors):
+            return "timeout"
+        return "error"
+
+    def _decrease(self, ticket: ThrottleTicket, factor: float) -> None:
+        if not self.adaptive or ticket.started < self._last_decrease:
+            return
+        self.limit = max(float(self.min_concurrency), self.limit * factor)
+        self._last_decrease = time.monotonic()
+
+    def release(self, ticket: ThrottleTicket, outcome: str = "ok") -> None:
+        latency = time.monotonic() - ticket.started
+        if outcome == "ok" and latency > self.latency_target_seconds:
+            outcome = "slow"
+        ticket.outcome = outcome
+        with self._condition:
+            self.in_flight -= 1
+            self.counts[outcome] += 1
+            if outcome == "ok":
+                self._cooldown = self.block_cooldown_seconds
+                if self.adaptive:
+                    self.limit = min(float(self.max_concurrency), self.limit + 1 / max(1.0, self.limit))
+            elif outcome == "slow":
+                self._decrease(ticket, SLOW_DECREASE_FACTOR)
+            else:
+                self._decrease(ticket, FAILURE_DECREASE_FACTOR)
+            if outcome == "blocked":
+                self.bucket.pause(time.monotonic() + self._cooldown)
+                self._cooldown = min(MAX_BLOCK_COOLDOWN_SECONDS, self._cooldown * 2)
+            self._condition.notify_all()
+            state = self.state()
+        if self.metrics is not None:
+            self.metrics.record_throttle(ticket.url, outcome, latency, state)
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[ThrottleTicket]:
+        ticket = self.acquire(url)
+        try:
+            yield ticket
+        except BaseException as exc:
+            self.release(ticket, self.classify(exc))
+            raise
+        self.release(ticket, ticket.outcome or "ok")
+
+    def state(self) -> dict[str, Any]:
+        return {
+            "concurrency_limit": int(self.limit),
+            "concurrency_max": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "rate_limit_per_second": self.bucket.rate,
+            "latency_target_seconds": self.latency_target_seconds,
+            "wait_seconds_total": round(self.wait_seconds, 3),
+            **{f"{outcome}_total": count for outcome, count in self.counts.items()},
+        }
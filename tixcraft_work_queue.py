@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from tixcraft_output import LOGGER_NAME, write_output
+
+
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+JOB_STATUSES = ("pending", "leased", "done", "failed")
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    event_link TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    run_id TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL,
+    record TEXT,
+    failure TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, position);
+"""
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    def __init__(self, path: Path | str, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max(1, max_attempts)
+        self.connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(jobs)")}
+        if "run_id" not in columns:
+            self.connection.execute("ALTER TABLE jobs ADD COLUMN run_id TEXT")
+
+    def _transaction(self) -> sqlite3.Connection:
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def enqueue(self, links: list[str], now: float | None = None, run_id: str | None = None) -> dict[str, int]:
+        now = time.time() if now is None else now
+        connection = self._transaction()
+        try:
+            known = {row["event_link"] for row in connection.execute("SELECT event_link FROM jobs")}
+            connection.executemany(
+                """
+                INSERT INTO jobs (event_link, position, run_id, enqueued_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (event_link) DO UPDATE SET
+                    position = excluded.position,
+                    run_id = excluded.run_id,
+                    status = 'pending',
+                    attempts = 0,
+                    lease_owner = NULL,
+                    lease_expires = NULL,
+                    enqueued_at = excluded.enqueued_at,
+                    failure = NULL
+                """,
+                [(link, position, run_id, now) for position, link in enumerate(links)],
+            )
+            removed = known - set(links)
+            connection.executemany("DELETE FROM jobs WHERE event_link = ?", [(link,) for link in removed])
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return {"enqueued": len(links), "added": len(set(links) - known), "removed": len(removed)}
+
+    def _expire_leases(self, connection: sqlite3.Connection, now: float) -> None:
+        expired = connection.execute(
+            "SELECT event_link, attempts FROM jobs WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+            (now, self.max_attempts),
+        ).fetchall()
+        failed_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        connection.executemany(
+            """
+            UPDATE jobs SET status = 'failed', failure = ?, finished_at = ?, lease_owner = NULL, lease_expires = NULL
+            WHERE event_link = ?
+            """,
+            [
+                (
+                    json.dumps(
+                        {
+                            "event_link": row["event_link"],
+                            "error_type": "LeaseExpired",
+                            "error": "lease expired before the worker reported a result",
+                            "attempts": row["attempts"],
+                            "failed_at": failed_at,
+                        },
+                        ensure_ascii=False,
+                    ),
+                    now,
+                    row["event_link"],
+                )
+                for row in expired
+            ],
+        )
+
+    def claim(
+        self,
+        owner: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        now: float | None = None,
+    ) -> dict[str, Any] | None:
+        now = time.time() if now is None else now
+        connection = self._transaction()
+        try:
+            self._expire_leases(connection, now)
+            row = connection.execute(
+                """
+                SELECT event_link, position, run_id, attempts FROM jobs
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)
+                ORDER BY position LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    """
+                    UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1
+                    WHERE event_link = ?
+                    """,
+                    (owner, now + lease_seconds, row["event_link"]),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        return {
+            "event_link": row["event_link"],
+            "position": row["position"],
+            "run_id": row["run_id"],
+            "attempt": row["attempts"] + 1,
+        }
+
+    def _finish(self, link: str, owner: str, status: str, column: str, value: dict[str, Any]) -> bool:
+        cursor = self.connection.execute(
+            f"""
+            UPDATE jobs SET status = ?, {column} = ?, finished_at = ?, lease_owner = NULL, lease_expires = NULL
+            WHERE event_link = ? AND status = 'leased' AND lease_owner = ?
+            """,
+            (status, json.dumps(value, ensure_ascii=False), time.time(), link, owner),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, link: str, owner: str, record: dict[str, Any]) -> bool:
+        return self._finish(link, owner, "done", "record", record)
+
+    def fail(self, link: str, owner: str, failure: dict[str, Any]) -> bool:
+        return self._finish(link, owner, "failed", "failure", failure)
+
+    def counts(self, now: float | None = None) -> dict[str, int]:
+        now = time.time() if now is None else now
+        counts = {status: 0 for status in JOB_STATUSES}
+        for row in self.connection.execute("SELECT status, COUNT(*) AS total FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["total"]
+        counts["expired"] = self.connection.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status = 'leased' AND lease_expires < ?",
+            (now,),
+        ).fetchone()[0]
+        return counts
+
+    def results(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        records: list[dict[str, Any]] = []
+        failures: list[dict[str, Any]] = []
+        for row in self.connection.execute("SELECT status, record, failure FROM jobs ORDER BY position"):
+            if row["record"]:
+                records.append(json.loads(row["record"]))
+            if row["status"] == "failed" and row["failure"]:
+                failures.append(json.loads(row["failure"]))
+        return records, failures
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def collect(
+    queue_path: Path,
+    output_path: Path,
+    sqlite_path: Path | None = None,
+    logger: logging.Logger | None = None,
+    changes_path: Path | None = None,
+) -> dict[str, Any]:
+    logger = logger or logging.getLogger(LOGGER_NAME)
+    jobs = WorkQueue(queue_path)
+    try:
+        counts = jobs.counts()
+        records, failures = jobs.results()
+    finally:
+        jobs.close()
+    result = write_output(
+        output_path,
+        records,
+        failures,
+        sqlite_path=sqlite_path,
+        logger=logger,
+        changes_path=changes_path,
+    )
+    logger.info(
+        "Collected %s events and %s failures from %s into %s (%s jobs still pending or leased)",
+        len(records),
+        len(failures),
+        queue_path,
+        output_path,
+        counts["pending"] + counts["leased"],
+    )
+    return {**result, "jobs": counts}